@@ -4,12 +4,16 @@ writing command line scripts fun. Unlike other modules, it's based
 around a simple API that does not come with too much magic and is
 composable.
 """
+import sys
+import typing as t
+
 from .core import Argument as Argument
 from .core import BaseCommand as BaseCommand
 from .core import Command as Command
 from .core import CommandCollection as CommandCollection
 from .core import Context as Context
 from .core import Group as Group
+from .core import LazyGroup as LazyGroup
 from .core import MultiCommand as MultiCommand
 from .core import Option as Option
 from .core import Parameter as Parameter
@@ -37,18 +41,6 @@ from .formatting import HelpFormatter as HelpFormatter
 from .formatting import wrap_text as wrap_text
 from .globals import get_current_context as get_current_context
 from .parser import OptionParser as OptionParser
-from .termui import clear as clear
-from .termui import confirm as confirm
-from .termui import echo_via_pager as echo_via_pager
-from .termui import edit as edit
-from .termui import getchar as getchar
-from .termui import launch as launch
-from .termui import pause as pause
-from .termui import progressbar as progressbar
-from .termui import prompt as prompt
-from .termui import secho as secho
-from .termui import style as style
-from .termui import unstyle as unstyle
 from .types import BOOL as BOOL
 from .types import Choice as Choice
 from .types import DateTime as DateTime
@@ -57,12 +49,14 @@ from .types import FLOAT as FLOAT
 from .types import FloatRange as FloatRange
 from .types import INT as INT
 from .types import IntRange as IntRange
+from .types import MappedFile as MappedFile
 from .types import ParamType as ParamType
 from .types import Path as Path
 from .types import STRING as STRING
 from .types import Tuple as Tuple
 from .types import UNPROCESSED as UNPROCESSED
 from .types import UUID as UUID
+from .utils import copy_stream as copy_stream
 from .utils import echo as echo
 from .utils import format_filename as format_filename
 from .utils import get_app_dir as get_app_dir
@@ -70,4 +64,55 @@ from .utils import get_binary_stream as get_binary_stream
 from .utils import get_text_stream as get_text_stream
 from .utils import open_file as open_file
 
+if t.TYPE_CHECKING:
+    from .termui import clear as clear
+    from .termui import confirm as confirm
+    from .termui import echo_via_pager as echo_via_pager
+    from .termui import edit as edit
+    from .termui import getchar as getchar
+    from .termui import launch as launch
+    from .termui import pause as pause
+    from .termui import progressbar as progressbar
+    from .termui import prompt as prompt
+    from .termui import secho as secho
+    from .termui import Style as Style
+    from .termui import style as style
+    from .termui import unstyle as unstyle
+
 __version__ = "8.1.7"
+
+# The terminal UI helpers pull in more of the standard library than
+# parsing does. They are imported on first access instead.
+_lazy_termui = frozenset(
+    (
+        "clear",
+        "confirm",
+        "echo_via_pager",
+        "edit",
+        "getchar",
+        "launch",
+        "pause",
+        "progressbar",
+        "prompt",
+        "secho",
+        "Style",
+        "style",
+        "unstyle",
+    )
+)
+
+
+def __getattr__(name: str) -> t.Any:
+    if name in _lazy_termui:
+        from . import termui
+
+        value = getattr(termui, name)
+        # The click.globals submodule shadows the globals() builtin here.
+        sys.modules[__name__].__dict__[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> t.List[str]:
+    return sorted({*sys.modules[__name__].__dict__, *_lazy_termui})
@@ -5,6 +5,7 @@ import re
 import sys
 import typing as t
 from functools import update_wrapper
+from types import TracebackType
 from weakref import WeakKeyDictionary
 
 CYGWIN = sys.platform.startswith('cygwin')
@@ -65,11 +66,26 @@ def _is_compatible_text_stream(stream: t.TextIO, encoding: t.Optional[str], erro
     """
     return _is_compat_stream_attr(stream, 'encoding', encoding) and _is_compat_stream_attr(stream, 'errors', errors)
 
-def _wrap_io_open(file: t.Union[str, 'os.PathLike[str]', int], mode: str, encoding: t.Optional[str], errors: t.Optional[str]) -> t.IO[t.Any]:
+def _wrap_io_open(file: t.Union[str, 'os.PathLike[str]', int], mode: str, encoding: t.Optional[str], errors: t.Optional[str], buffering: int=-1) -> t.IO[t.Any]:
     """Handles not passing ``encoding`` and ``errors`` in binary mode."""
     if 'b' in mode:
-        return open(file, mode)
-    return open(file, mode, encoding=encoding, errors=errors)
+        return open(file, mode, buffering)
+    return open(file, mode, buffering, encoding=encoding, errors=errors)
+
+def _rebuffer_binary_stream(stream: t.BinaryIO, mode: str, buffer_size: int) -> t.BinaryIO:
+    """Open a new buffered stream with the given buffer size over the
+    file descriptor of a standard stream. The descriptor is not closed
+    when the new stream is closed. Returns the stream unchanged if it
+    doesn't have a file descriptor.
+    """
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        return stream
+    if any((m in mode for m in ['w', 'a', 'x'])):
+        stream.flush()
+        return t.cast(t.BinaryIO, open(fd, 'wb', buffer_size, closefd=False))
+    return t.cast(t.BinaryIO, open(fd, 'rb', buffer_size, closefd=False))
 
 def _find_binary_reader(stream: t.IO[t.Any]) -> t.BinaryIO:
     """Find a binary reader for the given stream."""
@@ -89,18 +105,235 @@ def _find_binary_writer(stream: t.IO[t.Any]) -> t.BinaryIO:
         return t.cast(t.BinaryIO, buffer)
     return t.cast(t.BinaryIO, stream)
 
-def open_stream(filename: t.Union[str, 'os.PathLike[str]', int], mode: str='r', encoding: t.Optional[str]=None, errors: t.Optional[str]='strict', atomic: bool=False) -> t.Tuple[t.IO[t.Any], bool]:
-    """Open a file or stream."""
+def open_stream(filename: t.Union[str, 'os.PathLike[str]', int], mode: str='r', encoding: t.Optional[str]=None, errors: t.Optional[str]='strict', atomic: bool=False, buffer_size: t.Optional[int]=None, fsync: str='none', preallocate: t.Optional[int]=None, compression: t.Optional[str]=None) -> t.Tuple[t.IO[t.Any], bool]:
+    """Open a file or stream.
+
+    :param buffer_size: The size of the buffer to read or write the file
+        with. A binary standard stream is reopened with this buffer
+        size. Uses Python's default if not given.
+    :param fsync: With ``atomic``, flush the data to disk before
+        replacing the file. ``'none'`` doesn't sync, ``'file'`` syncs
+        the file's data, and ``'dir'`` also syncs the directory so the
+        rename is durable.
+    :param preallocate: With ``atomic``, reserve this many bytes for the
+        file when it is created, if the platform supports it. The file
+        is truncated to the written size when it is closed.
+    :param compression: Read or write the file through a compression
+        codec: ``'gzip'``, ``'bz2'``, ``'xz'``, or ``'zstd'``. ``'auto'``
+        detects the codec from the file's first bytes when reading, and
+        from the file extension otherwise.
+
+    .. versionchanged:: 8.2.0
+        Added the ``buffer_size``, ``fsync``, ``preallocate``, and
+        ``compression`` parameters.
+    """
     if isinstance(filename, int):
         if 'w' in mode:
             return _find_binary_writer(sys.stdout), False
         return _find_binary_reader(sys.stdin), False
+    if compression is not None:
+        return _open_compressed(filename, mode, encoding, errors, compression, atomic=atomic, buffer_size=buffer_size, fsync=fsync, preallocate=preallocate)
+    binary = 'b' in mode
+    filename = os.fspath(filename)
+    if os.fsdecode(filename) == '-':
+        if any((m in mode for m in ['w', 'a', 'x'])):
+            if binary:
+                rv = get_binary_stdout()
+            else:
+                return get_text_stdout(encoding=encoding, errors=errors), False
+        elif binary:
+            rv = get_binary_stdin()
+        else:
+            return get_text_stdin(encoding=encoding, errors=errors), False
+        if buffer_size is not None:
+            rv = _rebuffer_binary_stream(rv, mode, buffer_size)
+        return rv, False
+    buffering = -1 if buffer_size is None else buffer_size
+    if not binary:
+        encoding = encoding or _get_argv_encoding()
+    if not atomic:
+        return _wrap_io_open(filename, mode, encoding, errors, buffering), True
+    if 'a' in mode:
+        raise ValueError("Appending to an existing file is not supported, because that would involve an expensive `copy`-operation to a temporary file. Open the file in normal `w`-mode and copy explicitly if that's what you're after.")
+    if 'x' in mode:
+        raise ValueError('Use the `overwrite`-parameter instead.')
+    if 'w' not in mode:
+        raise ValueError('Atomic writes only make sense with `w`-mode.')
+    if fsync not in ('none', 'file', 'dir'):
+        raise ValueError("'fsync' must be 'none', 'file', or 'dir'.")
+    import errno
+    try:
+        perm: t.Optional[int] = os.stat(filename).st_mode
+    except OSError:
+        perm = None
+    real_filename = os.path.realpath(filename)
+    tmp_filename: t.Optional[str] = None
+    fd = _open_unnamed_file(os.path.dirname(real_filename), 438 if perm is None else perm)
+    if fd is None:
+        flags = os.O_RDWR | os.O_CREAT | os.O_EXCL
+        if binary:
+            flags |= getattr(os, 'O_BINARY', 0)
+        while True:
+            tmp_filename = _make_tmp_filename(os.path.dirname(filename))
+            try:
+                fd = os.open(tmp_filename, flags, 438 if perm is None else perm)
+                break
+            except OSError as e:
+                if e.errno == errno.EEXIST or (os.name == 'nt' and e.errno == errno.EACCES and os.path.isdir(e.filename) and os.access(e.filename, os.W_OK)):
+                    continue
+                raise
+    if perm is not None:
+        if tmp_filename is None:
+            os.fchmod(fd, perm)
+        else:
+            os.chmod(tmp_filename, perm)
+    preallocated = False
+    if preallocate and hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(fd, 0, preallocate)
+            preallocated = True
+        except OSError:
+            pass
+    f = _wrap_io_open(fd, mode, encoding, errors, buffering)
+    af = _AtomicFile(f, tmp_filename, real_filename, fsync=fsync, truncate=preallocated)
+    return t.cast(t.IO[t.Any], af), True
+
+_compression_extensions = {'.gz': 'gzip', '.gzip': 'gzip', '.bz2': 'bz2', '.xz': 'xz', '.lzma': 'xz', '.zst': 'zstd', '.zstd': 'zstd'}
+_compression_magic = [(b'\x1f\x8b', 'gzip'), (b'BZh', 'bz2'), (b'\xfd7zXZ\x00', 'xz'), (b'(\xb5/\xfd', 'zstd')]
+
+def _open_compressed(filename: t.Union[str, 'os.PathLike[str]'], mode: str, encoding: t.Optional[str], errors: t.Optional[str], compression: str, **kwargs: t.Any) -> t.Tuple[t.IO[t.Any], bool]:
+    """Open a file or standard stream in binary mode, and wrap it in
+    a decompressor or compressor. If ``compression`` is ``'auto'`` and
+    no codec is detected, the file is opened as if no compression was
+    given.
+    """
+    if compression != 'auto' and compression not in _compression_extensions.values():
+        raise ValueError(f"Unknown compression '{compression}'.")
+    if '+' in mode:
+        raise ValueError('Compressed files cannot be opened for reading and writing.')
+    reading = 'r' in mode
+    name: t.Optional[str] = compression
+    if compression == 'auto' and (not reading):
+        name = _compression_extensions.get(os.path.splitext(os.fsdecode(filename))[1].lower())
+        if name is None:
+            return open_stream(filename, mode, encoding, errors, **kwargs)
+    binary_mode = mode.replace('t', '').replace('b', '') + 'b'
+    raw, should_close = open_stream(filename, binary_mode, **kwargs)
+    source = raw
+    if name == 'auto':
+        if not hasattr(raw, 'peek'):
+            source = t.cast(t.IO[t.Any], io.BufferedReader(_UnclosedReader(raw)))
+        name = _detect_compression(source)
+        if name is None:
+            if source is not raw:
+                if 'b' not in mode:
+                    source = io.TextIOWrapper(source, encoding or _get_argv_encoding(), errors)
+                return (t.cast(t.IO[t.Any], _CompressedFile(source, raw, should_close)), True)
+            if 'b' in mode:
+                return (raw, should_close)
+            if not should_close:
+                return open_stream(filename, mode, encoding, errors)
+            return (io.TextIOWrapper(raw, encoding or _get_argv_encoding(), errors), True)
+    try:
+        codec = _open_codec(name, source, binary_mode)
+    except BaseException:
+        if should_close:
+            raw.close()
+        raise
+    if 'b' not in mode:
+        codec = io.TextIOWrapper(codec, encoding or _get_argv_encoding(), errors)
+    return (t.cast(t.IO[t.Any], _CompressedFile(codec, raw, should_close)), True)
+
+def _detect_compression(raw: t.IO[t.Any]) -> t.Optional[str]:
+    """Detect the codec of a stream being read from its magic bytes,
+    without consuming them. The stream must support ``peek``.
+    """
+    head = raw.peek(6)
+    for magic, name in _compression_magic:
+        if head.startswith(magic):
+            return name
+    return None
+
+class _UnclosedReader(io.RawIOBase):
+    """Adapts a binary stream that can't be peeked, such as a
+    :class:`io.BytesIO` standing in for ``stdin``, so that it can be
+    wrapped in a :class:`io.BufferedReader`. Closing the adapter leaves
+    the stream open.
+    """
 
-    if 'b' in mode:
-        return _wrap_io_open(filename, mode, None, None), True
+    def __init__(self, raw: t.IO[t.Any]) -> None:
+        self._raw = raw
 
-    encoding = encoding or _get_argv_encoding()
-    return _wrap_io_open(filename, mode, encoding, errors), True
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: t.Any) -> int:
+        data = self._raw.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+def _open_codec(name: str, raw: t.IO[t.Any], mode: str) -> t.IO[t.Any]:
+    """Wrap a binary stream with a codec. The codec modules are only
+    imported when they are used.
+    """
+    if name == 'gzip':
+        import gzip
+        return t.cast(t.IO[t.Any], gzip.GzipFile(fileobj=raw, mode=mode))
+    if name == 'bz2':
+        import bz2
+        return t.cast(t.IO[t.Any], bz2.BZ2File(raw, mode))
+    if name == 'xz':
+        import lzma
+        return t.cast(t.IO[t.Any], lzma.LZMAFile(raw, mode))
+    try:
+        from compression import zstd
+    except ImportError:
+        pass
+    else:
+        return t.cast(t.IO[t.Any], zstd.ZstdFile(raw, mode))
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError("Using zstd compressed files requires Python 3.14 or the 'zstandard' library.") from None
+    return t.cast(t.IO[t.Any], zstandard.open(raw, mode, closefd=False))
+
+def _make_tmp_filename(dirname: str) -> str:
+    import random
+    return os.path.join(dirname, f'.__atomic-write{random.randrange(1 << 32):08x}')
+
+def _open_unnamed_file(dirname: str, perm: int) -> t.Optional[int]:
+    """Open an unnamed file in a directory with ``O_TMPFILE``. It only
+    gets a name when the atomic file is closed, so nothing is left
+    behind if the process dies while writing. Returns ``None`` if the
+    platform or file system doesn't support it, or if the file can't be
+    reached through ``/proc`` to link it later.
+    """
+    if not hasattr(os, 'O_TMPFILE') or not os.path.isdir('/proc/self/fd'):
+        return None
+    try:
+        fd = os.open(dirname or '.', os.O_TMPFILE | os.O_RDWR, perm)
+    except OSError:
+        return None
+    try:
+        linkable = os.stat(f'/proc/self/fd/{fd}').st_ino == os.fstat(fd).st_ino
+    except OSError:
+        linkable = False
+    if not linkable:
+        os.close(fd)
+        return None
+    return fd
+
+def _fsync_dir(dirname: str) -> None:
+    """Sync a directory so that a rename in it is durable. Directories
+    can't be opened on Windows, where this does nothing.
+    """
+    if os.name == 'nt':
+        return
+    fd = os.open(dirname or '.', os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 def should_strip_ansi(stream: t.Optional[t.IO[t.Any]]=None, color: t.Optional[bool]=None) -> bool:
     """Determine if ANSI escape sequences should be stripped from the output."""
@@ -110,6 +343,8 @@ def should_strip_ansi(stream: t.Optional[t.IO[t.Any]]=None, color: t.Optional[bo
 
 def strip_ansi(value: str) -> str:
     """Strip ANSI escape sequences from a string."""
+    if '\x1b' not in value:
+        return value
     return _ansi_re.sub('', value)
 
 def isatty(stream: t.Optional[t.IO[t.Any]]) -> bool:
@@ -122,19 +357,109 @@ def isatty(stream: t.Optional[t.IO[t.Any]]) -> bool:
         return False
 
 def term_len(x: str) -> int:
-    """Return the length of a string, taking into account ANSI escape sequences."""
-    return len(strip_ansi(x))
+    """Return the number of columns a string takes in a terminal, taking
+    into account ANSI escape sequences, wide East Asian characters and
+    emoji, and zero width characters.
+
+    .. versionchanged:: 8.2.0
+        Count the display width of wide and zero width characters.
+    """
+    if '\x1b' in x:
+        x = strip_ansi(x)
+    if x.isascii():
+        return len(x)
+    from ._wcwidth import str_width
+    return str_width(x)
 
 from ._wrappers import _NonClosingTextIOWrapper
 
 class _AtomicFile:
 
-    def __init__(self, f: t.IO[t.Any], tmp_filename: str, real_filename: str) -> None:
+    def __init__(self, f: t.IO[t.Any], tmp_filename: t.Optional[str], real_filename: str, fsync: str='none', truncate: bool=False) -> None:
         self._f = f
         self._tmp_filename = tmp_filename
         self._real_filename = real_filename
+        self._fsync = fsync
+        self._truncate = truncate
         self.closed = False
 
+    @property
+    def name(self) -> str:
+        return self._real_filename
+
+    def close(self, delete: bool=False) -> None:
+        if self.closed:
+            return
+        if delete:
+            try:
+                self._f.close()
+            finally:
+                if self._tmp_filename is not None and os.path.exists(self._tmp_filename):
+                    os.remove(self._tmp_filename)
+            self.closed = True
+            return
+        try:
+            if self._truncate:
+                self._f.truncate()
+            if self._fsync != 'none':
+                self._f.flush()
+                os.fsync(self._f.fileno())
+            if self._tmp_filename is None:
+                self._tmp_filename = self._link_unnamed_file()
+        finally:
+            self._f.close()
+        os.replace(self._tmp_filename, self._real_filename)
+        self.closed = True
+        if self._fsync == 'dir':
+            _fsync_dir(os.path.dirname(self._real_filename))
+
+    def _link_unnamed_file(self) -> str:
+        """Give the unnamed ``O_TMPFILE`` file a temporary name next to
+        the real file, so it can be renamed over it. Passing a directory
+        descriptor makes :func:`os.link` use ``linkat`` and follow the
+        ``/proc`` link to the file. If the link fails, the data is
+        copied to a named temporary file instead.
+        """
+        self._f.flush()
+        dirname = os.path.dirname(self._real_filename)
+        dir_fd = os.open(dirname or '.', os.O_RDONLY)
+        try:
+            while True:
+                tmp_filename = _make_tmp_filename(dirname)
+                try:
+                    os.link(f'/proc/self/fd/{self._f.fileno()}', os.path.basename(tmp_filename), dst_dir_fd=dir_fd)
+                except FileExistsError:
+                    continue
+                except OSError:
+                    return self._copy_unnamed_file(dirname)
+                return tmp_filename
+        finally:
+            os.close(dir_fd)
+
+    def _copy_unnamed_file(self, dirname: str) -> str:
+        import shutil
+        src_fd = self._f.fileno()
+        perm = os.fstat(src_fd).st_mode & 4095
+        while True:
+            tmp_filename = _make_tmp_filename(dirname)
+            try:
+                fd = os.open(tmp_filename, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), perm)
+                break
+            except FileExistsError:
+                continue
+        try:
+            with open(src_fd, 'rb', closefd=False) as src, open(fd, 'wb') as dst:
+                os.fchmod(fd, perm)
+                src.seek(0)
+                shutil.copyfileobj(src, dst)
+                if self._fsync != 'none':
+                    dst.flush()
+                    os.fsync(dst.fileno())
+        except BaseException:
+            os.remove(tmp_filename)
+            raise
+        return tmp_filename
+
     def __getattr__(self, name: str) -> t.Any:
         return getattr(self._f, name)
 
@@ -147,6 +472,50 @@ class _AtomicFile:
     def __repr__(self) -> str:
         return repr(self._f)
 
+class _CompressedFile:
+    """Wraps a compressed stream so that closing it also closes the
+    file it reads from or writes to, unless that is a standard stream.
+    """
+
+    def __init__(self, f: t.IO[t.Any], raw: t.IO[t.Any], close_raw: bool) -> None:
+        self._f = f
+        self._raw = raw
+        self._close_raw = close_raw
+
+    @property
+    def name(self) -> t.Any:
+        return getattr(self._raw, 'name', None)
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._f, name)
+
+    def close(self) -> None:
+        try:
+            self._f.close()
+        finally:
+            if self._close_raw:
+                self._raw.close()
+            else:
+                self._raw.flush()
+
+    def __enter__(self) -> '_CompressedFile':
+        return self
+
+    def __exit__(self, exc_type: t.Optional[t.Type[BaseException]], exc_value: t.Optional[BaseException], tb: t.Optional[TracebackType]) -> None:
+        try:
+            self._f.close()
+        finally:
+            if self._close_raw:
+                self._raw.__exit__(exc_type, exc_value, tb)
+            else:
+                self._raw.flush()
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        return iter(self._f)
+
+    def __repr__(self) -> str:
+        return repr(self._f)
+
 def get_binary_stdin() -> t.BinaryIO:
     return sys.stdin.buffer
 
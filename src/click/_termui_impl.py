@@ -93,6 +93,133 @@ class ProgressBar(t.Generic[V]):
     def __next__(self) -> V:
         return next(iter(self))
 
+    def render_finish(self) -> None:
+        if self.is_hidden:
+            return
+        self.file.write(AFTER_BAR)
+        self.file.flush()
+
+    @property
+    def pct(self) -> float:
+        if self.finished:
+            return 1.0
+        return min(self.pos / (float(self.length or 1) or 1), 1.0)
+
+    @property
+    def time_per_iteration(self) -> float:
+        if not self.avg:
+            return 0.0
+        return sum(self.avg) / float(len(self.avg))
+
+    @property
+    def eta(self) -> float:
+        if self.length is not None and (not self.finished):
+            return self.time_per_iteration * (self.length - self.pos)
+        return 0.0
+
+    def format_eta(self) -> str:
+        if self.eta_known:
+            t = int(self.eta)
+            seconds = t % 60
+            t //= 60
+            minutes = t % 60
+            t //= 60
+            hours = t % 24
+            t //= 24
+            if t > 0:
+                return f'{t}d {hours:02}:{minutes:02}:{seconds:02}'
+            else:
+                return f'{hours:02}:{minutes:02}:{seconds:02}'
+        return ''
+
+    def format_pos(self) -> str:
+        pos = str(self.pos)
+        if self.length is not None:
+            pos += f'/{self.length}'
+        return pos
+
+    def format_pct(self) -> str:
+        return f'{int(self.pct * 100): 4}%'[1:]
+
+    def format_bar(self) -> str:
+        if self.length is not None:
+            bar_length = int(self.pct * self.width)
+            bar = self.fill_char * bar_length
+            bar += self.empty_char * (self.width - bar_length)
+        elif self.finished:
+            bar = self.fill_char * self.width
+        else:
+            chars = list(self.empty_char * (self.width or 1))
+            if self.time_per_iteration != 0:
+                chars[int((math.cos(self.pos * self.time_per_iteration) / 2.0 + 0.5) * self.width)] = self.fill_char
+            bar = ''.join(chars)
+        return bar
+
+    def format_progress_line(self) -> str:
+        show_percent = self.show_percent
+        info_bits = []
+        if self.length is not None and show_percent is None:
+            show_percent = not self.show_pos
+        if self.show_pos:
+            info_bits.append(self.format_pos())
+        if show_percent:
+            info_bits.append(self.format_pct())
+        if self.show_eta and self.eta_known and (not self.finished):
+            info_bits.append(self.format_eta())
+        if self.item_show_func is not None:
+            item_info = self.item_show_func(self.current_item)
+            if item_info is not None:
+                info_bits.append(item_info)
+        return (self.bar_template % {'label': self.label, 'bar': self.format_bar(), 'info': self.info_sep.join(info_bits)}).rstrip()
+
+    def render_progress(self) -> None:
+        import shutil
+        if self.is_hidden:
+            if self._last_line != self.label:
+                self._last_line = self.label
+                echo(self.label, file=self.file, color=self.color)
+            return
+        buf = []
+        if self.autowidth:
+            old_width = self.width
+            self.width = 0
+            clutter_length = term_len(self.format_progress_line())
+            new_width = max(0, shutil.get_terminal_size().columns - clutter_length)
+            if new_width < old_width:
+                buf.append(BEFORE_BAR)
+                buf.append(' ' * self.max_width)
+                self.max_width = new_width
+            self.width = new_width
+        clear_width = self.width
+        if self.max_width is not None:
+            clear_width = self.max_width
+        buf.append(BEFORE_BAR)
+        line = self.format_progress_line()
+        line_len = term_len(line)
+        if self.max_width is None or self.max_width < line_len:
+            self.max_width = line_len
+        buf.append(line)
+        buf.append(' ' * (clear_width - line_len))
+        line = ''.join(buf)
+        if line != self._last_line:
+            self._last_line = line
+            echo(line, file=self.file, color=self.color, nl=False)
+            self.file.flush()
+
+    def make_step(self, n_steps: int) -> None:
+        self.pos += n_steps
+        if self.length is not None and self.pos >= self.length:
+            self.finished = True
+        if time.time() - self.last_eta < 1.0:
+            return
+        self.last_eta = time.time()
+        if self.pos:
+            step = (time.time() - self.start) / self.pos
+        else:
+            step = time.time() - self.start
+        self.avg = self.avg[-6:] + [step]
+        self.eta_known = self.length is not None
+
     def update(self, n_steps: int, current_item: t.Optional[V]=None) -> None:
         """Update the progress bar by advancing a specified number of
         steps, and optionally set the ``current_item`` for this new
@@ -109,14 +236,37 @@ class ProgressBar(t.Generic[V]):
             Only render when the number of steps meets the
             ``update_min_steps`` threshold.
         """
-        pass
+        if current_item is not None:
+            self.current_item = current_item
+        self._completed_intervals += n_steps
+        if self._completed_intervals >= self.update_min_steps:
+            self.make_step(self._completed_intervals)
+            self.render_progress()
+            self._completed_intervals = 0
+
+    def finish(self) -> None:
+        self.eta_known = False
+        self.current_item = None
+        self.finished = True
 
     def generator(self) -> t.Iterator[V]:
         """Return a generator which yields the items added to the bar
         during construction, and updates the progress bar *after* the
         yielded block returns.
         """
-        pass
+        if not self.entered:
+            raise RuntimeError('You need to use progress bars in a with block.')
+        if self.is_hidden:
+            yield from self.iter
+        else:
+            for rv in self.iter:
+                self.current_item = rv
+                if self._completed_intervals == 0:
+                    self.render_progress()
+                yield rv
+                self.update(1)
+            self.finish()
+            self.render_progress()
 
 def pager(generator: t.Iterable[str], color: t.Optional[bool]=None) -> None:
     """Decide what method to use for paging through text."""
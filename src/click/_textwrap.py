@@ -1,6 +1,120 @@
 import textwrap
 import typing as t
 from contextlib import contextmanager
+from ._compat import _ansi_re
+from ._compat import term_len
+
+def _split_width(chunk: str, width: int) -> t.Tuple[str, str]:
+    """Split a chunk after ``width`` columns. ANSI escape sequences
+    don't count towards the width and are never split. At least one
+    character is always split off, even if it is wider than ``width``.
+    """
+    if chunk.isascii() and '\x1b' not in chunk:
+        return (chunk[:width], chunk[width:])
+    from ._wcwidth import char_width
+    used = 0
+    pos = 0
+    while pos < len(chunk):
+        if chunk[pos] == '\x1b':
+            match = _ansi_re.match(chunk, pos)
+            if match is not None:
+                pos = match.end()
+                continue
+        char_cols = char_width(ord(chunk[pos]))
+        if used and used + char_cols > width:
+            break
+        used += char_cols
+        pos += 1
+    return (chunk[:pos], chunk[pos:])
 
 class TextWrapper(textwrap.TextWrapper):
-    pass
\ No newline at end of file
+
+    def _split_long_word(self, chunk: str, space_left: int) -> t.Tuple[str, str]:
+        """Split a word that is too long for the line after
+        ``space_left`` columns. With :attr:`break_on_hyphens`, break
+        after the last hyphen that fits instead, like
+        :class:`textwrap.TextWrapper` does.
+        """
+        cut, rest = _split_width(chunk, space_left)
+        if self.break_on_hyphens and rest:
+            hyphen = cut.rfind('-')
+            if hyphen > 0 and any((c != '-' for c in cut[:hyphen])):
+                return (chunk[:hyphen + 1], chunk[hyphen + 1:])
+        return (cut, rest)
+
+    def _handle_long_word(self, reversed_chunks: t.List[str], cur_line: t.List[str], cur_len: int, width: int) -> None:
+        space_left = max(width - cur_len, 1)
+        if self.break_long_words:
+            cut, res = self._split_long_word(reversed_chunks[-1], space_left)
+            cur_line.append(cut)
+            reversed_chunks[-1] = res
+        elif not cur_line:
+            cur_line.append(reversed_chunks.pop())
+
+    def _wrap_chunks(self, chunks: t.List[str]) -> t.List[str]:
+        """Wrap the chunks into lines in a single pass. The display width
+        of each chunk is measured once with :func:`term_len`, so ANSI
+        escape sequences don't count towards the line width.
+        """
+        if self.max_lines is not None:
+            return super()._wrap_chunks(chunks)
+        if self.width <= 0:
+            raise ValueError(f'invalid width {self.width!r} (must be > 0)')
+        widths = [term_len(chunk) for chunk in chunks]
+        initial_width = self.width - term_len(self.initial_indent)
+        subsequent_width = self.width - term_len(self.subsequent_indent)
+        lines: t.List[str] = []
+        i = 0
+        n = len(chunks)
+        while i < n:
+            if lines:
+                indent = self.subsequent_indent
+                width = subsequent_width
+                if self.drop_whitespace and (not chunks[i].strip()):
+                    i += 1
+            else:
+                indent = self.initial_indent
+                width = initial_width
+            start = i
+            cur_len = 0
+            while i < n and cur_len + widths[i] <= width:
+                cur_len += widths[i]
+                i += 1
+            line = chunks[start:i]
+            if i < n and widths[i] > width:
+                space_left = max(width - cur_len, 1)
+                if self.break_long_words:
+                    cut, chunks[i] = self._split_long_word(chunks[i], space_left)
+                    widths[i] = term_len(chunks[i])
+                    line.append(cut)
+                    if not chunks[i]:
+                        i += 1
+                elif not line:
+                    line.append(chunks[i])
+                    i += 1
+            if self.drop_whitespace and line and (not line[-1].strip()):
+                del line[-1]
+            if line:
+                lines.append(indent + ''.join(line))
+        return lines
+
+    @contextmanager
+    def extra_indent(self, indent: str) -> t.Iterator[None]:
+        old_initial_indent = self.initial_indent
+        old_subsequent_indent = self.subsequent_indent
+        self.initial_indent += indent
+        self.subsequent_indent += indent
+        try:
+            yield
+        finally:
+            self.initial_indent = old_initial_indent
+            self.subsequent_indent = old_subsequent_indent
+
+    def indent_only(self, text: str) -> str:
+        rv = []
+        for idx, line in enumerate(text.splitlines()):
+            indent = self.initial_indent
+            if idx > 0:
+                indent = self.subsequent_indent
+            rv.append(f'{indent}{line}')
+        return '\n'.join(rv)
@@ -5,12 +5,14 @@ import os
 import sys
 import typing as t
 from collections import abc
+from contextlib import AsyncExitStack
 from contextlib import contextmanager
 from contextlib import ExitStack
 from functools import update_wrapper
 from gettext import gettext as _
 from gettext import ngettext
 from itertools import repeat
+from threading import local
 from types import TracebackType
 if t.TYPE_CHECKING:
     from . import types
@@ -25,22 +27,42 @@ if t.TYPE_CHECKING:
     from .globals import pop_context
     from .globals import push_context
     from .parser import _flag_needs_value
+    from .parser import _ParserPlan
     from .parser import OptionParser
     from .parser import split_opt
-    from .termui import confirm
-    from .termui import prompt
-    from .termui import style
     from .utils import _detect_program_name
     from .utils import _expand_args
+    from .utils import _expand_response_files
     from .utils import echo
+    from .utils import get_text_stream
     from .utils import make_default_short_help
     from .utils import make_str
     from .utils import PacifyFlushWrapper
 if t.TYPE_CHECKING:
+    import asyncio
     import typing_extensions as te
+    from concurrent.futures import Executor
     from .shell_completion import CompletionItem
+    from .termui import confirm
+    from .termui import prompt
+    from .termui import style
 F = t.TypeVar('F', bound=t.Callable[..., t.Any])
 V = t.TypeVar('V')
+_batch_local = local()
+
+@contextmanager
+def _batch_scope() -> t.Iterator[t.Dict[t.Any, t.Any]]:
+    """Share a cache between all contexts created while the block runs,
+    used by :meth:`BaseCommand.invoke_many`. The environment is read
+    once, when the block starts.
+    """
+    outer = getattr(_batch_local, 'cache', None)
+    cache: t.Dict[t.Any, t.Any] = {'environ': dict(os.environ)}
+    _batch_local.cache = cache
+    try:
+        yield cache
+    finally:
+        _batch_local.cache = outer
 
 def _complete_visible_commands(ctx: 'Context', incomplete: str) -> t.Iterator[t.Tuple[str, 'Command']]:
     """List all the subcommands of a group that start with the
@@ -157,6 +179,20 @@ class Context:
         value is not set, it defaults to the value from the parent
         context. ``Command.show_default`` overrides this default for the
         specific command.
+    :param allow_abbreviated_options: Accept an unambiguous prefix of a
+        long option name, such as ``--verb`` for ``--verbose``. Defaults
+        to the value from the parent context, or ``False``.
+    :param help_cache: A mapping of command paths to precomputed help
+        pages, as returned by :meth:`Command.dump_help`. If the command
+        path of this context is in the mapping, :meth:`get_help` returns
+        the stored page instead of formatting it. If the mapping is
+        mutable, pages that are formatted are stored in it. Help is
+        never cached unless this is given. Defaults to the value from
+        the parent context.
+
+    .. versionchanged:: 8.2.0
+        Added the ``allow_abbreviated_options`` and ``help_cache``
+        parameters.
 
     .. versionchanged:: 8.1
         The ``show_default`` parameter is overridden by
@@ -183,7 +219,7 @@ class Context:
     """
     formatter_class: t.Type['HelpFormatter'] = HelpFormatter
 
-    def __init__(self, command: 'Command', parent: t.Optional['Context']=None, info_name: t.Optional[str]=None, obj: t.Optional[t.Any]=None, auto_envvar_prefix: t.Optional[str]=None, default_map: t.Optional[t.MutableMapping[str, t.Any]]=None, terminal_width: t.Optional[int]=None, max_content_width: t.Optional[int]=None, resilient_parsing: bool=False, allow_extra_args: t.Optional[bool]=None, allow_interspersed_args: t.Optional[bool]=None, ignore_unknown_options: t.Optional[bool]=None, help_option_names: t.Optional[t.List[str]]=None, token_normalize_func: t.Optional[t.Callable[[str], str]]=None, color: t.Optional[bool]=None, show_default: t.Optional[bool]=None) -> None:
+    def __init__(self, command: 'Command', parent: t.Optional['Context']=None, info_name: t.Optional[str]=None, obj: t.Optional[t.Any]=None, auto_envvar_prefix: t.Optional[str]=None, default_map: t.Optional[t.MutableMapping[str, t.Any]]=None, terminal_width: t.Optional[int]=None, max_content_width: t.Optional[int]=None, resilient_parsing: bool=False, allow_extra_args: t.Optional[bool]=None, allow_interspersed_args: t.Optional[bool]=None, ignore_unknown_options: t.Optional[bool]=None, help_option_names: t.Optional[t.List[str]]=None, token_normalize_func: t.Optional[t.Callable[[str], str]]=None, color: t.Optional[bool]=None, show_default: t.Optional[bool]=None, allow_abbreviated_options: t.Optional[bool]=None, help_cache: t.Optional[t.Mapping[str, str]]=None) -> None:
         self.parent = parent
         self.command = command
         self.info_name = info_name
@@ -238,10 +274,20 @@ class Context:
         if show_default is None and parent is not None:
             show_default = parent.show_default
         self.show_default: t.Optional[bool] = show_default
+        if allow_abbreviated_options is None:
+            allow_abbreviated_options = parent.allow_abbreviated_options if parent is not None else False
+        self.allow_abbreviated_options: bool = allow_abbreviated_options
+        if help_cache is None and parent is not None:
+            help_cache = parent.help_cache
+        self.help_cache: t.Optional[t.Mapping[str, str]] = help_cache
         self._close_callbacks: t.List[t.Callable[[], t.Any]] = []
         self._depth = 0
         self._parameter_source: t.Dict[str, ParameterSource] = {}
         self._exit_stack = ExitStack()
+        self._async_exit_stack: t.Optional[AsyncExitStack] = None
+        self._loop: t.Optional['asyncio.AbstractEventLoop'] = None
+        self._owns_loop = False
+        self._batch_cache: t.Optional[t.Dict[t.Any, t.Any]] = parent._batch_cache if parent is not None else getattr(_batch_local, 'cache', None)
 
     def to_info_dict(self) -> t.Dict[str, t.Any]:
         """Gather information that could be useful for a tool generating
@@ -268,6 +314,15 @@ class Context:
             self.close()
         pop_context()
 
+    async def __aenter__(self) -> 'Context':
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type: t.Optional[t.Type[BaseException]], exc_value: t.Optional[BaseException], tb: t.Optional[TracebackType]) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            await self.aclose()
+        pop_context()
+
     @contextmanager
     def scope(self, cleanup: bool=True) -> t.Iterator['Context']:
         """This helper method can be used with the context object to promote
@@ -337,9 +392,9 @@ class Context:
         .. versionchanged:: 8.0
             Added the :attr:`formatter_class` attribute.
         """
-        pass
+        return self.formatter_class(width=self.terminal_width, max_width=self.max_content_width)
 
-    def with_resource(self, context_manager: t.ContextManager[V]) -> V:
+    def with_resource(self, context_manager: t.Union[t.ContextManager[V], t.AsyncContextManager[V]]) -> V:
         """Register a resource as if it were used in a ``with``
         statement. The resource will be cleaned up when the context is
         popped.
@@ -364,9 +419,39 @@ class Context:
         :param context_manager: The context manager to enter.
         :return: Whatever ``context_manager.__enter__()`` returns.
 
+        .. versionchanged:: 8.2.0
+            Async context managers are entered and exited using the
+            context's event loop. Use :meth:`with_async_resource` in an
+            ``async`` callback.
+
         .. versionadded:: 8.0
         """
-        pass
+        if not hasattr(context_manager, '__enter__') and hasattr(context_manager, '__aenter__'):
+            return self._run_async(self.with_async_resource(t.cast(t.AsyncContextManager[V], context_manager)))
+        if self._async_exit_stack is not None:
+            return self._async_exit_stack.enter_context(t.cast(t.ContextManager[V], context_manager))
+        return self._exit_stack.enter_context(t.cast(t.ContextManager[V], context_manager))
+
+    async def with_async_resource(self, context_manager: t.AsyncContextManager[V]) -> V:
+        """Register an async resource as if it were used in an
+        ``async with`` statement. The resource will be cleaned up when
+        the context is popped, after any resources registered after it.
+
+        .. code-block:: python
+
+            @click.command()
+            @click.pass_context
+            async def cli(ctx):
+                session = await ctx.with_async_resource(open_session())
+
+        :param context_manager: The async context manager to enter.
+        :return: Whatever ``context_manager.__aenter__()`` returns.
+
+        .. versionadded:: 8.2.0
+        """
+        if self._async_exit_stack is None:
+            self._async_exit_stack = AsyncExitStack()
+        return await self._async_exit_stack.enter_async_context(context_manager)
 
     def call_on_close(self, f: t.Callable[..., t.Any]) -> t.Callable[..., t.Any]:
         """Register a function to be called when the context tears down.
@@ -378,14 +463,67 @@ class Context:
 
         :param f: The function to execute on teardown.
         """
-        pass
+        if self._async_exit_stack is not None:
+            return self._async_exit_stack.callback(f)
+        return self._exit_stack.callback(f)
 
     def close(self) -> None:
         """Invoke all close callbacks registered with
         :meth:`call_on_close`, and exit all context managers entered
         with :meth:`with_resource`.
+
+        .. versionchanged:: 8.2.0
+            Exits async resources, and closes the event loop used to run
+            ``async`` callbacks.
         """
-        pass
+        if self._async_exit_stack is not None:
+            self._run_async(self._close_async_exit_stack())
+        self._exit_stack.close()
+        self._exit_stack = ExitStack()
+        if self._loop is not None:
+            loop, self._loop = (self._loop, None)
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                loop.close()
+
+    async def aclose(self) -> None:
+        """Like :meth:`close`, but awaits the cleanup of async resources
+        in the running event loop.
+
+        .. versionadded:: 8.2.0
+        """
+        await self._close_async_exit_stack()
+        self.close()
+
+    async def _close_async_exit_stack(self) -> None:
+        if self._async_exit_stack is not None:
+            stack, self._async_exit_stack = (self._async_exit_stack, None)
+            await stack.aclose()
+
+    def _run_async(self, awaitable: t.Awaitable[V]) -> V:
+        """Run an awaitable to completion in the event loop shared by
+        the whole context tree. The loop is created on first use and
+        closed when the root context is closed. A chained subcommand
+        invoked in a worker thread uses its own loop instead.
+
+        :meta private:
+        """
+        import asyncio
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            raise RuntimeError("Can't run an async callback while an event loop is running. Use 'await ctx.ainvoke(...)' instead.")
+        owner = self
+        while not owner._owns_loop and owner.parent is not None:
+            owner = owner.parent
+        if owner._loop is None:
+            owner._loop = asyncio.new_event_loop()
+        return owner._loop.run_until_complete(awaitable)
 
     @property
     def command_path(self) -> str:
@@ -393,11 +531,23 @@ class Context:
         information on the help page.  It's automatically created by
         combining the info names of the chain of contexts to the root.
         """
-        pass
+        rv = ''
+        if self.info_name is not None:
+            rv = self.info_name
+        if self.parent is not None:
+            parent_command_path = [self.parent.command_path]
+            if isinstance(self.parent.command, Command):
+                for param in self.parent.command.get_params(self):
+                    parent_command_path.extend(param.get_usage_pieces(self))
+            rv = f"{' '.join(parent_command_path)} {rv}"
+        return rv.lstrip()
 
     def find_root(self) -> 'Context':
         """Finds the outermost context."""
-        pass
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        return node
 
     def find_object(self, object_type: t.Type[V]) -> t.Optional[V]:
         """Finds the closest object of a given type."""
@@ -419,7 +569,21 @@ class Context:
         .. versionchanged:: 8.0
             Added the ``call`` parameter.
         """
-        pass
+        if self.default_map is not None:
+            value = self.default_map.get(name)
+            if call and callable(value):
+                return value()
+            return value
+        return None
+
+    def _getenv(self, name: str) -> t.Optional[str]:
+        """Get an environment variable. During
+        :meth:`BaseCommand.invoke_many`, it is read from the snapshot of
+        the environment taken when the batch started.
+        """
+        if self._batch_cache is None:
+            return os.environ.get(name)
+        return self._batch_cache['environ'].get(name)
 
     def fail(self, message: str) -> 'te.NoReturn':
         """Aborts the execution of the program with a specific error
@@ -446,8 +610,34 @@ class Context:
     def get_help(self) -> str:
         """Helper method to get formatted help page for the current
         context and command.
+
+        .. versionchanged:: 8.2.0
+            Return the page from :attr:`help_cache` if it has one for
+            the command path, and store the formatted page in it if it
+            is mutable.
         """
-        pass
+        if self.help_cache is not None:
+            rv = self.help_cache.get(self.command_path)
+            if rv is not None:
+                return rv
+        rv = self.command.get_help(self)
+        if isinstance(self.help_cache, abc.MutableMapping):
+            self.help_cache[self.command_path] = rv
+        return rv
+
+    def iter_help(self) -> t.Iterator[str]:
+        """Helper method to get the help page for the current context
+        and command in chunks, as they are formatted. See
+        :meth:`Command.iter_help`.
+
+        .. versionadded:: 8.2.0
+        """
+        if self.help_cache is not None:
+            rv = self.help_cache.get(self.command_path)
+            if rv is not None:
+                yield f'{rv}\n'
+                return
+        yield from self.command.iter_help(self)
 
     def _make_sub_context(self, command: 'Command') -> 'Context':
         """Create a new context of the same type as this context, but
@@ -455,7 +645,7 @@ class Context:
 
         :meta private:
         """
-        pass
+        return type(self)(command, info_name=command.name, parent=self)
 
     def invoke(__self, __callback: t.Union['Command', 't.Callable[..., V]'], *args: t.Any, **kwargs: t.Any) -> t.Union[t.Any, V]:
         """Invokes a command callback in exactly the way it expects.  There
@@ -473,11 +663,62 @@ class Context:
         more information about this change and why it was done in a bugfix
         release see :ref:`upgrade-to-3.2`.
 
+        .. versionchanged:: 8.2.0
+            If the callback returns an awaitable, such as when it is an
+            ``async`` function, it is run in an event loop shared by the
+            whole context tree.
+
         .. versionchanged:: 8.0
             All ``kwargs`` are tracked in :attr:`params` so they will be
             passed if :meth:`forward` is called at multiple levels.
         """
-        pass
+        ctx, callback = __self._prepare_invoke(__callback, kwargs)
+        with augment_usage_errors(__self):
+            with ctx:
+                rv = callback(*args, **kwargs)
+                if inspect.isawaitable(rv):
+                    rv = ctx._run_async(rv)
+                return rv
+
+    async def ainvoke(__self, __callback: t.Union['Command', 't.Callable[..., V]'], *args: t.Any, **kwargs: t.Any) -> t.Union[t.Any, V]:
+        """Like :meth:`invoke`, but awaits the result of the callback in
+        the running event loop. Use this to invoke another command or
+        callback from an ``async`` callback.
+
+        .. code-block:: python
+
+            @cli.command()
+            @click.pass_context
+            async def sync(ctx):
+                await ctx.ainvoke(fetch, all=True)
+
+        .. versionadded:: 8.2.0
+        """
+        ctx, callback = __self._prepare_invoke(__callback, kwargs)
+        with augment_usage_errors(__self):
+            async with ctx:
+                rv = callback(*args, **kwargs)
+                if inspect.isawaitable(rv):
+                    rv = await rv
+                return rv
+
+    def _prepare_invoke(self, callback: t.Union['Command', 't.Callable[..., V]'], kwargs: t.Dict[str, t.Any]) -> t.Tuple['Context', 't.Callable[..., V]']:
+        """Find the context and function for :meth:`invoke`. If the
+        callback is a command, fill in its defaults in ``kwargs``.
+
+        :meta private:
+        """
+        if not isinstance(callback, Command):
+            return (self, callback)
+        other_cmd = callback
+        if other_cmd.callback is None:
+            raise TypeError('The given command does not have a callback that can be invoked.')
+        ctx = self._make_sub_context(other_cmd)
+        for param in other_cmd.params:
+            if param.name not in kwargs and param.expose_value:
+                kwargs[param.name] = param.type_cast_value(ctx, param.get_default(ctx))
+        ctx.params.update(kwargs)
+        return (ctx, t.cast('t.Callable[..., V]', other_cmd.callback))
 
     def forward(__self, __cmd: 'Command', *args: t.Any, **kwargs: t.Any) -> t.Any:
         """Similar to :meth:`invoke` but fills in default keyword
@@ -617,7 +858,7 @@ class BaseCommand:
         """
         pass
 
-    def main(self, args: t.Optional[t.Sequence[str]]=None, prog_name: t.Optional[str]=None, complete_var: t.Optional[str]=None, standalone_mode: bool=True, windows_expand_args: bool=True, **extra: t.Any) -> t.Any:
+    def main(self, args: t.Optional[t.Sequence[str]]=None, prog_name: t.Optional[str]=None, complete_var: t.Optional[str]=None, standalone_mode: bool=True, windows_expand_args: bool=True, expand_response_files: bool=False, **extra: t.Any) -> t.Any:
         """This is the way to invoke a script with all the bells and
         whistles as a command line application.  This will always terminate
         the application after a call.  If this is not wanted, ``SystemExit``
@@ -646,9 +887,14 @@ class BaseCommand:
                                 of :meth:`invoke`.
         :param windows_expand_args: Expand glob patterns, user dir, and
             env vars in command line args on Windows.
+        :param expand_response_files: Replace each ``@file`` argument
+            with the arguments read from that file.
         :param extra: extra keyword arguments are forwarded to the context
                       constructor.  See :class:`Context` for more information.
 
+        .. versionchanged:: 8.2.0
+            Added the ``expand_response_files`` parameter.
+
         .. versionchanged:: 8.0.1
             Added the ``windows_expand_args`` parameter to allow
             disabling command line arg expansion on Windows.
@@ -660,7 +906,49 @@ class BaseCommand:
         .. versionchanged:: 3.0
            Added the ``standalone_mode`` parameter.
         """
-        pass
+        if args is None:
+            args = sys.argv[1:]
+            if os.name == 'nt' and windows_expand_args:
+                args = _expand_args(args)
+        else:
+            args = list(args)
+        if prog_name is None:
+            prog_name = _detect_program_name()
+        self._main_shell_completion(extra, prog_name, complete_var)
+        try:
+            try:
+                if expand_response_files:
+                    args = list(_expand_response_files(args))
+                with self.make_context(prog_name, args, **extra) as ctx:
+                    rv = self.invoke(ctx)
+                    if not standalone_mode:
+                        return rv
+                    ctx.exit()
+            except (EOFError, KeyboardInterrupt) as e:
+                echo(file=sys.stderr)
+                raise Abort() from e
+            except ClickException as e:
+                if not standalone_mode:
+                    raise
+                e.show()
+                sys.exit(e.exit_code)
+            except OSError as e:
+                if e.errno == errno.EPIPE:
+                    sys.stdout = t.cast(t.TextIO, PacifyFlushWrapper(sys.stdout))
+                    sys.stderr = t.cast(t.TextIO, PacifyFlushWrapper(sys.stderr))
+                    sys.exit(1)
+                else:
+                    raise
+        except Exit as e:
+            if standalone_mode:
+                sys.exit(e.exit_code)
+            else:
+                return e.exit_code
+        except Abort:
+            if not standalone_mode:
+                raise
+            echo(_('Aborted!'), file=sys.stderr)
+            sys.exit(1)
 
     def _main_shell_completion(self, ctx_args: t.MutableMapping[str, t.Any], prog_name: str, complete_var: t.Optional[str]=None) -> None:
         """Check if the shell is asking for tab completion, process
@@ -677,6 +965,56 @@ class BaseCommand:
         """
         pass
 
+    def invoke_many(self, argvs: t.Iterable[t.Sequence[str]], prog_name: t.Optional[str]=None, **extra: t.Any) -> t.List[t.Tuple[t.Any, t.Optional[Exception]]]:
+        """Invoke the command once for each list of arguments, for
+        programs that use a command to handle many requests in one
+        process. Each invocation behaves like :meth:`main` with
+        ``standalone_mode=False``, but some work is shared by the whole
+        batch:
+
+        -   The program name is detected once.
+        -   Each command's parser is built once.
+        -   Environment variables are read from a snapshot of
+            ``os.environ`` taken when the batch starts.
+        -   Each parameter's default, from ``default_map`` or its
+            ``default``, is looked up once. Callable defaults are still
+            called for each invocation.
+        -   Formatted help pages are cached by each command.
+
+        Changes to ``os.environ`` or to the ``default_map`` made while
+        the batch runs are not seen by later invocations in the batch.
+
+        Returns a list with a ``(return_value, exception)`` tuple for
+        each list of arguments, in order. If the invocation raised an
+        error, the return value is ``None`` and the exception is set.
+        If it called :meth:`Context.exit`, the return value is the exit
+        code, as with :meth:`main`.
+
+        :param argvs: Lists of arguments to invoke the command with.
+        :param prog_name: The program name to use. Detected from
+            ``sys.argv[0]`` by default.
+        :param extra: Extra keyword arguments forwarded to the context
+            constructor for each invocation.
+
+        .. versionadded:: 8.2.0
+        """
+        if prog_name is None:
+            prog_name = _detect_program_name()
+        results: t.List[t.Tuple[t.Any, t.Optional[Exception]]] = []
+        with _batch_scope():
+            for args in argvs:
+                try:
+                    try:
+                        with self.make_context(prog_name, list(args), **extra) as ctx:
+                            results.append((self.invoke(ctx), None))
+                    except EOFError as e:
+                        raise Abort() from e
+                except Exit as e:
+                    results.append((e.exit_code, None))
+                except Exception as e:
+                    results.append((None, e))
+        return results
+
     def __call__(self, *args: t.Any, **kwargs: t.Any) -> t.Any:
         """Alias for :meth:`main`."""
         return self.main(*args, **kwargs)
@@ -735,6 +1073,9 @@ class Command(BaseCommand):
         self.no_args_is_help = no_args_is_help
         self.hidden = hidden
         self.deprecated = deprecated
+        self._help_option: t.Optional[t.Tuple[t.FrozenSet[str], 'Option']] = None
+        self._parser_plan: t.Optional[t.Tuple[t.Tuple[t.Any, ...], '_ParserPlan']] = None
+        self._help_cache: t.Optional[t.Tuple[t.Tuple[t.Any, ...], t.Dict[t.Tuple[t.Any, ...], str]]] = None
 
     def get_usage(self, ctx: Context) -> str:
         """Formats the usage line into a string and returns it.
@@ -761,19 +1102,130 @@ class Command(BaseCommand):
         pass
 
     def get_help_option(self, ctx: Context) -> t.Optional['Option']:
-        """Returns the help option object."""
-        pass
+        """Returns the help option object.
+
+        .. versionchanged:: 8.2.0
+            The option is created once per set of help option names and
+            reused, so it matches the one in the cached parser plan.
+        """
+        help_options = self.get_help_option_names(ctx)
+        if not help_options or not self.add_help_option:
+            return None
+        key = frozenset(help_options)
+        if self._help_option is not None and self._help_option[0] == key:
+            return self._help_option[1]
+
+        def show_help(ctx: Context, param: 'Parameter', value: str) -> None:
+            if value and (not ctx.resilient_parsing):
+                echo(ctx.get_help(), color=ctx.color)
+                ctx.exit()
+        option = Option(help_options, is_flag=True, is_eager=True, expose_value=False, callback=show_help, help=_('Show this message and exit.'))
+        self._help_option = (key, option)
+        return option
 
     def make_parser(self, ctx: Context) -> OptionParser:
-        """Creates the underlying option parser for this command."""
-        pass
+        """Creates the underlying option parser for this command.
+
+        The parameters are registered with a parser once and compiled
+        into a plan with :meth:`OptionParser.compile`. Later calls create
+        the parser from that plan, until the parameters returned by
+        :meth:`get_params`, including the help option, or the context's
+        :attr:`~Context.token_normalize_func` change.
+
+        .. versionchanged:: 8.2.0
+            Reuse a compiled parser plan across invocations.
+        """
+        params = self.get_params(ctx)
+        key = (tuple(params), ctx.token_normalize_func)
+        if self._parser_plan is not None and self._parser_plan[0] == key:
+            return OptionParser.from_plan(self._parser_plan[1], ctx)
+        parser = OptionParser(ctx)
+        for param in params:
+            param.add_to_parser(parser, ctx)
+        self._parser_plan = (key, parser.compile())
+        return parser
 
     def get_help(self, ctx: Context) -> str:
         """Formats the help into a string and returns it.
 
-        Calls :meth:`format_help` internally.
+        Calls :meth:`format_help` internally. The result is cached on the
+        command for each command path, formatter width, ``color``,
+        ``show_default``, and help option names, until :attr:`params`,
+        their help or defaults, or the help text of the command change.
+        Help is not cached if the context has a
+        :attr:`~Context.default_map` or an
+        :attr:`~Context.auto_envvar_prefix`, since they change the
+        defaults and environment variables that are shown.
+
+        .. versionchanged:: 8.2.0
+            The formatted help is cached.
         """
-        pass
+        formatter = ctx.make_formatter()
+        if ctx.default_map is not None or ctx.auto_envvar_prefix is not None:
+            self.format_help(ctx, formatter)
+            return formatter.getvalue().rstrip('\n')
+        state = self._help_cache_state(ctx)
+        if self._help_cache is None or self._help_cache[0] != state:
+            self._help_cache = (state, {})
+        cache = self._help_cache[1]
+        key = (type(formatter), formatter.width, ctx.command_path, ctx.color, ctx.show_default, tuple(ctx.help_option_names))
+        rv = cache.get(key)
+        if rv is None:
+            self.format_help(ctx, formatter)
+            rv = cache[key] = formatter.getvalue().rstrip('\n')
+        return rv
+
+    def _help_cache_state(self, ctx: Context) -> t.Tuple[t.Any, ...]:
+        """The command state the cached help depends on. The cache is
+        cleared when it changes.
+        """
+        params = tuple(((param, getattr(param, 'help', None), getattr(param, 'hidden', False), param.default, param.envvar) for param in self.params))
+        return (params, self.help, self.epilog, self.options_metavar, self.add_help_option, self.deprecated)
+
+    def dump_help(self, ctx: Context) -> t.Dict[str, str]:
+        """Format the help page of this command and return it in a
+        mapping of command path to help page, suitable for passing as
+        the ``help_cache`` context setting. This is meant to be run at
+        build time, the result can be stored as JSON.
+
+        :param ctx: A :class:`Context` representing this command.
+
+        .. versionadded:: 8.2.0
+        """
+        return {ctx.command_path: self.get_help(ctx)}
+
+    def iter_help(self, ctx: Context) -> t.Iterator[str]:
+        """Formats the help and yields it in chunks as each part is
+        formatted, so it can be written out or passed to
+        :func:`echo_via_pager` without waiting for the whole page.
+
+        This calls the same methods as :meth:`format_help`, and the
+        chunks join to the text returned by :meth:`get_help`, followed
+        by a newline. If a subclass overrides :meth:`format_help`, the
+        whole page from :meth:`get_help` is yielded as one chunk
+        instead, so the override is respected.
+
+        A chunk is yielded after each of those methods returns, so the
+        usage, help text, options and commands, and epilog each arrive
+        as a whole. A table of options or commands is not split into
+        rows. To write each row as soon as it is formatted, pass a
+        :class:`HelpFormatter` with a ``stream`` to :meth:`format_help`
+        instead.
+
+        The ``--help`` option does not stream, it shows the page from
+        :meth:`Context.get_help`, which can be cached.
+
+        .. versionadded:: 8.2.0
+        """
+        if type(self).format_help is not Command.format_help:
+            yield f'{self.get_help(ctx)}\n'
+            return
+        formatter = ctx.make_formatter()
+        for format_part in (self.format_usage, self.format_help_text, self.format_options, self.format_epilog):
+            format_part(ctx, formatter)
+            chunk = formatter.drain()
+            if chunk:
+                yield chunk
 
     def get_short_help_str(self, limit: int=45) -> str:
         """Gets short help for the command or makes it by shortening the
@@ -793,7 +1245,10 @@ class Command(BaseCommand):
         -   :meth:`format_options`
         -   :meth:`format_epilog`
         """
-        pass
+        self.format_usage(ctx, formatter)
+        self.format_help_text(ctx, formatter)
+        self.format_options(ctx, formatter)
+        self.format_epilog(ctx, formatter)
 
     def format_help_text(self, ctx: Context, formatter: HelpFormatter) -> None:
         """Writes the help text to the formatter if it exists."""
@@ -811,7 +1266,12 @@ class Command(BaseCommand):
         """Given a context, this invokes the attached callback (if it exists)
         in the right way.
         """
-        pass
+        if self.deprecated:
+            from .termui import style
+            message = _('DeprecationWarning: The command {name!r} is deprecated.').format(name=self.name)
+            echo(style(message, fg='red'), err=True)
+        if self.callback is not None:
+            return ctx.invoke(self.callback, **ctx.params)
 
     def shell_complete(self, ctx: Context, incomplete: str) -> t.List['CompletionItem']:
         """Return a list of completions for the incomplete value. Looks
@@ -847,12 +1307,28 @@ class MultiCommand(Command):
     :param result_callback: The result callback to attach to this multi
         command. This can be set or changed later with the
         :meth:`result_callback` decorator.
+    :param chain_executor: In chain mode, invoke the chained subcommands
+        concurrently instead of one after the other. Either ``"thread"``
+        to use a new thread pool for each invocation, or a
+        :class:`concurrent.futures.Executor` that runs functions in
+        threads. All subcommands are parsed before any is invoked, and
+        the results are passed to the result callback in order. Raises
+        :exc:`TypeError` if ``chain`` is not enabled.
+    :param stream_results: In chain mode, pass the result callback an
+        iterator instead of a list. Each chained subcommand is parsed
+        and invoked when the iterator reaches it. Subcommands the
+        callback doesn't consume are invoked after it returns. Can't be
+        used with ``chain_executor``. Raises :exc:`TypeError` if
+        ``chain`` is not enabled.
     :param attrs: Other command arguments described in :class:`Command`.
+
+    .. versionchanged:: 8.2.0
+        Added the ``chain_executor`` and ``stream_results`` parameters.
     """
     allow_extra_args = True
     allow_interspersed_args = False
 
-    def __init__(self, name: t.Optional[str]=None, invoke_without_command: bool=False, no_args_is_help: t.Optional[bool]=None, subcommand_metavar: t.Optional[str]=None, chain: bool=False, result_callback: t.Optional[t.Callable[..., t.Any]]=None, **attrs: t.Any) -> None:
+    def __init__(self, name: t.Optional[str]=None, invoke_without_command: bool=False, no_args_is_help: t.Optional[bool]=None, subcommand_metavar: t.Optional[str]=None, chain: bool=False, result_callback: t.Optional[t.Callable[..., t.Any]]=None, chain_executor: t.Optional[t.Union[str, 'Executor']]=None, stream_results: bool=False, **attrs: t.Any) -> None:
         super().__init__(name, **attrs)
         if no_args_is_help is None:
             no_args_is_help = not invoke_without_command
@@ -864,7 +1340,17 @@ class MultiCommand(Command):
             else:
                 subcommand_metavar = 'COMMAND [ARGS]...'
         self.subcommand_metavar = subcommand_metavar
+        if isinstance(chain_executor, str) and chain_executor != 'thread':
+            raise ValueError(f"'chain_executor' must be 'thread' or an executor, not {chain_executor!r}.")
+        if chain_executor is not None and (not chain):
+            raise TypeError("'chain_executor' can only be used with 'chain=True'.")
+        if stream_results and chain_executor is not None:
+            raise TypeError("'stream_results' can't be used with 'chain_executor'.")
+        if stream_results and (not chain):
+            raise TypeError("'stream_results' can only be used with 'chain=True'.")
         self.chain = chain
+        self.chain_executor = chain_executor
+        self.stream_results = stream_results
         self._result_callback = result_callback
         if self.chain:
             for param in self.params:
@@ -894,12 +1380,35 @@ class MultiCommand(Command):
         :param replace: if set to `True` an already existing result
                         callback will be removed.
 
+        .. versionchanged:: 8.2.0
+            Result callbacks can be ``async`` functions.
+
         .. versionchanged:: 8.0
             Renamed from ``resultcallback``.
 
         .. versionadded:: 3.0
         """
-        pass
+
+        def decorator(f: F) -> F:
+            old_callback = self._result_callback
+            if old_callback is None or replace:
+                self._result_callback = f
+                return f
+
+            def function(__value, *args, **kwargs):
+                inner = old_callback(__value, *args, **kwargs)
+                if not inspect.isawaitable(inner):
+                    return f(inner, *args, **kwargs)
+
+                async def chained() -> t.Any:
+                    rv = f(await inner, *args, **kwargs)
+                    if inspect.isawaitable(rv):
+                        rv = await rv
+                    return rv
+                return chained()
+            self._result_callback = rv = update_wrapper(t.cast(F, function), f)
+            return rv
+        return decorator
 
     def format_commands(self, ctx: Context, formatter: HelpFormatter) -> None:
         """Extra format methods for multi methods that adds all the commands
@@ -907,6 +1416,28 @@ class MultiCommand(Command):
         """
         pass
 
+    def _help_cache_state(self, ctx: Context) -> t.Tuple[t.Any, ...]:
+        commands = tuple(((name, self.get_command(ctx, name)) for name in self.list_commands(ctx)))
+        return (*super()._help_cache_state(ctx), self.subcommand_metavar, commands)
+
+    def dump_help(self, ctx: Context) -> t.Dict[str, str]:
+        """Format the help pages of this command and all commands below
+        it, and return them in a mapping of command path to help page.
+
+        :param ctx: A :class:`Context` representing this command.
+
+        .. versionadded:: 8.2.0
+        """
+        rv = super().dump_help(ctx)
+        for name in self.list_commands(ctx):
+            command = self.get_command(ctx, name)
+            if command is None:
+                continue
+            sub_ctx = command.context_class(command, info_name=name, parent=ctx, **command.context_settings)
+            with sub_ctx.scope(cleanup=False):
+                rv.update(command.dump_help(sub_ctx))
+        return rv
+
     def get_command(self, ctx: Context, cmd_name: str) -> t.Optional[Command]:
         """Given a context and a command name, this returns a
         :class:`Command` object if it exists or returns `None`.
@@ -919,6 +1450,113 @@ class MultiCommand(Command):
         """
         pass
 
+    def invoke(self, ctx: Context) -> t.Any:
+        """Invoke the group callback, then the subcommand, or each of the
+        chained subcommands in order, then the result callback.
+        """
+
+        def _process_result(value: t.Any) -> t.Any:
+            if self._result_callback is not None:
+                value = ctx.invoke(self._result_callback, value, **ctx.params)
+            return value
+        if not ctx.protected_args:
+            if self.invoke_without_command:
+                with ctx:
+                    rv = super().invoke(ctx)
+                    if not self.chain:
+                        return _process_result(rv)
+                    return _process_result(iter(()) if self.stream_results else [])
+            ctx.fail(_('Missing command.'))
+        args = [*ctx.protected_args, *ctx.args]
+        ctx.args = []
+        ctx.protected_args = []
+        if not self.chain:
+            with ctx:
+                cmd_name, cmd, args = self.resolve_command(ctx, args)
+                assert cmd is not None
+                ctx.invoked_subcommand = cmd_name
+                super().invoke(ctx)
+                sub_ctx = cmd.make_context(cmd_name, args, parent=ctx)
+                with sub_ctx:
+                    return _process_result(sub_ctx.command.invoke(sub_ctx))
+        with ctx:
+            ctx.invoked_subcommand = '*' if args else None
+            super().invoke(ctx)
+            if self.stream_results:
+                results = self._iter_chain(ctx, args)
+                if self._result_callback is None:
+                    return list(results)
+                rv = _process_result(results)
+                for _value in results:
+                    pass
+                return rv
+            contexts = []
+            while args:
+                cmd_name, cmd, args = self.resolve_command(ctx, args)
+                assert cmd is not None
+                sub_ctx = cmd.make_context(cmd_name, args, parent=ctx, allow_extra_args=True, allow_interspersed_args=False)
+                contexts.append(sub_ctx)
+                args, sub_ctx.args = (sub_ctx.args, [])
+            if self.chain_executor is not None and len(contexts) > 1:
+                return _process_result(self._invoke_concurrently(contexts))
+            rv = []
+            for sub_ctx in contexts:
+                with sub_ctx:
+                    rv.append(sub_ctx.command.invoke(sub_ctx))
+            return _process_result(rv)
+
+    def _iter_chain(self, ctx: Context, args: t.List[str]) -> t.Iterator[t.Any]:
+        """Parse and invoke chained subcommands one at a time, yielding
+        each result before the next subcommand is parsed.
+        """
+        while args:
+            cmd_name, cmd, args = self.resolve_command(ctx, args)
+            assert cmd is not None
+            sub_ctx = cmd.make_context(cmd_name, args, parent=ctx, allow_extra_args=True, allow_interspersed_args=False)
+            args, sub_ctx.args = (sub_ctx.args, [])
+            with sub_ctx:
+                rv = sub_ctx.command.invoke(sub_ctx)
+            yield rv
+
+    def _invoke_concurrently(self, contexts: t.List[Context]) -> t.List[t.Any]:
+        """Invoke chained subcommands with :attr:`chain_executor` and
+        return their results in order. If any of them fails, pending
+        ones are cancelled and the first error in order is raised.
+        """
+        if self.chain_executor == 'thread':
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor() as pool:
+                return self._map_contexts(pool, contexts)
+        return self._map_contexts(t.cast('Executor', self.chain_executor), contexts)
+
+    def _map_contexts(self, executor: 'Executor', contexts: t.List[Context]) -> t.List[t.Any]:
+        futures = []
+        for sub_ctx in contexts:
+            sub_ctx._owns_loop = True
+            futures.append(executor.submit(_invoke_in_context, sub_ctx))
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    def resolve_command(self, ctx: Context, args: t.List[str]) -> t.Tuple[t.Optional[str], t.Optional[Command], t.List[str]]:
+        """Find the subcommand named by the first argument. Returns the
+        name, the command, and the remaining arguments.
+        """
+        cmd_name = make_str(args[0])
+        original_cmd_name = cmd_name
+        cmd = self.get_command(ctx, cmd_name)
+        if cmd is None and ctx.token_normalize_func is not None:
+            cmd_name = ctx.token_normalize_func(cmd_name)
+            cmd = self.get_command(ctx, cmd_name)
+        if cmd is None and (not ctx.resilient_parsing):
+            if split_opt(cmd_name)[0]:
+                self.parse_args(ctx, ctx.args)
+            ctx.fail(_('No such command {name!r}.').format(name=original_cmd_name))
+        return (cmd_name if cmd else None, cmd, args[1:])
+
     def shell_complete(self, ctx: Context, incomplete: str) -> t.List['CompletionItem']:
         """Return a list of completions for the incomplete value. Looks
         at the names of options, subcommands, and chained
@@ -997,6 +1635,133 @@ class Group(MultiCommand):
         """
         pass
 
+class LazyGroup(Group):
+    """A group that imports its subcommands only when they are invoked.
+    Subcommands are registered as import strings, and a manifest of
+    their short help is used for the command listing, so ``--help``,
+    :meth:`list_commands`, and shell completion of command names never
+    import a subcommand module. :meth:`get_command` imports only the
+    selected command.
+
+    .. code-block:: python
+
+        cli = LazyGroup(
+            "cli",
+            lazy_subcommands={"init": "mytool.commands.init:cli"},
+            help_manifest={"init": "Create a new project."},
+        )
+
+    Regular commands can still be added with :meth:`add_command` or the
+    :meth:`command` decorator. A manifest can be generated at build time
+    with :meth:`build_manifest`.
+
+    :param name: The name of the group command.
+    :param lazy_subcommands: A mapping of command names to import
+        strings in the form ``"module:attr"``. ``"module.attr"`` is
+        accepted as well.
+    :param help_manifest: A mapping of command names to the short help
+        shown in the command listing. A value of ``None`` hides the
+        command from the listing. Commands without an entry are listed
+        without help text.
+    :param attrs: Other command arguments described in :class:`Group`.
+
+    .. versionadded:: 8.2.0
+    """
+
+    def __init__(self, name: t.Optional[str]=None, lazy_subcommands: t.Optional[t.Mapping[str, str]]=None, help_manifest: t.Optional[t.Mapping[str, t.Optional[str]]]=None, **attrs: t.Any) -> None:
+        super().__init__(name, **attrs)
+        self.lazy_subcommands: t.Dict[str, str] = dict(lazy_subcommands or {})
+        self.help_manifest: t.Dict[str, t.Optional[str]] = dict(help_manifest or {})
+
+    def get_command(self, ctx: Context, cmd_name: str) -> t.Optional[Command]:
+        """Return an already registered or loaded command, or import the
+        lazy subcommand with the given name. The imported command is
+        registered with the group so it is only imported once.
+        """
+        cmd = self.commands.get(cmd_name)
+        if cmd is not None or cmd_name not in self.lazy_subcommands:
+            return cmd
+        cmd = self._load_command(self.lazy_subcommands[cmd_name])
+        self.commands[cmd_name] = cmd
+        return cmd
+
+    def list_commands(self, ctx: Context) -> t.List[str]:
+        """Returns the names of the registered and lazy subcommands in
+        sorted order without importing anything.
+        """
+        return sorted({*self.commands, *self.lazy_subcommands})
+
+    def _load_command(self, import_path: str) -> Command:
+        """Import the command object referenced by an import string."""
+        import importlib
+        if ':' in import_path:
+            module_name, _, attr = import_path.partition(':')
+        else:
+            module_name, _, attr = import_path.rpartition('.')
+        obj: t.Any = importlib.import_module(module_name)
+        for part in attr.split('.'):
+            obj = getattr(obj, part)
+        if not isinstance(obj, BaseCommand):
+            raise TypeError(f'Lazy loading {import_path!r} did not return a command object, got {obj!r}.')
+        return t.cast(Command, obj)
+
+    def _iter_command_help(self, ctx: Context, limit: int=45) -> t.Iterator[t.Tuple[str, str]]:
+        """Yield the names and short help of the visible subcommands.
+        Commands that are already loaded report their own help, lazy
+        commands use the manifest.
+        """
+        for name in self.list_commands(ctx):
+            cmd = self.commands.get(name)
+            if cmd is not None:
+                if not cmd.hidden:
+                    yield (name, cmd.get_short_help_str(limit))
+            elif name in self.help_manifest:
+                help = self.help_manifest[name]
+                if help is not None:
+                    yield (name, make_default_short_help(help, limit))
+            else:
+                yield (name, '')
+
+    def format_commands(self, ctx: Context, formatter: HelpFormatter) -> None:
+        """Write the command listing using the help manifest, without
+        importing lazy subcommands.
+        """
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max((len(name) for name in names))
+        rows = list(self._iter_command_help(ctx, limit))
+        if rows:
+            with formatter.section(_('Commands')):
+                formatter.write_dl(rows)
+
+    def shell_complete(self, ctx: Context, incomplete: str) -> t.List['CompletionItem']:
+        """Complete subcommand names from the help manifest without
+        importing lazy subcommands, then options and chained commands.
+
+        :param ctx: Invocation context for this command.
+        :param incomplete: Value being completed. May be empty.
+        """
+        from click.shell_completion import CompletionItem
+        results = [CompletionItem(name, help=help or None) for name, help in self._iter_command_help(ctx) if name.startswith(incomplete)]
+        results.extend(Command.shell_complete(self, ctx, incomplete))
+        return results
+
+    def build_manifest(self, ctx: Context) -> t.Dict[str, t.Optional[str]]:
+        """Import every subcommand and return a help manifest for them,
+        suitable for passing as ``help_manifest``. This is meant to be
+        run at build time, the result can be stored as JSON.
+
+        :param ctx: Invocation context for this command.
+        """
+        manifest: t.Dict[str, t.Optional[str]] = {}
+        for name in self.list_commands(ctx):
+            cmd = self.get_command(ctx, name)
+            if cmd is None:
+                continue
+            manifest[name] = None if cmd.hidden else cmd.get_short_help_str(limit=sys.maxsize)
+        return manifest
+
 class CommandCollection(MultiCommand):
     """A command collection is a multi command that merges multiple multi
     commands together into one.  This is a straightforward implementation
@@ -1015,11 +1780,21 @@ class CommandCollection(MultiCommand):
         """Adds a new multi command to the chain dispatcher."""
         pass
 
+def _invoke_in_context(ctx: Context) -> t.Any:
+    """Invoke a context's command with the context pushed. Used to run a
+    chained subcommand in a worker thread, which has its own stack of
+    current contexts.
+    """
+    with ctx:
+        return ctx.command.invoke(ctx)
+
 def _check_iter(value: t.Any) -> t.Iterator[t.Any]:
     """Check if the value is iterable but not a string. Raises a type
     error, or return an iterator over the value.
     """
-    pass
+    if isinstance(value, str):
+        raise TypeError
+    return iter(value)
 
 class Parameter:
     """A parameter to a command comes in two versions: they are either
@@ -1181,14 +1956,95 @@ class Parameter:
 
         .. versionchanged:: 8.0
             Added the ``call`` parameter.
+
+        .. versionchanged:: 8.2.0
+            During :meth:`BaseCommand.invoke_many`, the default is looked
+            up once for the batch. A callable default is still called
+            for each invocation.
         """
-        pass
+        cache = ctx._batch_cache
+        key = ('default', self, id(ctx.default_map))
+        if cache is not None and key in cache:
+            value = cache[key]
+        else:
+            value = ctx.lookup_default(self.name, call=False)
+            if value is None:
+                value = self.default
+            if cache is not None:
+                cache[key] = value
+        if call and callable(value):
+            value = value()
+        return value
+
+    def resolve_envvar_value(self, ctx: Context) -> t.Optional[str]:
+        if self.envvar is None:
+            return None
+        if isinstance(self.envvar, str):
+            rv = ctx._getenv(self.envvar)
+            if rv:
+                return rv
+        else:
+            for envvar in self.envvar:
+                rv = ctx._getenv(envvar)
+                if rv:
+                    return rv
+        return None
 
     def type_cast_value(self, ctx: Context, value: t.Any) -> t.Any:
         """Convert and validate a value against the option's
         :attr:`type`, :attr:`multiple`, and :attr:`nargs`.
+
+        .. versionchanged:: 8.2.0
+            Sequences of values are converted with
+            :meth:`~click.types.ParamType.convert_many`.
         """
-        pass
+        if value is None:
+            return () if self.multiple or self.nargs == -1 else None
+        with types._path_check_cache(ctx):
+            return self._type_cast_value(ctx, value)
+
+    def _type_cast_value(self, ctx: Context, value: t.Any) -> t.Any:
+
+        def check_iter(value: t.Any) -> t.Iterator[t.Any]:
+            try:
+                return _check_iter(value)
+            except TypeError:
+                raise BadParameter(_('Value must be an iterable.'), ctx=ctx, param=self) from None
+        if self.nargs == 1 or self.type.is_composite:
+
+            def convert(value: t.Any) -> t.Any:
+                return self.type(value, param=self, ctx=ctx)
+        elif self.nargs == -1:
+
+            def convert(value: t.Any) -> t.Any:
+                return self.type.convert_many(check_iter(value), self, ctx)
+        else:
+
+            def convert(value: t.Any) -> t.Any:
+                value = tuple(check_iter(value))
+                if len(value) != self.nargs:
+                    raise BadParameter(ngettext('Takes {nargs} values but 1 was given.', 'Takes {nargs} values but {len} were given.', len(value)).format(nargs=self.nargs, len=len(value)), ctx=ctx, param=self)
+                return self.type.convert_many(value, self, ctx)
+        if self.multiple:
+            if self.nargs == 1 and (not self.type.is_composite):
+                return self.type.convert_many(check_iter(value), self, ctx)
+            return tuple((convert(x) for x in check_iter(value)))
+        return convert(value)
+
+    def value_is_missing(self, value: t.Any) -> bool:
+        if value is None:
+            return True
+        if (self.nargs != 1 or self.multiple) and value == ():
+            return True
+        return False
+
+    def process_value(self, ctx: Context, value: t.Any) -> t.Any:
+        value = self.type_cast_value(ctx, value)
+        if self.required and self.value_is_missing(value):
+            raise MissingParameter(ctx=ctx, param=self)
+        if self.callback is not None:
+            value = self.callback(ctx, self, value)
+        return value
 
     def get_error_hint(self, ctx: Context) -> str:
         """Get a stringified version of the param for use in error messages to
@@ -1347,16 +2203,37 @@ class Option(Parameter):
         """
         pass
 
+    def resolve_envvar_value(self, ctx: Context) -> t.Optional[str]:
+        rv = super().resolve_envvar_value(ctx)
+        if rv is not None:
+            return rv
+        if self.allow_from_autoenv and ctx.auto_envvar_prefix is not None and (self.name is not None):
+            envvar = f'{ctx.auto_envvar_prefix}_{self.name.upper()}'
+            rv = ctx._getenv(envvar)
+            if rv:
+                return rv
+        return None
+
 class Argument(Parameter):
     """Arguments are positional parameters to a command.  They generally
     provide fewer features than options but can have infinite ``nargs``
     and are required by default.
 
     All parameters are passed onwards to the constructor of :class:`Parameter`.
+
+    :param lazy: With ``nargs=-1``, pass an iterator that converts each
+        value when it is reached instead of a tuple of converted values.
+        A ``-`` value is replaced by the lines read from stdin, unless
+        the type already gives ``-`` a meaning, such as :class:`File` or
+        :class:`Path` with ``allow_dash``. The iterator can only be
+        consumed once.
+
+    .. versionchanged:: 8.2.0
+        Added the ``lazy`` parameter.
     """
     param_type_name = 'argument'
 
-    def __init__(self, param_decls: t.Sequence[str], required: t.Optional[bool]=None, **attrs: t.Any) -> None:
+    def __init__(self, param_decls: t.Sequence[str], required: t.Optional[bool]=None, lazy: bool=False, **attrs: t.Any) -> None:
         if required is None:
             if attrs.get('default') is not None:
                 required = False
@@ -1367,4 +2244,39 @@ class Argument(Parameter):
         super().__init__(param_decls, required=required, **attrs)
         if __debug__:
             if self.default is not None and self.nargs == -1:
-                raise TypeError("'default' is not supported for nargs=-1.")
\ No newline at end of file
+                raise TypeError("'default' is not supported for nargs=-1.")
+        self.lazy = lazy
+        if lazy and self.nargs != -1:
+            raise TypeError("'lazy' is only supported for nargs=-1.")
+
+    def type_cast_value(self, ctx: Context, value: t.Any) -> t.Any:
+        if not self.lazy:
+            return super().type_cast_value(ctx, value)
+        if value is None:
+            value = ()
+        try:
+            values = _check_iter(value)
+        except TypeError:
+            raise BadParameter(_('Value must be an iterable.'), ctx=ctx, param=self) from None
+        return self._iter_lazy_values(ctx, values)
+
+    def _iter_lazy_values(self, ctx: Context, values: t.Iterator[t.Any]) -> t.Iterator[t.Any]:
+        read_stdin = not (isinstance(self.type, types.File) or (isinstance(self.type, types.Path) and self.type.allow_dash))
+        for value in values:
+            if read_stdin and value == '-':
+                for line in get_text_stream('stdin'):
+                    line = line.rstrip('\r\n')
+                    if line:
+                        yield self.type(line, self, ctx)
+            else:
+                yield self.type(value, self, ctx)
+
+    def process_value(self, ctx: Context, value: t.Any) -> t.Any:
+        if not self.lazy:
+            return super().process_value(ctx, value)
+        if self.required and self.value_is_missing(value):
+            raise MissingParameter(ctx=ctx, param=self)
+        value = self.type_cast_value(ctx, value)
+        if self.callback is not None:
+            value = self.callback(ctx, self, value)
+        return value
\ No newline at end of file
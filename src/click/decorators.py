@@ -22,15 +22,37 @@ FC = t.TypeVar('FC', bound=t.Union[_AnyCallable, Command])
 def pass_context(f: 't.Callable[te.Concatenate[Context, P], R]') -> 't.Callable[P, R]':
     """Marks a callback as wanting to receive the current context
     object as first argument.
+
+    .. versionchanged:: 8.2.0
+        An ``async`` callback stays a coroutine function.
     """
-    pass
+    if inspect.iscoroutinefunction(f):
+
+        async def new_async_func(*args: 'P.args', **kwargs: 'P.kwargs') -> t.Any:
+            return await f(get_current_context(), *args, **kwargs)
+        return update_wrapper(t.cast('t.Callable[P, R]', new_async_func), f)
+
+    def new_func(*args: 'P.args', **kwargs: 'P.kwargs') -> 'R':
+        return f(get_current_context(), *args, **kwargs)
+    return update_wrapper(new_func, f)
 
 def pass_obj(f: 't.Callable[te.Concatenate[t.Any, P], R]') -> 't.Callable[P, R]':
     """Similar to :func:`pass_context`, but only pass the object on the
     context onwards (:attr:`Context.obj`).  This is useful if that object
     represents the state of a nested system.
+
+    .. versionchanged:: 8.2.0
+        An ``async`` callback stays a coroutine function.
     """
-    pass
+    if inspect.iscoroutinefunction(f):
+
+        async def new_async_func(*args: 'P.args', **kwargs: 'P.kwargs') -> t.Any:
+            return await f(get_current_context().obj, *args, **kwargs)
+        return update_wrapper(t.cast('t.Callable[P, R]', new_async_func), f)
+
+    def new_func(*args: 'P.args', **kwargs: 'P.kwargs') -> 'R':
+        return f(get_current_context().obj, *args, **kwargs)
+    return update_wrapper(new_func, f)
 
 def make_pass_decorator(object_type: t.Type[T], ensure: bool=False) -> t.Callable[['t.Callable[te.Concatenate[T, P], R]'], 't.Callable[P, R]']:
     """Given an object type this creates a decorator that will work
@@ -53,8 +75,36 @@ def make_pass_decorator(object_type: t.Type[T], ensure: bool=False) -> t.Callabl
     :param object_type: the type of the object to pass.
     :param ensure: if set to `True`, a new object will be created and
                    remembered on the context if it's not there yet.
+
+    .. versionchanged:: 8.2.0
+        An ``async`` callback stays a coroutine function, and is invoked
+        with :meth:`Context.ainvoke`.
     """
-    pass
+
+    def find_object() -> t.Tuple[Context, T]:
+        ctx = get_current_context()
+        obj: t.Optional[T]
+        if ensure:
+            obj = ctx.ensure_object(object_type)
+        else:
+            obj = ctx.find_object(object_type)
+        if obj is None:
+            raise RuntimeError(f'Managed to invoke callback without a context object of type {object_type.__name__!r} existing.')
+        return (ctx, obj)
+
+    def decorator(f: 't.Callable[te.Concatenate[T, P], R]') -> 't.Callable[P, R]':
+        if inspect.iscoroutinefunction(f):
+
+            async def new_async_func(*args: 'P.args', **kwargs: 'P.kwargs') -> t.Any:
+                ctx, obj = find_object()
+                return await ctx.ainvoke(f, obj, *args, **kwargs)
+            return update_wrapper(t.cast('t.Callable[P, R]', new_async_func), f)
+
+        def new_func(*args: 'P.args', **kwargs: 'P.kwargs') -> 'R':
+            ctx, obj = find_object()
+            return ctx.invoke(f, obj, *args, **kwargs)
+        return update_wrapper(new_func, f)
+    return decorator
 
 def pass_meta_key(key: str, *, doc_description: t.Optional[str]=None) -> 't.Callable[[t.Callable[te.Concatenate[t.Any, P], R]], t.Callable[P, R]]':
     """Create a decorator that passes a key from
@@ -66,9 +116,30 @@ def pass_meta_key(key: str, *, doc_description: t.Optional[str]=None) -> 't.Call
         inserted into the decorator's docstring. Defaults to "the 'key'
         key from Context.meta".
 
+    .. versionchanged:: 8.2.0
+        An ``async`` callback stays a coroutine function, and is invoked
+        with :meth:`Context.ainvoke`.
+
     .. versionadded:: 8.0
     """
-    pass
+
+    def decorator(f: 't.Callable[te.Concatenate[t.Any, P], R]') -> 't.Callable[P, R]':
+        if inspect.iscoroutinefunction(f):
+
+            async def new_async_func(*args: 'P.args', **kwargs: 'P.kwargs') -> t.Any:
+                ctx = get_current_context()
+                return await ctx.ainvoke(f, ctx.meta[key], *args, **kwargs)
+            return update_wrapper(t.cast('t.Callable[P, R]', new_async_func), f)
+
+        def new_func(*args: 'P.args', **kwargs: 'P.kwargs') -> 'R':
+            ctx = get_current_context()
+            obj = ctx.meta[key]
+            return ctx.invoke(f, obj, *args, **kwargs)
+        return update_wrapper(new_func, f)
+    if doc_description is None:
+        doc_description = f'the {key!r} key from :attr:`click.Context.meta`'
+    decorator.__doc__ = f'Decorator that passes {doc_description} as the first argument to the decorated function.'
+    return decorator
 CmdType = t.TypeVar('CmdType', bound=Command)
 
 def command(name: t.Union[t.Optional[str], _AnyCallable]=None, cls: t.Optional[t.Type[CmdType]]=None, **attrs: t.Any) -> t.Union[Command, t.Callable[[_AnyCallable], t.Union[Command, CmdType]]]:
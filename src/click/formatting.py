@@ -3,6 +3,8 @@ from contextlib import contextmanager
 from gettext import gettext as _
 from ._compat import term_len
 from .parser import split_opt
+if t.TYPE_CHECKING:
+    from ._textwrap import TextWrapper
 FORCED_WIDTH: t.Optional[int] = None
 
 def wrap_text(text: str, width: int=78, initial_indent: str='', subsequent_indent: str='', preserve_paragraphs: bool=False) -> str:
@@ -23,22 +25,75 @@ def wrap_text(text: str, width: int=78, initial_indent: str='', subsequent_inden
                               each consecutive line.
     :param preserve_paragraphs: if this flag is set then the wrapping will
                                 intelligently handle paragraphs.
+
+    .. versionchanged:: 8.2.0
+        Lines are wrapped in a single pass that measures each word once.
+        ANSI escape sequences don't count towards the width.
+    """
+    from ._textwrap import TextWrapper
+    text = text.expandtabs()
+    wrapper = TextWrapper(width, initial_indent=initial_indent, subsequent_indent=subsequent_indent, replace_whitespace=False)
+    if not preserve_paragraphs:
+        return wrapper.fill(text)
+    return _wrap_paragraphs(wrapper, text)
+
+def _wrap_paragraphs(wrapper: 'TextWrapper', text: str) -> str:
+    """Wrap each paragraph of ``text`` with ``wrapper``, keeping the
+    indentation of its first line. Paragraphs that start with ``\\b``
+    are only indented.
     """
-    pass
+    p: t.List[t.Tuple[int, bool, str]] = []
+    buf: t.List[str] = []
+    indent = None
+
+    def _flush_par() -> None:
+        if not buf:
+            return
+        if buf[0].strip() == '\b':
+            p.append((indent or 0, True, '\n'.join(buf[1:])))
+        else:
+            p.append((indent or 0, False, ' '.join(buf)))
+        del buf[:]
+    for line in text.splitlines():
+        if not line:
+            _flush_par()
+            indent = None
+        else:
+            if indent is None:
+                stripped = line.lstrip()
+                indent = len(line) - len(stripped)
+                line = stripped
+            buf.append(line)
+    _flush_par()
+    rv = []
+    for indent, raw, text in p:
+        with wrapper.extra_indent(' ' * indent):
+            if raw:
+                rv.append(wrapper.indent_only(text))
+            else:
+                rv.append(wrapper.fill(text))
+    return '\n\n'.join(rv)
 
 class HelpFormatter:
     """This class helps with formatting text-based help pages.  It's
     usually just needed for very special internal cases, but it's also
     exposed so that developers can write their own fancy outputs.
 
-    At present, it always writes into memory.
+    By default, it writes into memory and the text is returned by
+    :meth:`getvalue`. If a ``stream`` is given, text is written to the
+    stream as soon as it is formatted and is not kept in memory.
 
     :param indent_increment: the additional increment for each level.
     :param width: the width for the text.  This defaults to the terminal
                   width clamped to a maximum of 78.
+    :param stream: A text stream to write to instead of the internal
+        buffer.
+
+    .. versionchanged:: 8.2.0
+        Added the ``stream`` parameter.
     """
 
-    def __init__(self, indent_increment: int=2, width: t.Optional[int]=None, max_width: t.Optional[int]=None) -> None:
+    def __init__(self, indent_increment: int=2, width: t.Optional[int]=None, max_width: t.Optional[int]=None, stream: t.Optional[t.TextIO]=None) -> None:
         import shutil
         self.indent_increment = indent_increment
         if max_width is None:
@@ -50,18 +105,28 @@ class HelpFormatter:
         self.width = width
         self.current_indent = 0
         self.buffer: t.List[str] = []
+        self.stream = stream
+        self._written = False
 
     def write(self, string: str) -> None:
-        """Writes a unicode string into the internal buffer."""
-        pass
+        """Writes a unicode string into the internal buffer, or to the
+        stream if the formatter has one.
+        """
+        if not string:
+            return
+        self._written = True
+        if self.stream is not None:
+            self.stream.write(string)
+        else:
+            self.buffer.append(string)
 
     def indent(self) -> None:
         """Increases the indentation."""
-        pass
+        self.current_indent += self.indent_increment
 
     def dedent(self) -> None:
         """Decreases the indentation."""
-        pass
+        self.current_indent -= self.indent_increment
 
     def write_usage(self, prog: str, args: str='', prefix: t.Optional[str]=None) -> None:
         """Writes a usage line into the buffer.
@@ -71,21 +136,36 @@ class HelpFormatter:
         :param prefix: The prefix for the first line. Defaults to
             ``"Usage: "``.
         """
-        pass
+        if prefix is None:
+            prefix = f"{_('Usage:')} "
+        usage_prefix = f'{prefix:>{self.current_indent}}{prog} '
+        text_width = self.width - self.current_indent
+        if text_width >= term_len(usage_prefix) + 20:
+            indent = ' ' * term_len(usage_prefix)
+            self.write(wrap_text(args, text_width, initial_indent=usage_prefix, subsequent_indent=indent))
+        else:
+            self.write(usage_prefix)
+            self.write('\n')
+            indent = ' ' * (max(self.current_indent, term_len(prefix)) + 4)
+            self.write(wrap_text(args, text_width, initial_indent=indent, subsequent_indent=indent))
+        self.write('\n')
 
     def write_heading(self, heading: str) -> None:
         """Writes a heading into the buffer."""
-        pass
+        self.write(f"{'':>{self.current_indent}}{heading}:\n")
 
     def write_paragraph(self) -> None:
         """Writes a paragraph into the buffer."""
-        pass
+        if self._written:
+            self.write('\n')
 
     def write_text(self, text: str) -> None:
         """Writes re-indented text into the buffer.  This rewraps and
         preserves paragraphs.
         """
-        pass
+        indent = ' ' * self.current_indent
+        self.write(wrap_text(text, self.width, initial_indent=indent, subsequent_indent=indent, preserve_paragraphs=True))
+        self.write('\n')
 
     def write_dl(self, rows: t.Sequence[t.Tuple[str, str]], col_max: int=30, col_spacing: int=2) -> None:
         """Writes a definition list into the buffer.  This is how options
@@ -95,8 +175,41 @@ class HelpFormatter:
         :param col_max: the maximum width of the first column.
         :param col_spacing: the number of spaces between the first and
                             second column.
+
+        .. versionchanged:: 8.2.0
+            The width of each term is measured once, and one text
+            wrapper is shared by all the rows, so the time taken grows
+            linearly with the number of rows.
         """
-        pass
+        from ._textwrap import TextWrapper
+        rows = list(rows)
+        if max(map(len, rows), default=0) != 2:
+            raise TypeError('Expected two columns for definition list')
+        widths = [term_len(row[0]) if row else 0 for row in rows]
+        first_col = min(max(widths), col_max) + col_spacing
+        text_width = max(self.width - first_col - 2, 10)
+        wrapper = TextWrapper(text_width, replace_whitespace=False)
+        indent = ' ' * self.current_indent
+        subsequent_indent = ' ' * (first_col + self.current_indent)
+        for row, width in zip(rows, widths):
+            first, second = (*row, '', '')[:2]
+            parts = [indent, first]
+            if not second:
+                parts.append('\n')
+                self.write(''.join(parts))
+                continue
+            if width <= first_col - col_spacing:
+                parts.append(' ' * (first_col - width))
+            else:
+                parts.append('\n')
+                parts.append(subsequent_indent)
+            lines = _wrap_paragraphs(wrapper, second.expandtabs()).splitlines()
+            if lines:
+                parts.append(f'{lines[0]}\n')
+                parts.extend((f'{subsequent_indent}{line}\n' for line in lines[1:]))
+            else:
+                parts.append('\n')
+            self.write(''.join(parts))
 
     @contextmanager
     def section(self, name: str) -> t.Iterator[None]:
@@ -105,16 +218,38 @@ class HelpFormatter:
 
         :param name: the section name that is written as heading.
         """
-        pass
+        self.write_paragraph()
+        self.write_heading(name)
+        self.indent()
+        try:
+            yield
+        finally:
+            self.dedent()
 
     @contextmanager
     def indentation(self) -> t.Iterator[None]:
         """A context manager that increases the indentation."""
-        pass
+        self.indent()
+        try:
+            yield
+        finally:
+            self.dedent()
 
     def getvalue(self) -> str:
-        """Returns the buffer contents."""
-        pass
+        """Returns the buffer contents. If the formatter writes to a
+        stream, this is empty.
+        """
+        return ''.join(self.buffer)
+
+    def drain(self) -> str:
+        """Returns the buffer contents and clears the buffer, so text
+        can be passed on while the rest is formatted.
+
+        .. versionadded:: 8.2.0
+        """
+        rv = ''.join(self.buffer)
+        self.buffer.clear()
+        return rv
 
 def join_options(options: t.Sequence[str]) -> t.Tuple[str, bool]:
     """Given a list of option strings this joins them in the most appropriate
@@ -122,4 +257,12 @@ def join_options(options: t.Sequence[str]) -> t.Tuple[str, bool]:
     any_prefix_is_slash)`` where the second item in the tuple is a flag that
     indicates if any of the option prefixes was a slash.
     """
-    pass
\ No newline at end of file
+    rv = []
+    any_prefix_is_slash = False
+    for opt in options:
+        prefix = split_opt(opt)[0]
+        if prefix == '/':
+            any_prefix_is_slash = True
+        rv.append((len(prefix), opt))
+    rv.sort(key=lambda x: x[0])
+    return (', '.join((x[1] for x in rv)), any_prefix_is_slash)
\ No newline at end of file
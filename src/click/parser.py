@@ -21,6 +21,7 @@ import typing as t
 from collections import deque
 from gettext import gettext as _
 from gettext import ngettext
+from types import MappingProxyType
 from .exceptions import BadArgumentUsage
 from .exceptions import BadOptionUsage
 from .exceptions import NoSuchOption
@@ -44,7 +45,60 @@ def _unpack_args(args: t.Sequence[str], nargs_spec: t.Sequence[int]) -> t.Tuple[
 
     Missing items are filled with `None`.
     """
-    pass
+    args = deque(args)
+    nargs_spec = deque(nargs_spec)
+    rv: t.List[t.Union[str, t.Tuple[t.Optional[str], ...], None]] = []
+    spos: t.Optional[int] = None
+
+    def _fetch(c: 'te.Deque[V]') -> t.Optional[V]:
+        try:
+            if spos is None:
+                return c.popleft()
+            else:
+                return c.pop()
+        except IndexError:
+            return None
+    while nargs_spec:
+        nargs = _fetch(nargs_spec)
+        if nargs is None:
+            continue
+        if nargs == 1:
+            rv.append(_fetch(args))
+        elif nargs > 1:
+            x = [_fetch(args) for _ in range(nargs)]
+            if spos is not None:
+                x.reverse()
+            rv.append(tuple(x))
+        elif nargs < 0:
+            if spos is not None:
+                raise TypeError('Cannot have two nargs < 0')
+            spos = len(rv)
+            rv.append(None)
+    if spos is not None:
+        rv[spos] = tuple(args)
+        args = []
+        rv[spos + 1:] = reversed(rv[spos + 1:])
+    return (tuple(rv), list(args))
+
+def split_opt(opt: str) -> t.Tuple[str, str]:
+    """Split an option into its prefix and name, such as ``('--', 'name')``
+    for ``--name``. The prefix is empty if the value isn't an option.
+    """
+    first = opt[:1]
+    if first.isalnum():
+        return ('', opt)
+    if opt[1:2] == first:
+        return (opt[:2], opt[2:])
+    return (first, opt[1:])
+
+def normalize_opt(opt: str, ctx: t.Optional['Context']) -> str:
+    """Apply the context's :attr:`~click.Context.token_normalize_func`
+    to the name of an option, keeping its prefix.
+    """
+    if ctx is None or ctx.token_normalize_func is None:
+        return opt
+    prefix, opt = split_opt(opt)
+    return f'{prefix}{ctx.token_normalize_func(opt)}'
 
 def split_arg_string(string: str) -> t.List[str]:
     """Split an argument string as with :func:`shlex.split`, but don't
@@ -61,7 +115,30 @@ def split_arg_string(string: str) -> t.List[str]:
 
     :param string: String to split.
     """
-    pass
+    return list(_iter_arg_string(string))
+
+def _iter_arg_string(instream: t.Union[str, t.TextIO], strict: bool=False) -> t.Iterator[str]:
+    """Split arguments like :func:`split_arg_string`, yielding each
+    argument as soon as it is read. Reads from a string or from a text
+    stream, without reading the whole stream first.
+
+    :param instream: String or text stream to split.
+    :param strict: Raise :exc:`ValueError` for a missing closing quote
+        or incomplete escape sequence instead of using the partial
+        token.
+
+    .. versionadded:: 8.2.0
+    """
+    import shlex
+    lex = shlex.shlex(instream, posix=True)
+    lex.whitespace_split = True
+    lex.commenters = ''
+    try:
+        yield from lex
+    except ValueError:
+        if strict:
+            raise
+        yield lex.token
 
 class Option:
 
@@ -87,6 +164,25 @@ class Option:
         self.const = const
         self.obj = obj
 
+    @property
+    def takes_value(self) -> bool:
+        return self.action in ('store', 'append')
+
+    def process(self, value: t.Any, state: 'ParsingState') -> None:
+        if self.action == 'store':
+            state.opts[self.dest] = value
+        elif self.action == 'store_const':
+            state.opts[self.dest] = self.const
+        elif self.action == 'append':
+            state.opts.setdefault(self.dest, []).append(value)
+        elif self.action == 'append_const':
+            state.opts.setdefault(self.dest, []).append(self.const)
+        elif self.action == 'count':
+            state.opts[self.dest] = state.opts.get(self.dest, 0) + 1
+        else:
+            raise ValueError(f"unknown action '{self.action}'")
+        state.order.append(self.obj)
+
 class Argument:
 
     def __init__(self, obj: 'CoreArgument', dest: t.Optional[str], nargs: int=1):
@@ -94,6 +190,19 @@ class Argument:
         self.nargs = nargs
         self.obj = obj
 
+    def process(self, value: t.Union[t.Optional[str], t.Sequence[t.Optional[str]]], state: 'ParsingState') -> None:
+        if self.nargs > 1:
+            assert value is not None
+            holes = sum((1 for x in value if x is None))
+            if holes == len(value):
+                value = None
+            elif holes != 0:
+                raise BadArgumentUsage(_('Argument {name!r} takes {nargs} values.').format(name=self.dest, nargs=self.nargs))
+        if self.nargs == -1 and self.obj.envvar is not None and (value == ()):
+            value = None
+        state.opts[self.dest] = value
+        state.order.append(self.obj)
+
 class ParsingState:
 
     def __init__(self, rargs: t.List[str]) -> None:
@@ -102,6 +211,107 @@ class ParsingState:
         self.rargs = rargs
         self.order: t.List['CoreParameter'] = []
 
+class _OptionTrie:
+    """A prefix tree of long option names. Looks up the options that
+    start with a prefix by walking one node per character, instead of
+    comparing the prefix with every option name.
+
+    .. versionadded:: 8.2.0
+    """
+    __slots__ = ('_root',)
+
+    def __init__(self, options: t.Mapping[str, Option]) -> None:
+        self._root: t.Dict[str, t.Any] = {}
+        for name, option in options.items():
+            node = self._root
+            for char in name:
+                node = node.setdefault(char, {})
+            node[''] = (name, option)
+
+    def _walk(self, prefix: str) -> t.Tuple[int, t.Dict[str, t.Any]]:
+        """Follow the prefix as far as it matches. Return the number of
+        matched characters and the node reached.
+        """
+        node = self._root
+        for index, char in enumerate(prefix):
+            child = node.get(char)
+            if child is None:
+                return (index, node)
+            node = child
+        return (len(prefix), node)
+
+    @staticmethod
+    def _iter_node(node: t.Dict[str, t.Any], skip: t.Optional[t.Dict[str, t.Any]]=None) -> t.Iterator[t.Tuple[str, Option]]:
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for char, child in node.items():
+                if not char:
+                    yield child
+                elif child is not skip:
+                    stack.append(child)
+
+    def match_prefix(self, prefix: str) -> t.List[t.Tuple[str, Option]]:
+        """Return the names and options that start with the prefix,
+        sorted by name.
+        """
+        matched, node = self._walk(prefix)
+        if matched < len(prefix):
+            return []
+        return sorted(self._iter_node(node), key=lambda item: item[0])
+
+    def close_matches(self, name: str) -> t.List[str]:
+        """Suggest up to three option names that are similar to
+        ``name``. The names that share the longest prefix with it are
+        compared first, and shorter prefixes are only tried until three
+        suggestions are found, so a typo is usually only compared with
+        the options that start the same way. Each name is compared at
+        most once.
+        """
+        from difflib import get_close_matches
+        path = [self._root]
+        for char in name:
+            child = path[-1].get(char)
+            if child is None:
+                break
+            path.append(child)
+        possibilities: t.List[str] = []
+        skip = None
+        for node in reversed(path):
+            candidates = [n for n, _ in self._iter_node(node, skip)]
+            possibilities.extend(get_close_matches(name, candidates, n=3 - len(possibilities)))
+            if len(possibilities) == 3:
+                break
+            skip = node
+        return possibilities
+
+class _ParserPlan:
+    """An immutable snapshot of the options and arguments registered
+    on an :class:`OptionParser`. Option strings are split and normalized
+    once when the plan is compiled, parsers created from the plan with
+    :meth:`OptionParser.from_plan` only copy the lookup tables.
+
+    .. versionadded:: 8.2.0
+    """
+    __slots__ = ('short_opt', 'long_opt', '_long_opt_trie', 'opt_prefixes', 'args')
+
+    def __init__(self, short_opt: t.Mapping[str, Option], long_opt: t.Mapping[str, Option], opt_prefixes: t.Iterable[str], args: t.Iterable[Argument]) -> None:
+        self.short_opt: t.Mapping[str, Option] = MappingProxyType(dict(short_opt))
+        self.long_opt: t.Mapping[str, Option] = MappingProxyType(dict(long_opt))
+        self._long_opt_trie: t.Optional[_OptionTrie] = None
+        self.opt_prefixes: t.FrozenSet[str] = frozenset(opt_prefixes)
+        self.args: t.Tuple[Argument, ...] = tuple(args)
+
+    @property
+    def long_opt_trie(self) -> _OptionTrie:
+        """The prefix tree of :attr:`long_opt`. It is only built when an
+        option needs to be matched by prefix or suggested, and is then
+        shared by all parsers created from the plan.
+        """
+        if self._long_opt_trie is None:
+            self._long_opt_trie = _OptionTrie(self.long_opt)
+        return self._long_opt_trie
+
 class OptionParser:
     """The option parser is an internal class that is ultimately used to
     parse options and arguments.  It's modelled after optparse and brings
@@ -114,17 +324,25 @@ class OptionParser:
 
     :param ctx: optionally the :class:`~click.Context` where this parser
                 should go with.
+
+    .. versionchanged:: 8.2.0
+        Long options can be abbreviated to an unambiguous prefix if
+        :attr:`allow_abbreviated_options` is enabled.
     """
 
     def __init__(self, ctx: t.Optional['Context']=None) -> None:
         self.ctx = ctx
         self.allow_interspersed_args: bool = True
         self.ignore_unknown_options: bool = False
+        self.allow_abbreviated_options: bool = False
         if ctx is not None:
             self.allow_interspersed_args = ctx.allow_interspersed_args
             self.ignore_unknown_options = ctx.ignore_unknown_options
+            self.allow_abbreviated_options = ctx.allow_abbreviated_options
         self._short_opt: t.Dict[str, Option] = {}
         self._long_opt: t.Dict[str, Option] = {}
+        self._long_opt_trie: t.Optional[_OptionTrie] = None
+        self._plan: t.Optional[_ParserPlan] = None
         self._opt_prefixes = {'-', '--'}
         self._args: t.List[Argument] = []
 
@@ -137,7 +355,16 @@ class OptionParser:
         The `obj` can be used to identify the option in the order list
         that is returned from the parser.
         """
-        pass
+        opts = [normalize_opt(opt, self.ctx) for opt in opts]
+        option = Option(obj, opts, dest, action=action, nargs=nargs, const=const)
+        self._opt_prefixes.update(option.prefixes)
+        for opt in option._short_opts:
+            self._short_opt[opt] = option
+        for opt in option._long_opts:
+            self._long_opt[opt] = option
+        if option._long_opts:
+            self._long_opt_trie = None
+            self._plan = None
 
     def add_argument(self, obj: 'CoreArgument', dest: t.Optional[str], nargs: int=1) -> None:
         """Adds a positional argument named `dest` to the parser.
@@ -145,7 +372,7 @@ class OptionParser:
         The `obj` can be used to identify the option in the order list
         that is returned from the parser.
         """
-        pass
+        self._args.append(Argument(obj, dest=dest, nargs=nargs))
 
     def parse_args(self, args: t.List[str]) -> t.Tuple[t.Dict[str, t.Any], t.List[str], t.List['CoreParameter']]:
         """Parses positional arguments and returns ``(values, args, order)``
@@ -154,4 +381,154 @@ class OptionParser:
         appear on the command line.  If arguments appear multiple times they
         will be memorized multiple times as well.
         """
-        pass
\ No newline at end of file
+        state = ParsingState(args)
+        try:
+            self._process_args_for_options(state)
+            self._process_args_for_args(state)
+        except UsageError:
+            if self.ctx is None or not self.ctx.resilient_parsing:
+                raise
+        return (state.opts, state.largs, state.order)
+
+    def _process_args_for_args(self, state: ParsingState) -> None:
+        pargs, args = _unpack_args(state.largs + state.rargs, [x.nargs for x in self._args])
+        for idx, arg in enumerate(self._args):
+            arg.process(pargs[idx], state)
+        state.largs = args
+        state.rargs = []
+
+    def _process_args_for_options(self, state: ParsingState) -> None:
+        while state.rargs:
+            arg = state.rargs.pop(0)
+            arglen = len(arg)
+            if arg == '--':
+                return
+            elif arg[:1] in self._opt_prefixes and arglen > 1:
+                self._process_opts(arg, state)
+            elif self.allow_interspersed_args:
+                state.largs.append(arg)
+            else:
+                state.rargs.insert(0, arg)
+                return
+
+    def _get_long_opt_trie(self) -> _OptionTrie:
+        if self._long_opt_trie is None:
+            if self._plan is not None:
+                self._long_opt_trie = self._plan.long_opt_trie
+            else:
+                self._long_opt_trie = _OptionTrie(self._long_opt)
+        return self._long_opt_trie
+
+    def _match_long_opt(self, opt: str, explicit_value: t.Optional[str], state: ParsingState) -> None:
+        option = self._long_opt.get(opt)
+        if option is None:
+            prefix, name = split_opt(opt)
+            if self.allow_abbreviated_options and len(prefix) > 1 and name:
+                matches = self._get_long_opt_trie().match_prefix(opt)
+                if len({id(o) for _, o in matches}) > 1:
+                    raise BadOptionUsage(opt, _('Option {name!r} is ambiguous, it could be {possibilities}.').format(name=opt, possibilities=', '.join((n for n, _ in matches))), ctx=self.ctx)
+                if matches:
+                    opt, option = matches[0]
+            if option is None:
+                possibilities = self._get_long_opt_trie().close_matches(opt)
+                raise NoSuchOption(opt, possibilities=possibilities, ctx=self.ctx)
+        if option.takes_value:
+            if explicit_value is not None:
+                state.rargs.insert(0, explicit_value)
+            value = self._get_value_from_state(opt, option, state)
+        elif explicit_value is not None:
+            raise BadOptionUsage(opt, _('Option {name!r} does not take a value.').format(name=opt))
+        else:
+            value = None
+        option.process(value, state)
+
+    def _match_short_opt(self, arg: str, state: ParsingState) -> None:
+        stop = False
+        i = 1
+        prefix = arg[0]
+        unknown_options = []
+        for ch in arg[1:]:
+            opt = normalize_opt(f'{prefix}{ch}', self.ctx)
+            option = self._short_opt.get(opt)
+            i += 1
+            if not option:
+                if self.ignore_unknown_options:
+                    unknown_options.append(ch)
+                    continue
+                raise NoSuchOption(opt, ctx=self.ctx)
+            if option.takes_value:
+                if i < len(arg):
+                    state.rargs.insert(0, arg[i:])
+                    stop = True
+                value = self._get_value_from_state(opt, option, state)
+            else:
+                value = None
+            option.process(value, state)
+            if stop:
+                break
+        if self.ignore_unknown_options and unknown_options:
+            state.largs.append(f"{prefix}{''.join(unknown_options)}")
+
+    def _get_value_from_state(self, option_name: str, option: Option, state: ParsingState) -> t.Any:
+        nargs = option.nargs
+        if len(state.rargs) < nargs:
+            if option.obj._flag_needs_value:
+                value = _flag_needs_value
+            else:
+                raise BadOptionUsage(option_name, ngettext('Option {name!r} requires an argument.', 'Option {name!r} requires {nargs} arguments.', nargs).format(name=option_name, nargs=nargs))
+        elif nargs == 1:
+            next_rarg = state.rargs[0]
+            if option.obj._flag_needs_value and isinstance(next_rarg, str) and (next_rarg[:1] in self._opt_prefixes) and (len(next_rarg) > 1):
+                value = _flag_needs_value
+            else:
+                value = state.rargs.pop(0)
+        else:
+            value = tuple(state.rargs[:nargs])
+            del state.rargs[:nargs]
+        return value
+
+    def _process_opts(self, arg: str, state: ParsingState) -> None:
+        explicit_value = None
+        if '=' in arg:
+            long_opt, explicit_value = arg.split('=', 1)
+        else:
+            long_opt = arg
+        norm_long_opt = normalize_opt(long_opt, self.ctx)
+        try:
+            self._match_long_opt(norm_long_opt, explicit_value, state)
+        except NoSuchOption:
+            if arg[:2] not in self._opt_prefixes:
+                self._match_short_opt(arg, state)
+                return
+            if not self.ignore_unknown_options:
+                raise
+            state.largs.append(arg)
+
+    def compile(self) -> _ParserPlan:
+        """Freeze the options and arguments registered so far into a
+        plan that :meth:`from_plan` can use to create equivalent parsers
+        without registering everything again.
+
+        .. versionadded:: 8.2.0
+        """
+        return _ParserPlan(self._short_opt, self._long_opt, self._opt_prefixes, self._args)
+
+    @classmethod
+    def from_plan(cls, plan: _ParserPlan, ctx: t.Optional['Context']=None) -> 'OptionParser':
+        """Create a parser for the given context that uses the options
+        and arguments of a plan returned by :meth:`compile`. The parser
+        can still be extended with :meth:`add_option` and
+        :meth:`add_argument` without affecting the plan.
+
+        :param plan: The compiled parser plan.
+        :param ctx: The context the parser is used with.
+
+        .. versionadded:: 8.2.0
+        """
+        parser = cls(ctx)
+        parser._short_opt = dict(plan.short_opt)
+        parser._long_opt = dict(plan.long_opt)
+        parser._plan = plan
+        parser._opt_prefixes = set(plan.opt_prefixes)
+        parser._args = list(plan.args)
+        return parser
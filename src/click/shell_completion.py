@@ -1,16 +1,24 @@
 import os
 import re
+import sys
 import typing as t
 from gettext import gettext as _
 from .core import Argument
 from .core import BaseCommand
+from .core import Command
 from .core import Context
 from .core import MultiCommand
 from .core import Option
 from .core import Parameter
 from .core import ParameterSource
 from .parser import split_arg_string
+from .types import Choice
+from .types import File
+from .types import ParamType
+from .types import Path
 from .utils import echo
+from .utils import get_app_dir
+from .utils import make_default_short_help
 
 def shell_complete(cli: BaseCommand, ctx_args: t.MutableMapping[str, t.Any], prog_name: str, complete_var: str, instruction: str) -> int:
     """Perform shell completion for the given CLI program.
@@ -24,8 +32,25 @@ def shell_complete(cli: BaseCommand, ctx_args: t.MutableMapping[str, t.Any], pro
     :param instruction: Value of ``complete_var`` with the completion
         instruction and shell, in the form ``instruction_shell``.
     :return: Status code to exit with.
+
+    .. versionchanged:: 8.2.0
+        Added the ``source_static`` instruction.
     """
-    pass
+    shell, _, instruction = instruction.partition('_')
+    comp_cls = get_completion_class(shell)
+    if comp_cls is None:
+        return 1
+    comp = comp_cls(cli, ctx_args, prog_name, complete_var)
+    if instruction == 'source':
+        echo(comp.source())
+        return 0
+    if instruction == 'source_static':
+        echo(comp.static_source())
+        return 0
+    if instruction == 'complete':
+        echo(comp.complete())
+        return 0
+    return 1
 
 class CompletionItem:
     """Represents a completion value and metadata about the value. The
@@ -58,6 +83,9 @@ class CompletionItem:
 _SOURCE_BASH = '%(complete_func)s() {\n    local IFS=$\'\\n\'\n    local response\n\n    response=$(env COMP_WORDS="${COMP_WORDS[*]}" COMP_CWORD=$COMP_CWORD %(complete_var)s=bash_complete $1)\n\n    for completion in $response; do\n        IFS=\',\' read type value <<< "$completion"\n\n        if [[ $type == \'dir\' ]]; then\n            COMPREPLY=()\n            compopt -o dirnames\n        elif [[ $type == \'file\' ]]; then\n            COMPREPLY=()\n            compopt -o default\n        elif [[ $type == \'plain\' ]]; then\n            COMPREPLY+=($value)\n        fi\n    done\n\n    return 0\n}\n\n%(complete_func)s_setup() {\n    complete -o nosort -F %(complete_func)s %(prog_name)s\n}\n\n%(complete_func)s_setup;\n'
 _SOURCE_ZSH = '#compdef %(prog_name)s\n\n%(complete_func)s() {\n    local -a completions\n    local -a completions_with_descriptions\n    local -a response\n    (( ! $+commands[%(prog_name)s] )) && return 1\n\n    response=("${(@f)$(env COMP_WORDS="${words[*]}" COMP_CWORD=$((CURRENT-1)) %(complete_var)s=zsh_complete %(prog_name)s)}")\n\n    for type key descr in ${response}; do\n        if [[ "$type" == "plain" ]]; then\n            if [[ "$descr" == "_" ]]; then\n                completions+=("$key")\n            else\n                completions_with_descriptions+=("$key":"$descr")\n            fi\n        elif [[ "$type" == "dir" ]]; then\n            _path_files -/\n        elif [[ "$type" == "file" ]]; then\n            _path_files -f\n        fi\n    done\n\n    if [ -n "$completions_with_descriptions" ]; then\n        _describe -V unsorted completions_with_descriptions -U\n    fi\n\n    if [ -n "$completions" ]; then\n        compadd -U -V unsorted -a completions\n    fi\n}\n\nif [[ $zsh_eval_context[-1] == loadautofunc ]]; then\n    # autoload from fpath, call function directly\n    %(complete_func)s "$@"\nelse\n    # eval/source/. command, register function for later\n    compdef %(complete_func)s %(prog_name)s\nfi\n'
 _SOURCE_FISH = 'function %(complete_func)s;\n    set -l response (env %(complete_var)s=fish_complete COMP_WORDS=(commandline -cp) COMP_CWORD=(commandline -t) %(prog_name)s);\n\n    for completion in $response;\n        set -l metadata (string split "," $completion);\n\n        if test $metadata[1] = "dir";\n            __fish_complete_directories $metadata[2];\n        else if test $metadata[1] = "file";\n            __fish_complete_path $metadata[2];\n        else if test $metadata[1] = "plain";\n            echo $metadata[2];\n        end;\n    end;\nend;\n\ncomplete --no-files --command %(prog_name)s --arguments "(%(complete_func)s)";\n'
+_SOURCE_BASH_STATIC = '%(complete_func)s_dynamic() {\n    local IFS=$\'\\n\'\n    local response\n\n    response=$(env COMP_WORDS="${COMP_WORDS[*]}" COMP_CWORD=$COMP_CWORD %(complete_var)s=bash_complete $1)\n\n    for completion in $response; do\n        IFS=\',\' read type value <<< "$completion"\n\n        if [[ $type == \'dir\' ]]; then\n            COMPREPLY=()\n            compopt -o dirnames\n        elif [[ $type == \'file\' ]]; then\n            COMPREPLY=()\n            compopt -o default\n        elif [[ $type == \'plain\' ]]; then\n            COMPREPLY+=($value)\n        fi\n    done\n}\n\n%(complete_func)s() {\n    local cur="${COMP_WORDS[COMP_CWORD]}"\n    local prev="${COMP_WORDS[COMP_CWORD-1]}"\n    local cmd_path=""\n    local i\n    COMPREPLY=()\n\n    for ((i=1; i<COMP_CWORD; i++)); do\n        case "$cmd_path ${COMP_WORDS[i]}" in\n%(descend)s\n        esac\n    done\n\n    case "$cmd_path $prev" in\n%(option_values)s\n    esac\n\n    case "$cmd_path" in\n%(words)s\n    esac\n\n    return 0\n}\n\ncomplete -o nosort -F %(complete_func)s %(prog_name)s\n'
+_SOURCE_ZSH_STATIC = '#compdef %(prog_name)s\n\n%(complete_func)s_dynamic() {\n    local -a completions\n    local -a completions_with_descriptions\n    local -a response\n    (( ! $+commands[%(prog_name)s] )) && return 1\n\n    response=("${(@f)$(env COMP_WORDS="${words[*]}" COMP_CWORD=$((CURRENT-1)) %(complete_var)s=zsh_complete %(prog_name)s)}")\n\n    for type key descr in ${response}; do\n        if [[ "$type" == "plain" ]]; then\n            if [[ "$descr" == "_" ]]; then\n                completions+=("$key")\n            else\n                completions_with_descriptions+=("$key":"$descr")\n            fi\n        elif [[ "$type" == "dir" ]]; then\n            _path_files -/\n        elif [[ "$type" == "file" ]]; then\n            _path_files -f\n        fi\n    done\n\n    if [ -n "$completions_with_descriptions" ]; then\n        _describe -V unsorted completions_with_descriptions -U\n    fi\n\n    if [ -n "$completions" ]; then\n        compadd -U -V unsorted -a completions\n    fi\n}\n\n%(complete_func)s() {\n    local cur="${words[CURRENT]}"\n    local prev="${words[CURRENT-1]}"\n    local cmd_path=""\n    local i\n\n    for ((i=2; i<CURRENT; i++)); do\n        case "$cmd_path ${words[i]}" in\n%(descend)s\n        esac\n    done\n\n    case "$cmd_path $prev" in\n%(option_values)s\n    esac\n\n    case "$cmd_path" in\n%(words)s\n    esac\n}\n\nif [[ $zsh_eval_context[-1] == loadautofunc ]]; then\n    # autoload from fpath, call function directly\n    %(complete_func)s "$@"\nelse\n    # eval/source/. command, register function for later\n    compdef %(complete_func)s %(prog_name)s\nfi\n'
+_SOURCE_FISH_STATIC = 'function %(complete_func)s_dynamic;\n    set -l response (env %(complete_var)s=fish_complete COMP_WORDS=(commandline -cp) COMP_CWORD=(commandline -t) %(prog_name)s);\n\n    for completion in $response;\n        set -l metadata (string split "," $completion);\n\n        if test $metadata[1] = "dir";\n            __fish_complete_directories $metadata[2];\n        else if test $metadata[1] = "file";\n            __fish_complete_path $metadata[2];\n        else if test $metadata[1] = "plain";\n            echo $metadata[2];\n        end;\n    end;\nend;\n\nfunction %(complete_func)s_path;\n    set -l cmd_path "";\n\n    set -l words (commandline -opc);\n    set -e words[1];\n\n    for word in $words;\n        switch "$cmd_path $word";\n%(descend)s\n        end;\n    end;\n\n    echo "$cmd_path";\nend;\n\ncomplete --no-files --command %(prog_name)s;\n%(completions)s\n'
 
 class ShellComplete:
     """Base class for providing shell completion support. A subclass for
@@ -75,6 +103,8 @@ class ShellComplete:
     'Name to register the shell as with :func:`add_completion_class`.\n    This is used in completion instructions (``{name}_source`` and\n    ``{name}_complete``).\n    '
     source_template: t.ClassVar[str]
     'Completion script template formatted by :meth:`source`. This must\n    be provided by subclasses.\n    '
+    static_source_template: t.ClassVar[t.Optional[str]] = None
+    'Completion script template formatted by :meth:`static_source`.\n    Shells that don\'t support static completion leave this as ``None``.\n\n    .. versionadded:: 8.2.0\n    '
 
     def __init__(self, cli: BaseCommand, ctx_args: t.MutableMapping[str, t.Any], prog_name: str, complete_var: str) -> None:
         self.cli = cli
@@ -87,7 +117,8 @@ class ShellComplete:
         """The name of the shell function defined by the completion
         script.
         """
-        pass
+        safe_name = re.sub('\\W*', '', self.prog_name.replace('-', '_'), flags=re.ASCII)
+        return f'_{safe_name}_completion'
 
     def source_vars(self) -> t.Dict[str, t.Any]:
         """Vars for formatting :attr:`source_template`.
@@ -95,7 +126,7 @@ class ShellComplete:
         By default this provides ``complete_func``, ``complete_var``,
         and ``prog_name``.
         """
-        pass
+        return {'complete_func': self.func_name, 'complete_var': self.complete_var, 'prog_name': self.prog_name}
 
     def source(self) -> str:
         """Produce the shell script that defines the completion
@@ -103,7 +134,35 @@ class ShellComplete:
         :attr:`source_template` with the dict returned by
         :meth:`source_vars`.
         """
-        pass
+        return self.source_template % self.source_vars()
+
+    def get_command_tree(self) -> t.Dict[str, t.Any]:
+        """Serialize the command tree for static completion. This loads
+        every subcommand, but doesn't invoke any callbacks.
+
+        .. versionadded:: 8.2.0
+        """
+        with Context(self.cli, info_name=self.prog_name, resilient_parsing=True) as ctx:
+            return _dump_command(ctx)
+
+    def static_source_vars(self) -> t.Dict[str, t.Any]:
+        """Vars for formatting :attr:`static_source_template`. This must
+        be implemented by subclasses that support static completion.
+
+        .. versionadded:: 8.2.0
+        """
+        raise NotImplementedError
+
+    def static_source(self) -> str:
+        """Produce a shell script that completes commands, options,
+        choices, and paths without calling the program. Parameters with
+        custom completion still call the program, like :meth:`source`.
+
+        .. versionadded:: 8.2.0
+        """
+        if self.static_source_template is None:
+            raise NotImplementedError(f'{self.name!r} does not support static completion.')
+        return self.static_source_template % self.static_source_vars()
 
     def get_completion_args(self) -> t.Tuple[t.List[str], str]:
         """Use the env vars defined by the shell script to return a
@@ -120,7 +179,9 @@ class ShellComplete:
         :param args: List of complete args before the incomplete value.
         :param incomplete: Value being completed. May be empty.
         """
-        pass
+        ctx = _resolve_context(self.cli, self.ctx_args, self.prog_name, args)
+        obj, incomplete = _resolve_incomplete(ctx, args, incomplete)
+        return obj.shell_complete(ctx, incomplete)
 
     def format_completion(self, item: CompletionItem) -> str:
         """Format a completion item into the form recognized by the
@@ -137,22 +198,151 @@ class ShellComplete:
         completions, then calls :meth:`format_completion` for each
         completion.
         """
-        pass
+        args, incomplete = self.get_completion_args()
+        completions = self.get_completions(args, incomplete)
+        out = [self.format_completion(item) for item in completions]
+        return '\n'.join(out)
 
 class BashComplete(ShellComplete):
     """Shell completion for Bash."""
     name = 'bash'
     source_template = _SOURCE_BASH
+    static_source_template = _SOURCE_BASH_STATIC
+
+    def get_completion_args(self) -> t.Tuple[t.List[str], str]:
+        cwords = split_arg_string(os.environ['COMP_WORDS'])
+        cword = int(os.environ['COMP_CWORD'])
+        args = cwords[1:cword]
+        try:
+            incomplete = cwords[cword]
+        except IndexError:
+            incomplete = ''
+        return (args, incomplete)
+
+    def format_completion(self, item: CompletionItem) -> str:
+        return f'{item.type},{item.value}'
+
+    def static_source_vars(self) -> t.Dict[str, t.Any]:
+        return {**self.source_vars(), **_static_case_vars(self.get_command_tree(), self._static_reply)}
+
+    def _static_reply(self, words: t.List[str], kinds: t.Set[str]) -> t.List[str]:
+        import shlex
+        if 'dynamic' in kinds:
+            return [f'{self.func_name}_dynamic "$1"']
+        lines = []
+        if words:
+            lines.append(f"COMPREPLY+=($(compgen -W {shlex.quote(' '.join(words))} -- \"$cur\"))")
+        if 'file' in kinds:
+            lines.append('compopt -o default')
+        elif 'dir' in kinds:
+            lines.append('compopt -o dirnames')
+        return lines
 
 class ZshComplete(ShellComplete):
     """Shell completion for Zsh."""
     name = 'zsh'
     source_template = _SOURCE_ZSH
+    static_source_template = _SOURCE_ZSH_STATIC
+
+    def get_completion_args(self) -> t.Tuple[t.List[str], str]:
+        cwords = split_arg_string(os.environ['COMP_WORDS'])
+        cword = int(os.environ['COMP_CWORD'])
+        args = cwords[1:cword]
+        try:
+            incomplete = cwords[cword]
+        except IndexError:
+            incomplete = ''
+        return (args, incomplete)
+
+    def format_completion(self, item: CompletionItem) -> str:
+        return f"{item.type}\n{item.value}\n{(item.help if item.help else '_')}"
+
+    def static_source_vars(self) -> t.Dict[str, t.Any]:
+        return {**self.source_vars(), **_static_case_vars(self.get_command_tree(), self._static_reply)}
+
+    def _static_reply(self, words: t.List[str], kinds: t.Set[str]) -> t.List[str]:
+        import shlex
+        if 'dynamic' in kinds:
+            return [f'{self.func_name}_dynamic']
+        lines = []
+        if words:
+            lines.append(f"compadd -- {' '.join((shlex.quote(word) for word in words))}")
+        if 'file' in kinds:
+            lines.append('_path_files -f')
+        elif 'dir' in kinds:
+            lines.append('_path_files -/')
+        return lines
 
 class FishComplete(ShellComplete):
     """Shell completion for Fish."""
     name = 'fish'
     source_template = _SOURCE_FISH
+    static_source_template = _SOURCE_FISH_STATIC
+
+    def get_completion_args(self) -> t.Tuple[t.List[str], str]:
+        cwords = split_arg_string(os.environ['COMP_WORDS'])
+        incomplete = os.environ['COMP_CWORD']
+        args = cwords[1:]
+        if incomplete and args and (args[-1] == incomplete):
+            args.pop()
+        return (args, incomplete)
+
+    def format_completion(self, item: CompletionItem) -> str:
+        if item.help:
+            return f'{item.type},{item.value}\t{item.help}'
+        return f'{item.type},{item.value}'
+
+    def static_source_vars(self) -> t.Dict[str, t.Any]:
+        descend = []
+        completions = []
+        for path, node, siblings in _iter_static_nodes(self.get_command_tree()):
+            parent = path.rpartition(' ')[0]
+            targets = [(f'{path} {name}', f'{path} {name}') for name in node['commands']]
+            targets.extend(((f'{path} {name}', f'{parent} {name}') for name in siblings))
+            for pattern, target in targets:
+                descend.append(f'            case {_fish_quote(pattern)};\n                set cmd_path {_fish_quote(target)};')
+            condition = _fish_quote(f'test ({self.func_name}_path) = {_fish_quote(path)}')
+            prefix = f'complete --command {self.prog_name} --condition {condition}'
+            for name, sub in (*node['commands'].items(), *siblings.items()):
+                if not sub['hidden']:
+                    completions.append(f"{prefix} --arguments {_fish_quote(_fish_quote(name))}{self._static_description(sub['help'])};")
+            for option in node['options']:
+                names = []
+                for opt in option['opts']:
+                    if opt.startswith('--'):
+                        names.append(f'--long-option {_fish_quote(opt[2:])}')
+                    elif opt.startswith('-') and len(opt) == 2:
+                        names.append(f'--short-option {_fish_quote(opt[1:])}')
+                    elif opt.startswith('-'):
+                        names.append(f'--old-option {_fish_quote(opt[1:])}')
+                if option['hidden'] or not names:
+                    continue
+                value = ''
+                if not option['flag']:
+                    value = f" --require-parameter{self._static_reply(*_static_values([option['completion']]))}"
+                completions.append(f"{prefix} {' '.join(names)}{value}{self._static_description(option['help'])};")
+            if node['arguments']:
+                reply = self._static_reply(*_static_values([argument['completion'] for argument in node['arguments']]))
+                if reply:
+                    completions.append(f'{prefix}{reply};')
+        return {**self.source_vars(), 'descend': '\n'.join(descend), 'completions': '\n'.join(completions)}
+
+    def _static_reply(self, words: t.List[str], kinds: t.Set[str]) -> str:
+        if 'dynamic' in kinds:
+            return f" --arguments '({self.func_name}_dynamic)'"
+        reply = ''
+        if words:
+            reply += f" --arguments {_fish_quote(' '.join((_fish_quote(word) for word in words)))}"
+        if 'file' in kinds:
+            reply += ' --force-files'
+        elif 'dir' in kinds:
+            reply += " --arguments '(__fish_complete_directories)'"
+        return reply
+
+    def _static_description(self, help: t.Optional[str]) -> str:
+        if not help:
+            return ''
+        return f' --description {_fish_quote(make_default_short_help(help))}'
 ShellCompleteType = t.TypeVar('ShellCompleteType', bound=t.Type[ShellComplete])
 _available_shells: t.Dict[str, t.Type[ShellComplete]] = {'bash': BashComplete, 'fish': FishComplete, 'zsh': ZshComplete}
 
@@ -175,7 +365,7 @@ def get_completion_class(shell: str) -> t.Optional[t.Type[ShellComplete]]:
 
     :param shell: Name the class is registered under.
     """
-    pass
+    return _available_shells.get(shell)
 
 def _is_incomplete_argument(ctx: Context, param: Parameter) -> bool:
     """Determine if the given parameter is an argument that can still
@@ -185,11 +375,18 @@ def _is_incomplete_argument(ctx: Context, param: Parameter) -> bool:
         parsed complete args.
     :param param: Argument object being checked.
     """
-    pass
+    if not isinstance(param, Argument):
+        return False
+    assert param.name is not None
+    value = ctx.params[param.name]
+    return param.nargs == -1 or ctx.get_parameter_source(param.name) is not ParameterSource.COMMANDLINE or (param.nargs > 1 and isinstance(value, (tuple, list)) and (len(value) < param.nargs))
 
 def _start_of_option(ctx: Context, value: str) -> bool:
     """Check if the value looks like the start of an option."""
-    pass
+    if not value:
+        return False
+    c = value[0]
+    return c in ctx._opt_prefixes
 
 def _is_incomplete_option(ctx: Context, args: t.List[str], param: Parameter) -> bool:
     """Determine if the given parameter is an option that needs a value.
@@ -197,7 +394,17 @@ def _is_incomplete_option(ctx: Context, args: t.List[str], param: Parameter) ->
     :param args: List of complete args before the incomplete value.
     :param param: Option object being checked.
     """
-    pass
+    if not isinstance(param, Option):
+        return False
+    if param.is_flag or param.count:
+        return False
+    last_option = None
+    for index, arg in enumerate(reversed(args)):
+        if index + 1 > param.nargs:
+            break
+        if _start_of_option(ctx, arg):
+            last_option = arg
+    return last_option is not None and last_option in param.opts
 
 def _resolve_context(cli: BaseCommand, ctx_args: t.MutableMapping[str, t.Any], prog_name: str, args: t.List[str]) -> Context:
     """Produce the context hierarchy starting with the command and
@@ -208,7 +415,31 @@ def _resolve_context(cli: BaseCommand, ctx_args: t.MutableMapping[str, t.Any], p
     :param prog_name: Name of the executable in the shell.
     :param args: List of complete args before the incomplete value.
     """
-    pass
+    ctx_args['resilient_parsing'] = True
+    ctx = cli.make_context(prog_name, args.copy(), **ctx_args)
+    args = ctx.protected_args + ctx.args
+    while args:
+        command = ctx.command
+        if isinstance(command, MultiCommand):
+            if not command.chain:
+                name, cmd, args = command.resolve_command(ctx, args)
+                if cmd is None:
+                    return ctx
+                ctx = cmd.make_context(name, args, parent=ctx, resilient_parsing=True)
+                args = ctx.protected_args + ctx.args
+            else:
+                sub_ctx = ctx
+                while args:
+                    name, cmd, args = command.resolve_command(ctx, args)
+                    if cmd is None:
+                        return ctx
+                    sub_ctx = cmd.make_context(name, args, parent=ctx, allow_extra_args=True, allow_interspersed_args=False, resilient_parsing=True)
+                    args = sub_ctx.args
+                ctx = sub_ctx
+                args = [*sub_ctx.protected_args, *sub_ctx.args]
+        else:
+            break
+    return ctx
 
 def _resolve_incomplete(ctx: Context, args: t.List[str], incomplete: str) -> t.Tuple[t.Union[BaseCommand, Parameter], str]:
     """Find the Click object that will handle the completion of the
@@ -219,4 +450,389 @@ def _resolve_incomplete(ctx: Context, args: t.List[str], incomplete: str) -> t.T
     :param args: List of complete args before the incomplete value.
     :param incomplete: Value being completed. May be empty.
     """
-    pass
\ No newline at end of file
+    if incomplete == '=':
+        incomplete = ''
+    elif '=' in incomplete and _start_of_option(ctx, incomplete):
+        name, _, incomplete = incomplete.partition('=')
+        args.append(name)
+    if '--' not in args and _start_of_option(ctx, incomplete):
+        return (ctx.command, incomplete)
+    params = ctx.command.get_params(ctx)
+    for param in params:
+        if _is_incomplete_option(ctx, args, param):
+            return (param, incomplete)
+    for param in params:
+        if _is_incomplete_argument(ctx, param):
+            return (param, incomplete)
+    return (ctx.command, incomplete)
+
+def _completion_spec(param: Parameter) -> t.Dict[str, t.Any]:
+    """Describe how the values of a parameter are completed, in a form
+    that can be stored as JSON.
+    """
+    if param._custom_shell_complete is not None:
+        return {'type': 'dynamic'}
+    param_type = param.type
+    if isinstance(param_type, Choice) and type(param_type).shell_complete is Choice.shell_complete:
+        return {'type': 'choice', 'choices': [str(c) for c in param_type.choices], 'case_sensitive': param_type.case_sensitive}
+    if isinstance(param_type, File) and type(param_type).shell_complete is File.shell_complete:
+        return {'type': 'file'}
+    if isinstance(param_type, Path) and type(param_type).shell_complete is Path.shell_complete:
+        return {'type': 'dir' if param_type.dir_okay and (not param_type.file_okay) else 'file'}
+    if type(param_type).shell_complete is ParamType.shell_complete:
+        return {'type': 'plain'}
+    return {'type': 'dynamic'}
+
+def _source_file(command: BaseCommand) -> t.Optional[str]:
+    """Return the file of the module that defines a command's callback,
+    or its class if it has no callback.
+    """
+    obj: t.Any = getattr(command, 'callback', None) or type(command)
+    module = sys.modules.get(getattr(obj, '__module__', None) or '')
+    return getattr(module, '__file__', None)
+
+def _dump_command(ctx: Context, sources: t.Optional[t.Set[str]]=None) -> t.Dict[str, t.Any]:
+    """Serialize the parts of a command tree that are needed for static
+    completion: names, options, arguments, help, and completion specs.
+    This loads every subcommand.
+
+    :param ctx: Context for the command to serialize.
+    :param sources: If given, the files of the modules that define the
+        commands are added to it.
+    """
+    command = ctx.command
+    if sources is not None:
+        source = _source_file(command)
+        if source is not None:
+            sources.add(source)
+    node: t.Dict[str, t.Any] = {'name': ctx.info_name, 'help': None, 'hidden': False, 'chain': False, 'prefixes': ['-'], 'options': [], 'arguments': [], 'commands': {}}
+    if not isinstance(command, Command):
+        return node
+    node['help'] = command.get_short_help_str() or None
+    node['hidden'] = command.hidden
+    prefixes = {'-'}
+    for param in command.get_params(ctx):
+        if isinstance(param, Option):
+            prefixes.update((opt[:1] for opt in (*param.opts, *param.secondary_opts)))
+            node['options'].append({'opts': [*param.opts, *param.secondary_opts], 'flag': param.is_flag or param.count, 'multiple': param.multiple, 'nargs': param.nargs, 'help': param.help, 'hidden': param.hidden, 'completion': _completion_spec(param)})
+        elif isinstance(param, Argument):
+            node['arguments'].append({'nargs': param.nargs, 'completion': _completion_spec(param)})
+    node['prefixes'] = sorted(prefixes)
+    if isinstance(command, MultiCommand):
+        node['chain'] = command.chain
+        for name in command.list_commands(ctx):
+            sub_command = command.get_command(ctx, name)
+            if sub_command is not None:
+                node['commands'][name] = _dump_command(Context(sub_command, parent=ctx, info_name=name), sources)
+    return node
+
+def _complete_spec(spec: t.Mapping[str, t.Any], incomplete: str) -> t.Optional[t.List[CompletionItem]]:
+    """Complete a value described by :func:`_completion_spec`. Returns
+    ``None`` if the value can only be completed by the program.
+    """
+    kind = spec['type']
+    if kind == 'choice':
+        if spec['case_sensitive']:
+            return [CompletionItem(c) for c in spec['choices'] if c.startswith(incomplete)]
+        incomplete = incomplete.lower()
+        return [CompletionItem(c) for c in spec['choices'] if c.lower().startswith(incomplete)]
+    if kind in {'file', 'dir'}:
+        return [CompletionItem(incomplete, type=kind)]
+    if kind == 'plain':
+        return []
+    return None
+
+def _complete_from_tree(tree: t.Mapping[str, t.Any], args: t.List[str], incomplete: str) -> t.Optional[t.List[CompletionItem]]:
+    """Answer a completion request from a serialized command tree. Only
+    the static parts of the tree are used. Returns ``None`` if the
+    request involves anything that needs the program to answer, such as
+    a parameter with custom completion or a chained group.
+
+    :param tree: Serialized command tree from :func:`_dump_command`.
+    :param args: List of complete args before the incomplete value.
+    :param incomplete: Value being completed. May be empty.
+    """
+    node = tree
+    prefixes = set(node['prefixes'])
+    seen: t.Set[int] = set()
+    positional = 0
+    pending: t.Optional[t.Mapping[str, t.Any]] = None
+    pending_count = 0
+    for arg in args:
+        if pending is not None:
+            pending_count -= 1
+            if pending_count == 0:
+                pending = None
+            continue
+        if node['chain'] or arg == '--':
+            return None
+        if arg[:1] in prefixes and len(arg) > 1:
+            name, eq, _ = arg.partition('=')
+            index, option = _find_option(node, name)
+            if option is None:
+                return None
+            seen.add(index)
+            if not option['flag'] and (not eq):
+                pending, pending_count = (option, option['nargs'])
+            continue
+        if node['commands']:
+            if node['arguments'] or arg not in node['commands']:
+                return None
+            node = node['commands'][arg]
+            prefixes.update(node['prefixes'])
+            seen = set()
+            positional = 0
+            continue
+        positional += 1
+    if node['chain']:
+        return None
+    if pending is not None:
+        return _complete_spec(pending['completion'], incomplete)
+    if incomplete[:1] in prefixes:
+        name, eq, value = incomplete.partition('=')
+        if eq:
+            option = _find_option(node, name)[1]
+            if option is None or option['flag']:
+                return None
+            return _complete_spec(option['completion'], value)
+        results = []
+        for index, option in enumerate(node['options']):
+            if option['hidden'] or (index in seen and (not option['multiple'])):
+                continue
+            results.extend((CompletionItem(opt, help=option['help']) for opt in option['opts'] if opt.startswith(incomplete)))
+        return results
+    if node['commands']:
+        if node['arguments']:
+            return None
+        return [CompletionItem(name, help=sub['help']) for name, sub in node['commands'].items() if not sub['hidden'] and name.startswith(incomplete)]
+    for argument in node['arguments']:
+        if argument['nargs'] == -1 or positional < argument['nargs']:
+            return _complete_spec(argument['completion'], incomplete)
+        positional -= argument['nargs']
+    return []
+
+def _find_option(node: t.Mapping[str, t.Any], name: str) -> t.Tuple[int, t.Optional[t.Mapping[str, t.Any]]]:
+    """Find an option of a serialized command by one of its names."""
+    for index, option in enumerate(node['options']):
+        if name in option['opts']:
+            return (index, option)
+    return (-1, None)
+
+def _iter_static_nodes(node: t.Mapping[str, t.Any], path: str='', siblings: t.Optional[t.Mapping[str, t.Any]]=None) -> t.Iterator[t.Tuple[str, t.Mapping[str, t.Any], t.Mapping[str, t.Any]]]:
+    """Walk a serialized command tree. Yield the path of subcommand
+    names leading to each command, the serialized command, and the
+    commands that can follow it in a chained group.
+    """
+    yield (path, node, siblings or {})
+    chained = node['commands'] if node['chain'] else None
+    for name, sub in node['commands'].items():
+        yield from _iter_static_nodes(sub, f'{path} {name}', chained)
+
+def _static_values(specs: t.Iterable[t.Mapping[str, t.Any]]) -> t.Tuple[t.List[str], t.Set[str]]:
+    """Merge completion specs into a list of fixed words and the set of
+    other completion types (``file``, ``dir``, ``dynamic``).
+    """
+    words: t.List[str] = []
+    kinds: t.Set[str] = set()
+    for spec in specs:
+        if spec['type'] == 'choice':
+            words.extend(spec['choices'])
+        elif spec['type'] != 'plain':
+            kinds.add(spec['type'])
+    return (words, kinds)
+
+def _static_case_vars(tree: t.Mapping[str, t.Any], reply: t.Callable[[t.List[str], t.Set[str]], t.List[str]]) -> t.Dict[str, str]:
+    """Build the ``case`` arms of the static Bash and Zsh scripts.
+
+    :param tree: Serialized command tree from :func:`_dump_command`.
+    :param reply: Produces the lines of shell code that complete a list
+        of words and a set of other completion types.
+    """
+    import shlex
+
+    def arm(patterns: t.List[str], lines: t.List[str], indent: int) -> str:
+        pad = ' ' * indent
+        body = ''.join((f'{pad}    {line}\n' for line in lines))
+        return f"{pad}{'|'.join((shlex.quote(p) for p in patterns))})\n{body}{pad}    ;;"
+    descend = []
+    option_values = []
+    words = []
+    for path, node, siblings in _iter_static_nodes(tree):
+        parent = path.rpartition(' ')[0]
+        for name in node['commands']:
+            descend.append(arm([f'{path} {name}'], [f"cmd_path={shlex.quote(f'{path} {name}')}"], 12))
+        for name in siblings:
+            descend.append(arm([f'{path} {name}'], [f"cmd_path={shlex.quote(f'{parent} {name}')}"], 12))
+        for option in node['options']:
+            if not option['flag']:
+                option_values.append(arm([f'{path} {opt}' for opt in option['opts']], [*reply(*_static_values([option['completion']])), 'return 0'], 8))
+        names = [name for name, sub in (*node['commands'].items(), *siblings.items()) if not sub['hidden']]
+        values, kinds = _static_values([argument['completion'] for argument in node['arguments']])
+        lines = reply([*names, *values], kinds)
+        opts = [opt for option in node['options'] if not option['hidden'] for opt in option['opts']]
+        if opts:
+            other = ['else', *(f'    {line}' for line in lines)] if lines else []
+            lines = ['if [[ $cur == -* ]]; then', *(f'    {line}' for line in reply(opts, set())), *other, 'fi']
+        if lines:
+            words.append(arm([path], lines, 8))
+    return {'descend': '\n'.join(descend), 'option_values': '\n'.join(option_values), 'words': '\n'.join(words)}
+
+def _fish_quote(value: str) -> str:
+    """Quote a string for Fish."""
+    value = value.replace('\\', '\\\\').replace("'", "\\'")
+    return f"'{value}'"
+
+class CompletionCache:
+    """A persistent cache of the static parts of a command tree, used to
+    answer shell completion requests without importing the application.
+
+    Each completion request starts a new process. With the cache, the
+    entry point can answer the request before importing the module that
+    defines the CLI:
+
+    .. code-block:: python
+
+        import sys
+        from click.shell_completion import CompletionCache
+
+        cache = CompletionCache("mytool", version="1.2.0")
+
+        def main():
+            if cache.complete():
+                sys.exit(0)
+
+            from mytool.cli import cli
+
+            cache.update(cli)
+            cli()
+
+    Requests that need the application, such as parameters with custom
+    ``shell_complete`` functions or types, fall through to the normal
+    completion. The cache is written the first time the program handles
+    a completion request. It is invalidated when the version changes,
+    or when a module that defines one of the commands is modified, so
+    the cache stays current during development without changing the
+    version.
+
+    :param app_name: Name used to find the directory with
+        :func:`~click.get_app_dir`.
+    :param version: Version of the program, part of the cache key.
+    :param prog_name: Name of the executable in the shell. Defaults to
+        ``app_name``.
+    :param complete_var: Name of the environment variable that holds
+        the completion instruction. Defaults to
+        ``_{PROG_NAME}_COMPLETE``.
+    :param path: Path of the cache file. Defaults to
+        ``completion-cache.json`` in the app dir.
+
+    .. versionadded:: 8.2.0
+    """
+
+    def __init__(self, app_name: str, version: str, prog_name: t.Optional[str]=None, complete_var: t.Optional[str]=None, path: t.Optional[str]=None) -> None:
+        if prog_name is None:
+            prog_name = app_name
+        if complete_var is None:
+            complete_name = prog_name.replace('-', '_').replace('.', '_')
+            complete_var = f'_{complete_name}_COMPLETE'.upper()
+        if path is None:
+            path = os.path.join(get_app_dir(app_name), 'completion-cache.json')
+        self.app_name = app_name
+        self.version = version
+        self.prog_name = prog_name
+        self.complete_var = complete_var
+        self.path = path
+
+    @property
+    def key(self) -> str:
+        """The cache key, the version of the program. The modification
+        times of the modules that define the commands are checked
+        separately by :meth:`load`.
+        """
+        return self.version
+
+    def load(self) -> t.Optional[t.Dict[str, t.Any]]:
+        """Return the cached command tree, or ``None`` if there is no
+        cache or it is stale.
+        """
+        import json
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get('key') != self.key:
+            return None
+        for source, mtime in data.get('sources', {}).items():
+            try:
+                if os.stat(source).st_mtime_ns != mtime:
+                    return None
+            except OSError:
+                return None
+        return t.cast(t.Dict[str, t.Any], data['command'])
+
+    def store(self, cli: BaseCommand) -> None:
+        """Serialize the command tree and write it to the cache file.
+        This loads every subcommand. The file is replaced atomically, so
+        concurrent completion requests never read a partial cache.
+
+        :param cli: Command being called.
+        """
+        import json
+        sources: t.Set[str] = set()
+        with Context(cli, info_name=self.prog_name, resilient_parsing=True) as ctx:
+            command = _dump_command(ctx, sources)
+        mtimes = {}
+        for source in sources:
+            try:
+                mtimes[source] = os.stat(source).st_mtime_ns
+            except OSError:
+                pass
+        data = {'key': self.key, 'sources': mtimes, 'command': command}
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def complete(self) -> bool:
+        """If the program was called to complete a value, try to answer
+        from the cache and print the completions. Returns ``True`` if the
+        request was answered and the program should exit.
+        """
+        instruction = os.environ.get(self.complete_var)
+        if not instruction:
+            return False
+        shell, _, action = instruction.partition('_')
+        comp_cls = get_completion_class(shell)
+        if comp_cls is None or action != 'complete':
+            return False
+        tree = self.load()
+        if tree is None:
+            return False
+        comp = comp_cls(t.cast(BaseCommand, None), {}, self.prog_name, self.complete_var)
+        args, incomplete = comp.get_completion_args()
+        completions = _complete_from_tree(tree, args, incomplete)
+        if completions is None:
+            return False
+        echo('\n'.join((comp.format_completion(item) for item in completions)))
+        return True
+
+    def update(self, cli: BaseCommand) -> None:
+        """Write the cache if the program was called for shell completion
+        and the cache is missing or stale. Does nothing otherwise, so
+        normal invocations don't pay for serializing the tree.
+
+        :param cli: Command being called.
+        """
+        if os.environ.get(self.complete_var) and self.load() is None:
+            try:
+                self.store(cli)
+            except OSError:
+                pass
@@ -3,6 +3,7 @@ import io
 import itertools
 import sys
 import typing as t
+from functools import lru_cache
 from gettext import gettext as _
 from ._compat import isatty
 from ._compat import strip_ansi
@@ -227,6 +228,55 @@ def clear() -> None:
     """
     pass
 
+def _interpret_color(color: t.Union[int, t.Tuple[int, int, int], str], offset: int=0) -> str:
+    if isinstance(color, int):
+        return f'{38 + offset};5;{color:d}'
+    if isinstance(color, (tuple, list)):
+        r, g, b = color
+        return f'{38 + offset};2;{r:d};{g:d};{b:d}'
+    return str(_ansi_colors[color] + offset)
+
+def _hashable_colors(fg: t.Any, bg: t.Any) -> t.Tuple[t.Any, t.Any]:
+    if isinstance(fg, list):
+        fg = tuple(fg)
+    if isinstance(bg, list):
+        bg = tuple(bg)
+    return (fg, bg)
+
+@lru_cache(maxsize=256)
+def _style_prefix(fg: t.Optional[t.Union[int, t.Tuple[int, int, int], str]], bg: t.Optional[t.Union[int, t.Tuple[int, int, int], str]], bold: t.Optional[bool], dim: t.Optional[bool], underline: t.Optional[bool], overline: t.Optional[bool], italic: t.Optional[bool], blink: t.Optional[bool], reverse: t.Optional[bool], strikethrough: t.Optional[bool]) -> str:
+    """Build the escape sequences that start a style. The result is
+    cached for repeated combinations of arguments.
+    """
+    bits = []
+    if fg:
+        try:
+            bits.append(f'\x1b[{_interpret_color(fg)}m')
+        except KeyError:
+            raise TypeError(f'Unknown color {fg!r}') from None
+    if bg:
+        try:
+            bits.append(f'\x1b[{_interpret_color(bg, 10)}m')
+        except KeyError:
+            raise TypeError(f'Unknown color {bg!r}') from None
+    if bold is not None:
+        bits.append(f'\x1b[{(1 if bold else 22)}m')
+    if dim is not None:
+        bits.append(f'\x1b[{(2 if dim else 22)}m')
+    if underline is not None:
+        bits.append(f'\x1b[{(4 if underline else 24)}m')
+    if overline is not None:
+        bits.append(f'\x1b[{(53 if overline else 55)}m')
+    if italic is not None:
+        bits.append(f'\x1b[{(3 if italic else 23)}m')
+    if blink is not None:
+        bits.append(f'\x1b[{(5 if blink else 25)}m')
+    if reverse is not None:
+        bits.append(f'\x1b[{(7 if reverse else 27)}m')
+    if strikethrough is not None:
+        bits.append(f'\x1b[{(9 if strikethrough else 29)}m')
+    return ''.join(bits)
+
 def style(text: t.Any, fg: t.Optional[t.Union[int, t.Tuple[int, int, int], str]]=None, bg: t.Optional[t.Union[int, t.Tuple[int, int, int], str]]=None, bold: t.Optional[bool]=None, dim: t.Optional[bool]=None, underline: t.Optional[bool]=None, overline: t.Optional[bool]=None, italic: t.Optional[bool]=None, blink: t.Optional[bool]=None, reverse: t.Optional[bool]=None, strikethrough: t.Optional[bool]=None, reset: bool=True) -> str:
     """Styles a text with ANSI styles and returns the new string.  By
     default the styling is self contained which means that at the end
@@ -289,6 +339,10 @@ def style(text: t.Any, fg: t.Optional[t.Union[int, t.Tuple[int, int, int], str]]
                   string which means that styles do not carry over.  This
                   can be disabled to compose styles.
 
+    .. versionchanged:: 8.2.0
+        The escape sequences for repeated combinations of styles are
+        cached. Use :class:`Style` to apply the same style many times.
+
     .. versionchanged:: 8.0
         A non-string ``message`` is converted to a string.
 
@@ -304,7 +358,41 @@ def style(text: t.Any, fg: t.Optional[t.Union[int, t.Tuple[int, int, int], str]]
 
     .. versionadded:: 2.0
     """
-    pass
+    if not isinstance(text, str):
+        text = str(text)
+    prefix = _style_prefix(*_hashable_colors(fg, bg), bold, dim, underline, overline, italic, blink, reverse, strikethrough)
+    if reset:
+        return f'{prefix}{text}{_ansi_reset_all}'
+    return f'{prefix}{text}'
+
+class Style:
+    """A style that can be applied to many strings. The escape sequences
+    are built once when the style is created, so applying it only joins
+    the text with a prefix and a suffix. The arguments are the same as
+    for :func:`style`.
+
+    .. code-block:: python
+
+        error = click.Style(fg="red", bold=True)
+        click.echo(error("Something went wrong."))
+
+    .. versionadded:: 8.2.0
+    """
+
+    def __init__(self, fg: t.Optional[t.Union[int, t.Tuple[int, int, int], str]]=None, bg: t.Optional[t.Union[int, t.Tuple[int, int, int], str]]=None, bold: t.Optional[bool]=None, dim: t.Optional[bool]=None, underline: t.Optional[bool]=None, overline: t.Optional[bool]=None, italic: t.Optional[bool]=None, blink: t.Optional[bool]=None, reverse: t.Optional[bool]=None, strikethrough: t.Optional[bool]=None, reset: bool=True) -> None:
+        self.prefix = _style_prefix(*_hashable_colors(fg, bg), bold, dim, underline, overline, italic, blink, reverse, strikethrough)
+        self.suffix = _ansi_reset_all if reset else ''
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self.prefix + self.suffix!r}>'
+
+    def __call__(self, text: t.Any) -> str:
+        """Return the text with the style applied. Non-string values
+        are converted to a string.
+        """
+        if not isinstance(text, str):
+            text = str(text)
+        return f'{self.prefix}{text}{self.suffix}'
 
 def unstyle(text: str) -> str:
     """Removes ANSI styling information from a string.  Usually it's not
@@ -314,8 +402,12 @@ def unstyle(text: str) -> str:
     .. versionadded:: 2.0
 
     :param text: the text to remove style information from.
+
+    .. versionchanged:: 8.2.0
+        Text without an escape character is returned without running
+        a regex over it.
     """
-    pass
+    return strip_ansi(text)
 
 def secho(message: t.Optional[t.Any]=None, file: t.Optional[t.IO[t.AnyStr]]=None, nl: bool=True, err: bool=False, color: t.Optional[bool]=None, **styles: t.Any) -> None:
     """This function combines :func:`echo` and :func:`style` into one
@@ -338,7 +430,9 @@ def secho(message: t.Optional[t.Any]=None, file: t.Optional[t.IO[t.AnyStr]]=None
 
     .. versionadded:: 2.0
     """
-    pass
+    if message is not None and (not isinstance(message, (bytes, bytearray))):
+        message = style(message, **styles)
+    return echo(message, file=file, nl=nl, err=err, color=color)
 
 def edit(text: t.Optional[t.AnyStr]=None, editor: t.Optional[str]=None, env: t.Optional[t.Mapping[str, str]]=None, require_save: bool=True, extension: str='.txt', filename: t.Optional[str]=None) -> t.Optional[t.AnyStr]:
     """Edits the given text in the defined editor.  If an editor is given
@@ -1,8 +1,12 @@
 import os
+import re
 import stat
 import sys
 import typing as t
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+from functools import partial
 from gettext import gettext as _
 from gettext import ngettext
 if t.TYPE_CHECKING:
@@ -14,6 +18,7 @@ if t.TYPE_CHECKING:
     from .utils import LazyFile
     from .utils import safecall
     from ._compat import _get_argv_encoding
+    from ._compat import get_binary_stdin
     from ._compat import open_stream
     from .exceptions import BadParameter
 
@@ -86,7 +91,26 @@ class ParamType:
         :param ctx: The current context that arrived at this value. May
             be ``None``.
         """
-        pass
+        return value
+
+    def convert_many(self, values: t.Iterable[t.Any], param: t.Optional['Parameter'], ctx: t.Optional['Context']) -> t.Tuple[t.Any, ...]:
+        """Convert each value in a sequence of values, such as the values
+        of a ``multiple=True`` or ``nargs=-1`` parameter. Like calling
+        the type, ``None`` values are not converted.
+
+        The default implementation calls :meth:`convert` for each value.
+        Types can override it to convert all the values in one pass, but
+        must raise the same errors as :meth:`convert` for invalid values.
+
+        :param values: The values to convert.
+        :param param: The parameter that is using this type to convert
+            its values. May be ``None``.
+        :param ctx: The current context that arrived at these values. May
+            be ``None``.
+
+        .. versionadded:: 8.2.0
+        """
+        return tuple((self(value, param, ctx) for value in values))
 
     def split_envvar_value(self, rv: str) -> t.Sequence[str]:
         """Given a value from an environment variable this splits it up
@@ -100,7 +124,7 @@ class ParamType:
 
     def fail(self, message: str, param: t.Optional['Parameter']=None, ctx: t.Optional['Context']=None) -> 't.NoReturn':
         """Helper method to fail with an invalid value message."""
-        pass
+        raise BadParameter(message, ctx=ctx, param=param)
 
     def shell_complete(self, ctx: 'Context', param: 'Parameter', incomplete: str) -> t.List['CompletionItem']:
         """Return a list of
@@ -153,6 +177,11 @@ class Choice(ParamType):
 
     :param case_sensitive: Set to false to make choices case
         insensitive. Defaults to true.
+
+    .. versionchanged:: 8.2.0
+        The normalized choices are indexed once, instead of normalizing
+        every choice for each value. Assign a new sequence to
+        :attr:`choices` instead of modifying it in place.
     """
     name = 'choice'
 
@@ -160,9 +189,50 @@ class Choice(ParamType):
         self.choices = choices
         self.case_sensitive = case_sensitive
 
+    @property
+    def choices(self) -> t.Sequence[str]:
+        return self._choices
+
+    @choices.setter
+    def choices(self, value: t.Sequence[str]) -> None:
+        self._choices = value
+        self._index_cache: t.Dict[t.Tuple[t.Optional[t.Callable[[str], str]], bool], t.Dict[str, str]] = {}
+        self._prefix_cache: t.Dict[bool, t.Tuple[t.List[str], t.List[int]]] = {}
+
     def __repr__(self) -> str:
         return f'Choice({list(self.choices)})'
 
+    def _get_index(self, normalize: t.Optional[t.Callable[[str], str]]) -> t.Dict[str, str]:
+        """Map each normalized choice to the original choice. Normalizes
+        with the given function, then casefolds if the choices aren't
+        case sensitive. The index is cached for each combination.
+        """
+        key = (normalize, self.case_sensitive)
+        index = self._index_cache.get(key)
+        if index is None:
+            index = {choice: choice for choice in self.choices}
+            if normalize is not None:
+                index = {normalize(normed): original for normed, original in index.items()}
+            if not self.case_sensitive:
+                index = {normed.casefold(): original for normed, original in index.items()}
+            if len(self._index_cache) >= 8:
+                self._index_cache.clear()
+            self._index_cache[key] = index
+        return index
+
+    def convert(self, value: t.Any, param: t.Optional['Parameter'], ctx: t.Optional['Context']) -> t.Any:
+        normalize = ctx.token_normalize_func if ctx is not None else None
+        normed_value = value
+        if normalize is not None:
+            normed_value = normalize(value)
+        if not self.case_sensitive:
+            normed_value = normed_value.casefold()
+        index = self._get_index(normalize)
+        if normed_value in index:
+            return index[normed_value]
+        choices_str = ', '.join(map(repr, self.choices))
+        self.fail(ngettext('{value!r} is not {choice}.', '{value!r} is not one of {choices}.', len(self.choices)).format(value=value, choice=choices_str, choices=choices_str), param, ctx)
+
     def shell_complete(self, ctx: 'Context', param: 'Parameter', incomplete: str) -> t.List['CompletionItem']:
         """Complete choices that start with the incomplete value.
 
@@ -170,9 +240,47 @@ class Choice(ParamType):
         :param param: The parameter that is requesting completion.
         :param incomplete: Value being completed. May be empty.
 
+        .. versionchanged:: 8.2.0
+            Prefixes are looked up in a sorted index of the choices.
+
         .. versionadded:: 8.0
         """
-        pass
+        from bisect import bisect_left
+        from click.shell_completion import CompletionItem
+        prefix_index = self._prefix_cache.get(self.case_sensitive)
+        if prefix_index is None:
+            keys = [str(c) if self.case_sensitive else str(c).lower() for c in self.choices]
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            prefix_index = self._prefix_cache[self.case_sensitive] = ([keys[i] for i in order], order)
+        sorted_keys, order = prefix_index
+        if not self.case_sensitive:
+            incomplete = incomplete.lower()
+        start = end = bisect_left(sorted_keys, incomplete)
+        while end < len(sorted_keys) and sorted_keys[end].startswith(incomplete):
+            end += 1
+        return [CompletionItem(str(self.choices[i])) for i in sorted(order[start:end])]
+
+_iso_datetime_patterns = {'%Y-%m-%d': re.compile('[0-9]{4}-[0-9]{2}-[0-9]{2}'), '%Y-%m-%dT%H:%M:%S': re.compile('[0-9]{4}-[0-9]{2}-[0-9]{2}T([01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9]'), '%Y-%m-%d %H:%M:%S': re.compile('[0-9]{4}-[0-9]{2}-[0-9]{2} ([01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9]')}
+
+@lru_cache(maxsize=256)
+def _parse_datetime(formats: t.Tuple[str, ...], value: str) -> t.Optional[datetime]:
+    """Parse a string with the first format that matches it, or return
+    ``None``. Strings in one of the default ISO 8601 formats are parsed
+    with ``fromisoformat`` if no other formats are used, since they
+    can't match more than one of those formats. The results for
+    recently converted strings are cached for each tuple of formats.
+    """
+    if all((format in _iso_datetime_patterns for format in formats)) and any((_iso_datetime_patterns[format].fullmatch(value) for format in formats)):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    for format in formats:
+        try:
+            return datetime.strptime(value, format)
+        except ValueError:
+            pass
+    return None
 
 class DateTime(ParamType):
     """The DateTime type converts date strings into `datetime` objects.
@@ -193,18 +301,70 @@ class DateTime(ParamType):
                     which they should be tried. Defaults to
                     ``'%Y-%m-%d'``, ``'%Y-%m-%dT%H:%M:%S'``,
                     ``'%Y-%m-%d %H:%M:%S'``.
+
+    .. versionchanged:: 8.2.0
+        If only the default formats are used, values in those formats
+        are parsed with ``datetime.fromisoformat``. The results for
+        recently converted strings are cached.
     """
     name = 'datetime'
 
     def __init__(self, formats: t.Optional[t.Sequence[str]]=None):
         self.formats: t.Sequence[str] = formats or ['%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S']
 
+    def get_metavar(self, param: 'Parameter') -> str:
+        return f"[{'|'.join(self.formats)}]"
+
+    def _try_to_convert_date(self, value: t.Any, format: str) -> t.Optional[datetime]:
+        try:
+            return datetime.strptime(value, format)
+        except ValueError:
+            return None
+
+    def convert(self, value: t.Any, param: t.Optional['Parameter'], ctx: t.Optional['Context']) -> t.Any:
+        if isinstance(value, datetime):
+            return value
+        if isinstance(value, str) and type(self)._try_to_convert_date is DateTime._try_to_convert_date:
+            converted = _parse_datetime(tuple(self.formats), value)
+            if converted is not None:
+                return converted
+        else:
+            for format in self.formats:
+                converted = self._try_to_convert_date(value, format)
+                if converted is not None:
+                    return converted
+        formats_str = ', '.join(map(repr, self.formats))
+        self.fail(ngettext('{value!r} does not match the format {format}.', '{value!r} does not match the formats {formats}.', len(self.formats)).format(value=value, format=formats_str, formats=formats_str), param, ctx)
+
     def __repr__(self) -> str:
         return 'DateTime'
 
 class _NumberParamTypeBase(ParamType):
     _number_class: t.ClassVar[t.Type[t.Any]]
 
+    def convert(self, value: t.Any, param: t.Optional['Parameter'], ctx: t.Optional['Context']) -> t.Any:
+        try:
+            return self._number_class(value)
+        except ValueError:
+            self.fail(_('{value!r} is not a valid {number_type}.').format(value=value, number_type=self.name), param, ctx)
+
+    def convert_many(self, values: t.Iterable[t.Any], param: t.Optional['Parameter'], ctx: t.Optional['Context']) -> t.Tuple[t.Any, ...]:
+        values = tuple(values)
+        try:
+            rvs = tuple(map(self._number_class, values))
+        except (TypeError, ValueError):
+            return super().convert_many(values, param, ctx)
+        if self._all_in_range(rvs):
+            return rvs
+        return super().convert_many(values, param, ctx)
+
+    def _all_in_range(self, rvs: t.Tuple[t.Any, ...]) -> bool:
+        """Check if all the converted values are accepted as is. If not,
+        :meth:`convert_many` converts each value again to clamp it or to
+        report the error for the first invalid value.
+        """
+        return True
+
 class _NumberRangeBase(_NumberParamTypeBase):
 
     def __init__(self, min: t.Optional[float]=None, max: t.Optional[float]=None, min_open: bool=False, max_open: bool=False, clamp: bool=False) -> None:
@@ -214,6 +374,33 @@ class _NumberRangeBase(_NumberParamTypeBase):
         self.max_open = max_open
         self.clamp = clamp
 
+    def convert(self, value: t.Any, param: t.Optional['Parameter'], ctx: t.Optional['Context']) -> t.Any:
+        import operator
+        rv = super().convert(value, param, ctx)
+        lt_min: bool = self.min is not None and (operator.le if self.min_open else operator.lt)(rv, self.min)
+        gt_max: bool = self.max is not None and (operator.ge if self.max_open else operator.gt)(rv, self.max)
+        if self.clamp:
+            if lt_min:
+                return self._clamp(self.min, 1, self.min_open)
+            if gt_max:
+                return self._clamp(self.max, -1, self.max_open)
+        if lt_min or gt_max:
+            self.fail(_('{value} is not in the range {range}.').format(value=rv, range=self._describe_range()), param, ctx)
+        return rv
+
+    def _all_in_range(self, rvs: t.Tuple[t.Any, ...]) -> bool:
+        if not rvs:
+            return True
+        lo = min(rvs)
+        hi = max(rvs)
+        if lo != lo or hi != hi:
+            return False
+        if self.min is not None and (lo <= self.min if self.min_open else lo < self.min):
+            return False
+        if self.max is not None and (hi >= self.max if self.max_open else hi > self.max):
+            return False
+        return True
+
     def _clamp(self, bound: float, dir: 'te.Literal[1, -1]', open: bool) -> float:
         """Find the valid value to clamp to bound in the given
         direction.
@@ -222,11 +409,19 @@ class _NumberRangeBase(_NumberParamTypeBase):
         :param dir: 1 or -1 indicating the direction to move.
         :param open: If true, the range does not include the bound.
         """
-        pass
+        raise NotImplementedError
 
     def _describe_range(self) -> str:
         """Describe the range for use in help text."""
-        pass
+        if self.min is None:
+            op = '<' if self.max_open else '<='
+            return f'x{op}{self.max}'
+        if self.max is None:
+            op = '>' if self.min_open else '>='
+            return f'x{op}{self.min}'
+        lop = '<' if self.min_open else '<='
+        rop = '<' if self.max_open else '<='
+        return f'{self.min}{lop}x{rop}{self.max}'
 
     def __repr__(self) -> str:
         clamp = ' clamped' if self.clamp else ''
@@ -255,6 +450,11 @@ class IntRange(_NumberRangeBase, IntParamType):
     """
     name = 'integer range'
 
+    def _clamp(self, bound: int, dir: 'te.Literal[1, -1]', open: bool) -> int:
+        if not open:
+            return bound
+        return bound + dir
+
 class FloatParamType(_NumberParamTypeBase):
     name = 'float'
     _number_class = float
@@ -284,15 +484,55 @@ class FloatRange(_NumberRangeBase, FloatParamType):
         if (min_open or max_open) and clamp:
             raise TypeError('Clamping is not supported for open bounds.')
 
+    def _clamp(self, bound: float, dir: 'te.Literal[1, -1]', open: bool) -> float:
+        if not open:
+            return bound
+        raise RuntimeError('Clamping is not supported for open bounds.')
+
+_bool_states = {'1': True, 'true': True, 't': True, 'yes': True, 'y': True, 'on': True, '0': False, 'false': False, 'f': False, 'no': False, 'n': False, 'off': False}
+
 class BoolParamType(ParamType):
     name = 'boolean'
 
+    def convert(self, value: t.Any, param: t.Optional['Parameter'], ctx: t.Optional['Context']) -> t.Any:
+        if value in {False, True}:
+            return bool(value)
+        norm = value.strip().lower()
+        if norm in _bool_states:
+            return _bool_states[norm]
+        self.fail(_('{value!r} is not a valid boolean.').format(value=value), param, ctx)
+
+    def convert_many(self, values: t.Iterable[t.Any], param: t.Optional['Parameter'], ctx: t.Optional['Context']) -> t.Tuple[t.Any, ...]:
+        values = tuple(values)
+        try:
+            return tuple(map(_bool_states.__getitem__, map(str.lower, map(str.strip, values))))
+        except (KeyError, TypeError):
+            return super().convert_many(values, param, ctx)
+
     def __repr__(self) -> str:
         return 'BOOL'
 
 class UUIDParameterType(ParamType):
     name = 'uuid'
 
+    def convert(self, value: t.Any, param: t.Optional['Parameter'], ctx: t.Optional['Context']) -> t.Any:
+        import uuid
+        if isinstance(value, uuid.UUID):
+            return value
+        value = value.strip()
+        try:
+            return uuid.UUID(value)
+        except ValueError:
+            self.fail(_('{value!r} is not a valid UUID.').format(value=value), param, ctx)
+
+    def convert_many(self, values: t.Iterable[t.Any], param: t.Optional['Parameter'], ctx: t.Optional['Context']) -> t.Tuple[t.Any, ...]:
+        import uuid
+        values = tuple(values)
+        try:
+            return tuple(map(uuid.UUID, map(str.strip, values)))
+        except (TypeError, ValueError):
+            return super().convert_many(values, param, ctx)
+
     def __repr__(self) -> str:
         return 'UUID'
 
@@ -320,17 +560,74 @@ class File(ParamType):
     completion the file will be moved over to the original location.  This
     is useful if a file regularly read by other users is modified.
 
+    The ``buffer_size`` parameter sets the size of the buffer used to
+    read or write the file, which can speed up moving large amounts of
+    data. A binary standard stream is reopened with that buffer size.
+
+    For atomic writes, ``fsync`` controls whether the data is flushed to
+    disk before the file is replaced: ``'none'``, ``'file'``, or
+    ``'dir'`` to also sync the directory entry. If the expected size is
+    known, ``preallocate`` reserves that many bytes up front. On Linux,
+    the temporary file is created without a name, so nothing is left
+    behind if the program is killed while writing.
+
+    Pass ``compression`` to read or write the file through a codec:
+    ``'gzip'``, ``'bz2'``, ``'xz'``, or ``'zstd'``. With ``'auto'``, the
+    codec is detected from the first bytes of a file being read, or from
+    the extension of a file being written, and a file that isn't
+    compressed is used as is. The codec modules are only imported when
+    they are used. ``'zstd'`` requires Python 3.14 or the ``zstandard``
+    library.
+
     See :ref:`file-args` for more information.
+
+    .. versionchanged:: 8.2.0
+        Added the ``buffer_size``, ``fsync``, ``preallocate``, and
+        ``compression`` parameters.
     """
     name = 'filename'
     envvar_list_splitter: t.ClassVar[str] = os.path.pathsep
 
-    def __init__(self, mode: str='r', encoding: t.Optional[str]=None, errors: t.Optional[str]='strict', lazy: t.Optional[bool]=None, atomic: bool=False) -> None:
+    def __init__(self, mode: str='r', encoding: t.Optional[str]=None, errors: t.Optional[str]='strict', lazy: t.Optional[bool]=None, atomic: bool=False, buffer_size: t.Optional[int]=None, fsync: str='none', preallocate: t.Optional[int]=None, compression: t.Optional[str]=None) -> None:
         self.mode = mode
         self.encoding = encoding
         self.errors = errors
         self.lazy = lazy
         self.atomic = atomic
+        self.buffer_size = buffer_size
+        self.fsync = fsync
+        self.preallocate = preallocate
+        self.compression = compression
+
+    def resolve_lazy_flag(self, value: 't.Union[str, os.PathLike[str]]') -> bool:
+        if self.lazy is not None:
+            return self.lazy
+        if os.fspath(value) == '-':
+            return False
+        elif 'w' in self.mode:
+            return True
+        return False
+
+    def convert(self, value: t.Union[str, 'os.PathLike[str]', t.IO[t.Any]], param: t.Optional['Parameter'], ctx: t.Optional['Context']) -> t.IO[t.Any]:
+        if _is_file_like(value):
+            return value
+        value = t.cast('t.Union[str, os.PathLike[str]]', value)
+        try:
+            lazy = self.resolve_lazy_flag(value)
+            if lazy:
+                lf = LazyFile(value, self.mode, self.encoding, self.errors, atomic=self.atomic, buffer_size=self.buffer_size, fsync=self.fsync, preallocate=self.preallocate, compression=self.compression)
+                if ctx is not None:
+                    ctx.call_on_close(lf.close_intelligently)
+                return t.cast(t.IO[t.Any], lf)
+            f, should_close = open_stream(value, self.mode, self.encoding, self.errors, atomic=self.atomic, buffer_size=self.buffer_size, fsync=self.fsync, preallocate=self.preallocate, compression=self.compression)
+            if ctx is not None:
+                if should_close:
+                    ctx.call_on_close(safecall(f.close))
+                else:
+                    ctx.call_on_close(safecall(f.flush))
+            return f
+        except OSError as e:
+            self.fail(f"'{format_filename(value)}': {e.strerror}", param, ctx)
 
     def shell_complete(self, ctx: 'Context', param: 'Parameter', incomplete: str) -> t.List['CompletionItem']:
         """Return a special completion marker that tells the completion
@@ -344,6 +641,77 @@ class File(ParamType):
         """
         pass
 
+class MappedFile(ParamType):
+    """Declares a parameter to be a binary file that is read through a
+    memory map. The value is a read-only :class:`memoryview` of the
+    file's contents, so a large file can be scanned and sliced without
+    reading it into memory or copying it.
+
+    The special value ``-`` reads all of stdin into memory instead.
+    Files that can't be mapped, such as pipes and empty files, are also
+    read into memory.
+
+    The map is closed when the context tears down. A slice of the view
+    that is still used after that keeps the map open until it is
+    garbage collected.
+
+    .. versionadded:: 8.2.0
+    """
+    name = 'filename'
+    envvar_list_splitter: t.ClassVar[str] = os.path.pathsep
+
+    def convert(self, value: t.Any, param: t.Optional['Parameter'], ctx: t.Optional['Context']) -> memoryview:
+        import mmap
+        if isinstance(value, memoryview):
+            return value
+        if value in ('-', b'-'):
+            return memoryview(get_binary_stdin().read())
+        try:
+            f, _should_close = open_stream(value, 'rb')
+        except OSError as e:
+            self.fail(f"'{format_filename(value)}': {e.strerror}", param, ctx)
+        with f:
+            try:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return memoryview(f.read())
+        view = memoryview(mapping)
+        if ctx is not None:
+            ctx.call_on_close(lambda: _close_mapping(view, mapping))
+        return view
+
+    def shell_complete(self, ctx: 'Context', param: 'Parameter', incomplete: str) -> t.List['CompletionItem']:
+        from click.shell_completion import CompletionItem
+        return [CompletionItem(incomplete, type='file')]
+
+def _close_mapping(view: memoryview, mapping: t.Any) -> None:
+    try:
+        view.release()
+    except BufferError:
+        pass
+    finally:
+        try:
+            mapping.close()
+        except BufferError:
+            pass
+
+_path_cache_key = f'{__name__}.path_cache'
+
+@contextmanager
+def _path_check_cache(ctx: t.Optional['Context']) -> t.Iterator[None]:
+    """Share the results of :class:`Path` checks through
+    :attr:`Context.meta` while the block runs. Nested blocks use the
+    outer cache, which is discarded when the outermost block exits.
+    """
+    if ctx is None or _path_cache_key in ctx.meta:
+        yield
+        return
+    ctx.meta[_path_cache_key] = {}
+    try:
+        yield
+    finally:
+        del ctx.meta[_path_cache_key]
+
 class Path(ParamType):
     """The ``Path`` type is similar to the :class:`File` type, but
     returns the filename instead of an open file. Various checks can be
@@ -366,6 +734,16 @@ class Path(ParamType):
     :param path_type: Convert the incoming path value to this type. If
         ``None``, keep Python's default, which is ``str``. Useful to
         convert to :class:`pathlib.Path`.
+    :param max_workers: Check the values of a ``multiple=True`` or
+        ``nargs`` parameter in a thread pool with this many workers, and
+        report all the invalid values in one error.
+
+    .. versionchanged:: 8.2.0
+        Successful filesystem checks are cached while a parameter's
+        values are converted, so each path is checked once.
+
+    .. versionchanged:: 8.2.0
+        Added the ``max_workers`` parameter.
 
     .. versionchanged:: 8.1
         Added the ``executable`` parameter.
@@ -378,7 +756,7 @@ class Path(ParamType):
     """
     envvar_list_splitter: t.ClassVar[str] = os.path.pathsep
 
-    def __init__(self, exists: bool=False, file_okay: bool=True, dir_okay: bool=True, writable: bool=False, readable: bool=True, resolve_path: bool=False, allow_dash: bool=False, path_type: t.Optional[t.Type[t.Any]]=None, executable: bool=False):
+    def __init__(self, exists: bool=False, file_okay: bool=True, dir_okay: bool=True, writable: bool=False, readable: bool=True, resolve_path: bool=False, allow_dash: bool=False, path_type: t.Optional[t.Type[t.Any]]=None, executable: bool=False, max_workers: t.Optional[int]=None):
         self.exists = exists
         self.file_okay = file_okay
         self.dir_okay = dir_okay
@@ -388,6 +766,7 @@ class Path(ParamType):
         self.resolve_path = resolve_path
         self.allow_dash = allow_dash
         self.type = path_type
+        self.max_workers = max_workers
         if self.file_okay and (not self.dir_okay):
             self.name: str = _('file')
         elif self.dir_okay and (not self.file_okay):
@@ -395,6 +774,92 @@ class Path(ParamType):
         else:
             self.name = _('path')
 
+    def coerce_path_result(self, value: 't.Union[str, os.PathLike[str]]') -> 't.Union[str, bytes, os.PathLike[str]]':
+        if self.type is not None and (not isinstance(value, self.type)):
+            if self.type is str:
+                return os.fsdecode(value)
+            elif self.type is bytes:
+                return os.fsencode(value)
+            else:
+                return t.cast('os.PathLike[str]', self.type(value))
+        return value
+
+    def _cached(self, ctx: t.Optional['Context'], key: t.Tuple[t.Any, ...], func: t.Callable[[], t.Any]) -> t.Any:
+        """Call ``func`` to check the filesystem, or return the result
+        of the same check made earlier while processing parameters. The
+        cache only exists inside :func:`_path_check_cache`, and failed
+        checks are not cached.
+        """
+        cache = ctx.meta.get(_path_cache_key) if ctx is not None else None
+        if cache is None:
+            return func()
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        rv = func()
+        if rv:
+            cache[key] = rv
+        return rv
+
+    def _stat(self, ctx: t.Optional['Context'], path: t.Any) -> t.Optional[os.stat_result]:
+
+        def stat_path() -> t.Optional[os.stat_result]:
+            try:
+                return os.stat(path)
+            except OSError:
+                return None
+        return self._cached(ctx, ('stat', os.path.abspath(path)), stat_path)
+
+    def _validate(self, value: t.Any, ctx: t.Optional['Context']) -> t.Tuple[t.Any, t.Optional[str]]:
+        """Check a path. Returns the path, resolved if needed, and an
+        error message if the path is invalid.
+        """
+        rv = value
+        is_dash = self.file_okay and self.allow_dash and (rv in (b'-', '-'))
+        if is_dash:
+            return (rv, None)
+        if self.resolve_path:
+            import pathlib
+            rv = self._cached(ctx, ('resolve', os.path.abspath(rv)), lambda: os.fsdecode(pathlib.Path(value).resolve()))
+        st = self._stat(ctx, rv)
+        name = self.name.title()
+        filename = format_filename(value)
+        if st is None:
+            if not self.exists:
+                return (rv, None)
+            return (rv, _('{name} {filename!r} does not exist.').format(name=name, filename=filename))
+        if not self.file_okay and stat.S_ISREG(st.st_mode):
+            return (rv, _('{name} {filename!r} is a file.').format(name=name, filename=filename))
+        if not self.dir_okay and stat.S_ISDIR(st.st_mode):
+            return (rv, _("{name} '{filename}' is a directory.").format(name=name, filename=filename))
+        for enabled, mode, message in ((self.readable, os.R_OK, _('{name} {filename!r} is not readable.')), (self.writable, os.W_OK, _('{name} {filename!r} is not writable.')), (self.executable, os.X_OK, _('{name} {filename!r} is not executable.'))):
+            if enabled and (not self._cached(ctx, ('access', os.path.abspath(rv), mode), partial(os.access, rv, mode))):
+                return (rv, message.format(name=name, filename=filename))
+        return (rv, None)
+
+    def convert(self, value: 't.Union[str, os.PathLike[str]]', param: t.Optional['Parameter'], ctx: t.Optional['Context']) -> 't.Union[str, bytes, os.PathLike[str]]':
+        rv, message = self._validate(value, ctx)
+        if message is not None:
+            self.fail(message, param, ctx)
+        return self.coerce_path_result(rv)
+
+    def convert_many(self, values: t.Iterable[t.Any], param: t.Optional['Parameter'], ctx: t.Optional['Context']) -> t.Tuple[t.Any, ...]:
+        if self.max_workers is None:
+            return super().convert_many(values, param, ctx)
+        from concurrent.futures import ThreadPoolExecutor
+
+        def validate(value: t.Any) -> t.Tuple[t.Any, t.Optional[str]]:
+            if value is None:
+                return (None, None)
+            return self._validate(value, ctx)
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            results = list(executor.map(validate, values))
+        messages = [message for rv, message in results if message is not None]
+        if messages:
+            self.fail('\n'.join(messages), param, ctx)
+        return tuple((None if rv is None else self.coerce_path_result(rv) for rv, message in results))
+
     def shell_complete(self, ctx: 'Context', param: 'Parameter', incomplete: str) -> t.List['CompletionItem']:
         """Return a special completion marker that tells the completion
         system to use the shell to provide path completions for only
@@ -431,6 +896,9 @@ def convert_type(ty: t.Optional[t.Any], default: t.Optional[t.Any]=None) -> Para
     value.
     """
     pass
+
+def _is_file_like(value: t.Any) -> 'te.TypeGuard[t.IO[t.Any]]':
+    return hasattr(value, 'read') or hasattr(value, 'write')
 UNPROCESSED = UnprocessedParamType()
 STRING = StringParamType()
 INT = IntParamType()
@@ -1,13 +1,16 @@
+import io
 import os
 import re
 import sys
 import typing as t
 from functools import update_wrapper
+from gettext import gettext as _
 from types import ModuleType
 from types import TracebackType
 from ._compat import _default_text_stderr
 from ._compat import _default_text_stdout
 from ._compat import _find_binary_writer
+from ._compat import _rebuffer_binary_stream
 from ._compat import auto_wrap_for_ansi
 from ._compat import binary_streams
 from ._compat import open_stream
@@ -23,7 +26,14 @@ R = t.TypeVar('R')
 
 def safecall(func: 't.Callable[P, R]') -> 't.Callable[P, t.Optional[R]]':
     """Wraps a function so that it swallows exceptions."""
-    pass
+
+    def wrapper(*args: 'P.args', **kwargs: 'P.kwargs') -> t.Optional[R]:
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            pass
+        return None
+    return update_wrapper(wrapper, func)
 
 def make_str(value: t.Any) -> str:
     """Converts a value into a valid string."""
@@ -38,18 +48,26 @@ class LazyFile:
     the file but it does perform some basic checks early to see if the
     filename parameter does make sense.  This is useful for safely opening
     files for writing.
+
+    .. versionchanged:: 8.2.0
+        Added the ``buffer_size``, ``fsync``, ``preallocate``, and
+        ``compression`` parameters.
     """
 
-    def __init__(self, filename: t.Union[str, 'os.PathLike[str]'], mode: str='r', encoding: t.Optional[str]=None, errors: t.Optional[str]='strict', atomic: bool=False):
+    def __init__(self, filename: t.Union[str, 'os.PathLike[str]'], mode: str='r', encoding: t.Optional[str]=None, errors: t.Optional[str]='strict', atomic: bool=False, buffer_size: t.Optional[int]=None, fsync: str='none', preallocate: t.Optional[int]=None, compression: t.Optional[str]=None):
         self.name: str = os.fspath(filename)
         self.mode = mode
         self.encoding = encoding
         self.errors = errors
         self.atomic = atomic
+        self.buffer_size = buffer_size
+        self.fsync = fsync
+        self.preallocate = preallocate
+        self.compression = compression
         self._f: t.Optional[t.IO[t.Any]]
         self.should_close: bool
         if self.name == '-':
-            self._f, self.should_close = open_stream(filename, mode, encoding, errors)
+            self._f, self.should_close = open_stream(filename, mode, encoding, errors, buffer_size=buffer_size, compression=compression)
         else:
             if 'r' in mode:
                 open(filename, mode).close()
@@ -69,17 +87,27 @@ class LazyFile:
         a :exc:`FileError`.  Not handling this error will produce an error
         that Click shows.
         """
-        pass
+        if self._f is not None:
+            return self._f
+        try:
+            rv, self.should_close = open_stream(self.name, self.mode, self.encoding, self.errors, atomic=self.atomic, buffer_size=self.buffer_size, fsync=self.fsync, preallocate=self.preallocate, compression=self.compression)
+        except OSError as e:
+            from .exceptions import FileError
+            raise FileError(self.name, hint=e.strerror) from e
+        self._f = rv
+        return rv
 
     def close(self) -> None:
         """Closes the underlying file, no matter what."""
-        pass
+        if self._f is not None:
+            self._f.close()
 
     def close_intelligently(self) -> None:
         """This function only closes the file if it was opened by the lazy
         file wrapper.  For instance this will never close stdin.
         """
-        pass
+        if self.should_close:
+            self.close()
 
     def __enter__(self) -> 'LazyFile':
         return self
@@ -152,13 +180,29 @@ def echo(message: t.Optional[t.Any]=None, file: t.Optional[t.IO[t.Any]]=None, nl
     """
     pass
 
-def get_binary_stream(name: "te.Literal['stdin', 'stdout', 'stderr']") -> t.BinaryIO:
+def get_binary_stream(name: "te.Literal['stdin', 'stdout', 'stderr']", buffer_size: t.Optional[int]=None) -> t.BinaryIO:
     """Returns a system stream for byte processing.
 
     :param name: the name of the stream to open.  Valid names are ``'stdin'``,
                  ``'stdout'`` and ``'stderr'``
+    :param buffer_size: Open a new stream with this buffer size over the
+        same file descriptor, instead of returning the system stream.
+        Closing it does not close the file descriptor. Output that was
+        already written to the system stream is flushed first, but input
+        that the system stream has already buffered is not seen by the
+        new stream, so don't mix the two.
+
+    .. versionchanged:: 8.2.0
+        Added the ``buffer_size`` parameter.
     """
-    pass
+    opener = binary_streams.get(name)
+    if opener is None:
+        raise TypeError(f"Unknown standard stream '{name}'")
+    stream = opener()
+    if buffer_size is not None:
+        mode = 'rb' if name == 'stdin' else 'wb'
+        stream = _rebuffer_binary_stream(stream, mode, buffer_size)
+    return stream
 
 def get_text_stream(name: "te.Literal['stdin', 'stdout', 'stderr']", encoding: t.Optional[str]=None, errors: t.Optional[str]='strict') -> t.TextIO:
     """Returns a system stream for text processing.  This usually returns
@@ -171,9 +215,12 @@ def get_text_stream(name: "te.Literal['stdin', 'stdout', 'stderr']", encoding: t
     :param encoding: overrides the detected default encoding.
     :param errors: overrides the default error mode.
     """
-    pass
+    opener = text_streams.get(name)
+    if opener is None:
+        raise TypeError(f"Unknown standard stream '{name}'")
+    return opener(encoding, errors)
 
-def open_file(filename: str, mode: str='r', encoding: t.Optional[str]=None, errors: t.Optional[str]='strict', lazy: bool=False, atomic: bool=False) -> t.IO[t.Any]:
+def open_file(filename: str, mode: str='r', encoding: t.Optional[str]=None, errors: t.Optional[str]='strict', lazy: bool=False, atomic: bool=False, buffer_size: t.Optional[int]=None, fsync: str='none', preallocate: t.Optional[int]=None, compression: t.Optional[str]=None) -> t.IO[t.Any]:
     """Open a file, with extra behavior to handle ``'-'`` to indicate
     a standard stream, lazy open on write, and atomic write. Similar to
     the behavior of the :class:`~click.File` param type.
@@ -199,10 +246,113 @@ def open_file(filename: str, mode: str='r', encoding: t.Optional[str]=None, erro
         early, then closed until it is read again.
     :param atomic: Write to a temporary file and replace the given file
         on close.
+    :param buffer_size: The size of the buffer to read or write the file
+        with. Uses Python's default if not given.
+    :param fsync: With ``atomic``, flush the data to disk before
+        replacing the file. ``'none'`` doesn't sync, ``'file'`` syncs
+        the file's data, and ``'dir'`` also syncs the directory so the
+        rename is durable.
+    :param preallocate: With ``atomic``, reserve this many bytes for the
+        file when it is created, if the platform supports it.
+    :param compression: Decompress or compress the file with
+        ``'gzip'``, ``'bz2'``, ``'xz'``, or ``'zstd'``. ``'auto'``
+        detects the codec from the file's first bytes when reading, and
+        from the file extension when writing.
+
+    .. versionchanged:: 8.2.0
+        Added the ``buffer_size``, ``fsync``, ``preallocate``, and
+        ``compression`` parameters.
 
     .. versionadded:: 3.0
     """
-    pass
+    if lazy:
+        return t.cast(t.IO[t.Any], LazyFile(filename, mode, encoding, errors, atomic=atomic, buffer_size=buffer_size, fsync=fsync, preallocate=preallocate, compression=compression))
+    f, should_close = open_stream(filename, mode, encoding, errors, atomic=atomic, buffer_size=buffer_size, fsync=fsync, preallocate=preallocate, compression=compression)
+    if not should_close:
+        f = t.cast(t.IO[t.Any], KeepOpenFile(f))
+    return f
+
+def copy_stream(src: t.BinaryIO, dst: t.BinaryIO, buffer_size: int=1048576) -> int:
+    """Copy the rest of a binary stream to another binary stream, and
+    return the number of bytes copied.
+
+    If both streams are backed by file descriptors, the data is copied
+    by the kernel with :func:`os.sendfile` or :func:`os.splice` where
+    the platform supports it, without passing through Python. Otherwise
+    it is read and written in large blocks through one reused buffer.
+
+    :param src: The stream to read from.
+    :param dst: The stream to write to. It is flushed before and after
+        the copy.
+    :param buffer_size: The most data to copy in one step.
+
+    .. versionadded:: 8.2.0
+    """
+    total = 0
+    dst.flush()
+    fds = _get_copy_fds(src, dst)
+    if fds is not None:
+        in_fd, out_fd = fds
+        if isinstance(src, (io.BufferedReader, io.BufferedRandom)):
+            pending = src.read(len(src.peek(1)))
+            if not pending:
+                return total
+            dst.write(pending)
+            dst.flush()
+            total += len(pending)
+        copiers = []
+        if hasattr(os, 'sendfile'):
+            copiers.append(lambda: os.sendfile(out_fd, in_fd, None, buffer_size))
+        if hasattr(os, 'splice'):
+            copiers.append(lambda: os.splice(in_fd, out_fd, buffer_size))
+        for copy in copiers:
+            copied = _copy_fd(copy)
+            if copied is not None:
+                for stream, fd in ((src, in_fd), (dst, out_fd)):
+                    if stream.seekable():
+                        stream.seek(os.lseek(fd, 0, os.SEEK_CUR))
+                return total + copied
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    while True:
+        n = src.readinto(view)
+        if not n:
+            break
+        dst.write(view[:n])
+        total += n
+    dst.flush()
+    return total
+
+def _get_copy_fds(src: t.BinaryIO, dst: t.BinaryIO) -> t.Optional[t.Tuple[int, int]]:
+    """Get the file descriptors to copy between, or ``None`` if one of
+    the streams is not a plain binary file that can be copied by the
+    kernel.
+    """
+    binary_types = (io.BufferedReader, io.BufferedWriter, io.BufferedRandom, io.FileIO)
+    if not isinstance(src, binary_types) or not isinstance(dst, binary_types):
+        return None
+    try:
+        return (src.fileno(), dst.fileno())
+    except (OSError, ValueError):
+        return None
+
+def _copy_fd(copy: t.Callable[[], int]) -> t.Optional[int]:
+    """Call a copy function, such as :func:`os.sendfile` between two
+    file descriptors, until it reaches the end of the input. Returns
+    ``None`` if the first call fails, which means the function doesn't
+    support these descriptors and nothing was copied.
+    """
+    total = 0
+    while True:
+        try:
+            n = copy()
+        except OSError:
+            if total == 0:
+                return None
+            raise
+        if n == 0:
+            return total
+        total += n
 
 def format_filename(filename: 't.Union[str, bytes, os.PathLike[str], os.PathLike[bytes]]', shorten: bool=False) -> str:
     """Format a filename as a string for display. Ensures the filename can be
@@ -323,4 +473,50 @@ def _expand_args(args: t.Iterable[str], *, user: bool=True, env: bool=True, glob
 
     :meta private:
     """
-    pass
\ No newline at end of file
+    pass
+
+def _expand_response_files(args: t.Iterable[str], *, encoding: t.Optional[str]=None, _active: t.Optional[t.Set[str]]=None, _base: t.Optional[str]=None) -> t.Iterator[str]:
+    """Replace each ``@file`` argument with the arguments read from that
+    file, like many compilers do for argument lists that are too long
+    for the command line.
+
+    The file is split like :func:`~click.parser.split_arg_string` while
+    it is read, and each argument is yielded as soon as it is read. A
+    missing closing quote or incomplete escape sequence is an error.
+    Files may contain further ``@file`` arguments, relative paths in a
+    file are relative to the directory of that file. A file that
+    includes itself, directly or through another file, is an error.
+
+    :param args: Command line arguments to expand.
+    :param encoding: Encoding used to read the files. Defaults to the
+        locale encoding.
+
+    .. versionadded:: 8.2.0
+
+    :meta private:
+    """
+    from .exceptions import FileError
+    from .parser import _iter_arg_string
+    if _active is None:
+        _active = set()
+    for arg in args:
+        if len(arg) < 2 or arg[0] != '@':
+            yield arg
+            continue
+        filename = arg[1:]
+        if _base is not None:
+            filename = os.path.join(_base, filename)
+        key = os.path.realpath(filename)
+        if key in _active:
+            raise FileError(filename, hint=_('the response file includes itself'))
+        try:
+            f = open(filename, encoding=encoding)
+        except OSError as e:
+            raise FileError(filename, hint=e.strerror) from e
+        _active.add(key)
+        with f:
+            try:
+                yield from _expand_response_files(_iter_arg_string(f, strict=True), encoding=encoding, _active=_active, _base=os.path.dirname(filename))
+            except ValueError as e:
+                raise FileError(filename, hint=str(e)) from None
+        _active.discard(key)
\ No newline at end of file
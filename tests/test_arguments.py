@@ -1,3 +1,4 @@
+import subprocess
 import sys
 from unittest import mock
 
@@ -19,6 +20,100 @@ def test_nargs_star(runner):
     assert result.output.splitlines() == ["src=foo.txt|bar.txt", "dst=dir"]
 
 
+def test_nargs_star_many_values(runner):
+    @click.command()
+    @click.argument("ids", nargs=-1, type=click.IntRange(0))
+    def cli(ids):
+        click.echo(sum(ids))
+
+    result = runner.invoke(cli, [str(i) for i in range(10_000)])
+    assert not result.exception
+    assert result.output == f"{sum(range(10_000))}\n"
+    result = runner.invoke(cli, ["1", "--", "-2", "x"])
+    assert result.exit_code == 2
+    assert "-2 is not in the range x>=0." in result.output
+
+
+def test_nargs_star_lazy(runner):
+    seen = []
+
+    @click.command()
+    @click.argument("values", nargs=-1, lazy=True, type=click.INT)
+    def cli(values):
+        assert not isinstance(values, tuple)
+
+        for value in values:
+            seen.append(value)
+
+    result = runner.invoke(cli, ["1", "2", "x", "4"])
+    assert result.exit_code == 2
+    assert "'x' is not a valid integer." in result.output
+    assert seen == [1, 2]
+
+
+def test_nargs_star_lazy_stdin(runner):
+    @click.command()
+    @click.argument("values", nargs=-1, lazy=True, type=click.INT)
+    def cli(values):
+        click.echo(list(values))
+
+    result = runner.invoke(cli, ["1", "-", "4"], input="2\n\n3\n")
+    assert not result.exception
+    assert result.output == "[1, 2, 3, 4]\n"
+
+
+def test_nargs_star_lazy_piped_stdin():
+    code = """
+import click
+
+@click.command()
+@click.argument("values", nargs=-1, lazy=True, type=click.INT)
+def cli(values):
+    click.echo(sum(values))
+
+cli(["1", "-", "4"])
+"""
+    rv = subprocess.run(
+        [sys.executable, "-c", code],
+        input=b"2\n3\n",
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    assert rv.stdout.strip() == b"10"
+
+
+@pytest.mark.parametrize(
+    ("type", "expect"),
+    [(click.File(), "stdin\n\n"), (click.Path(allow_dash=True), "-\n")],
+)
+def test_nargs_star_lazy_keeps_dash(runner, type, expect):
+    @click.command()
+    @click.argument("values", nargs=-1, lazy=True, type=type)
+    def cli(values):
+        for value in values:
+            click.echo(value if isinstance(value, str) else value.read())
+
+    result = runner.invoke(cli, ["-"], input="stdin\n")
+    assert not result.exception
+    assert result.output == expect
+
+
+def test_nargs_star_lazy_required(runner):
+    @click.command()
+    @click.argument("values", nargs=-1, lazy=True, required=True)
+    def cli(values):
+        pass
+
+    result = runner.invoke(cli, [])
+    assert result.exit_code == 2
+    assert "Missing argument 'VALUES...'" in result.output
+
+
+def test_lazy_requires_nargs_star():
+    with pytest.raises(TypeError, match="nargs=-1"):
+        click.Argument(["value"], lazy=True)
+
+
 def test_argument_unbounded_nargs_cant_have_default(runner):
     with pytest.raises(TypeError, match="nargs=-1"):
 
@@ -155,6 +250,20 @@ def test_file_atomics(runner):
             assert f.read() == b"Foo bar baz\n"
 
 
+def test_file_compression_stdin(runner):
+    import gzip
+
+    @click.command()
+    @click.argument("input", type=click.File(compression="auto"))
+    def cli(input):
+        click.echo(input.read())
+
+    result = runner.invoke(cli, ["-"], input=gzip.compress(b"compressed"))
+    assert result.output == "compressed\n"
+    result = runner.invoke(cli, ["-"], input="plain")
+    assert result.output == "plain\n"
+
+
 def test_stdout_default(runner):
     @click.command()
     @click.argument("output", type=click.File("w"), default="-")
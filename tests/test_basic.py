@@ -53,6 +53,88 @@ def test_return_values():
         assert rv == 42
 
 
+def test_invoke_many():
+    @click.command()
+    @click.option("--count", type=int, default=1)
+    @click.pass_context
+    def cli(ctx, count):
+        if count < 0:
+            ctx.exit(3)
+
+        return count * 2
+
+    results = cli.invoke_many([[], ["--count", "4"], ["--count", "x"], ["--count=-1"]])
+    assert [rv for rv, _ in results] == [2, 8, None, 3]
+    assert isinstance(results[2][1], click.BadParameter)
+    assert [e for _, e in results if e is not None] == [results[2][1]]
+
+
+def test_invoke_many_matches_main():
+    @click.group()
+    def cli():
+        pass
+
+    @cli.command()
+    @click.argument("name")
+    def hello(name):
+        return f"Hello {name}!"
+
+    argvs = [["hello", "a"], ["hello", "b"], ["missing"]]
+    results = cli.invoke_many(argvs, prog_name="cli")
+
+    for args, (rv, error) in zip(argvs, results):
+        try:
+            expect = cli.main(args, "cli", standalone_mode=False)
+        except click.UsageError as e:
+            assert type(error) is type(e)
+            assert error.format_message() == e.format_message()
+        else:
+            assert error is None
+            assert rv == expect
+
+
+def test_invoke_many_environ_snapshot(monkeypatch):
+    monkeypatch.setenv("TEST_NAME", "a")
+
+    @click.command()
+    @click.option("--name", envvar="TEST_NAME")
+    def cli(name):
+        os.environ["TEST_NAME"] = "b"
+        return name
+
+    results = cli.invoke_many([[], [], ["--name", "c"]], prog_name="cli")
+    assert results == [("a", None), ("a", None), ("c", None)]
+    assert cli.main([], "cli", standalone_mode=False) == "b"
+
+
+def test_invoke_many_default_lookup():
+    class DefaultMap(dict):
+        lookups = 0
+
+        def get(self, *args):
+            self.lookups += 1
+            return super().get(*args)
+
+    calls = []
+
+    @click.command()
+    @click.option("--name")
+    @click.option("--count", type=int, default=lambda: len(calls))
+    def cli(name, count):
+        calls.append(count)
+        return name
+
+    single = DefaultMap(name="a")
+    assert cli.invoke_many([[]], prog_name="cli", default_map=single) == [("a", None)]
+    calls.clear()
+    default_map = DefaultMap(name="a")
+    results = cli.invoke_many([[]] * 3, prog_name="cli", default_map=default_map)
+    assert results == [("a", None)] * 3
+    # Callable defaults run for each invocation, lookups happen once.
+    assert calls == [0, 1, 2]
+    assert default_map.lookups == single.lookups
+
+
 def test_basic_group(runner):
     @click.group()
     def cli():
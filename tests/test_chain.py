@@ -1,4 +1,7 @@
+import asyncio
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -104,6 +107,28 @@ def test_no_command_result_callback(runner, chain, expect):
     assert result.output == expect
 
 
+def test_async_result_callback_chained(runner):
+    @click.group(chain=True)
+    def cli():
+        pass
+
+    @cli.command()
+    async def a():
+        return 1
+
+    @cli.result_callback()
+    async def add(values):
+        return sum(values)
+
+    @cli.result_callback()
+    def double(value):
+        click.echo(value * 2)
+
+    result = runner.invoke(cli, ["a", "a"])
+    assert not result.exception
+    assert result.output == "4\n"
+
+
 def test_chaining_with_arguments(runner):
     @click.group(chain=True)
     def cli():
@@ -243,3 +268,164 @@ def test_multicommand_chaining(runner):
     result = runner.invoke(cli, ["l1a", "l2a", "l1b"])
     assert not result.exception
     assert result.output.splitlines() == ["cli=", "l1a=", "l2a=", "l1b="]
+
+
+def test_chain_executor_runs_concurrently(runner):
+    barrier = threading.Barrier(3, timeout=5)
+
+    @click.group(chain=True, chain_executor="thread")
+    def cli():
+        pass
+
+    @cli.command()
+    @click.argument("value")
+    @click.pass_context
+    def step(ctx, value):
+        # Every step waits for the others, so this only passes if they run
+        # at the same time.
+        barrier.wait()
+        assert click.get_current_context() is ctx
+        assert ctx.params == {"value": value}
+        return value
+
+    @cli.result_callback()
+    def process(values):
+        click.echo(" ".join(values))
+
+    result = runner.invoke(cli, ["step", "a", "step", "b", "step", "c"])
+    assert not result.exception
+    assert result.output == "a b c\n"
+
+
+def test_chain_executor_async_callbacks(runner):
+    loops = []
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+
+        @click.group(chain=True, chain_executor=pool)
+        def cli():
+            pass
+
+        @cli.command()
+        @click.argument("value", type=int)
+        async def step(value):
+            loops.append(asyncio.get_running_loop())
+            await asyncio.sleep(0)
+            return value * 2
+
+        @cli.result_callback()
+        def process(values):
+            click.echo(values)
+
+        result = runner.invoke(cli, ["step", "1", "step", "2"])
+
+    assert not result.exception
+    assert result.output == "[2, 4]\n"
+    # Each worker runs its subcommand in its own event loop.
+    assert len(set(loops)) == 2
+    assert all(loop.is_closed() for loop in loops)
+
+
+def test_chain_executor_error(runner):
+    @click.group(chain=True, chain_executor="thread")
+    def cli():
+        pass
+
+    @cli.command()
+    @click.argument("value")
+    def step(value):
+        if value != "ok":
+            raise click.ClickException(f"failed {value}")
+
+    result = runner.invoke(cli, ["step", "ok", "step", "x", "step", "y"])
+    assert result.exit_code == 1
+    assert "failed x" in result.output
+
+
+def test_chain_executor_invalid():
+    with pytest.raises(ValueError, match="chain_executor"):
+        click.Group(chain=True, chain_executor="process")
+
+
+def test_chain_executor_requires_chain():
+    with pytest.raises(TypeError, match="chain_executor"):
+        click.Group(chain_executor="thread")
+
+
+def test_stream_results(runner):
+    events = []
+
+    @click.group(chain=True, stream_results=True)
+    def cli():
+        pass
+
+    @cli.command()
+    @click.argument("value")
+    def step(value):
+        events.append(f"invoke {value}")
+        return value
+
+    @cli.result_callback()
+    def process(values):
+        assert not isinstance(values, list)
+
+        for value in values:
+            events.append(f"result {value}")
+
+            if value == "b":
+                break
+
+    result = runner.invoke(cli, ["step", "a", "step", "b", "step", "c"])
+    assert not result.exception
+    assert events == [
+        "invoke a",
+        "result a",
+        "invoke b",
+        "result b",
+        "invoke c",
+    ]
+
+
+def test_stream_results_parse_error_after_output(runner):
+    @click.group(chain=True, stream_results=True)
+    def cli():
+        pass
+
+    @cli.command()
+    def step():
+        return "ok"
+
+    @cli.result_callback()
+    def process(values):
+        for value in values:
+            click.echo(value)
+
+    result = runner.invoke(cli, ["step", "missing"])
+    assert result.exit_code == 2
+    assert result.output.startswith("ok\n")
+    assert "No such command 'missing'" in result.output
+
+
+def test_stream_results_requires_chain():
+    with pytest.raises(TypeError, match="stream_results"):
+        click.Group(stream_results=True)
+
+
+def test_stream_results_without_command(runner):
+    @click.group(chain=True, stream_results=True, invoke_without_command=True)
+    def cli():
+        pass
+
+    @cli.result_callback()
+    def process(values):
+        assert not isinstance(values, list)
+        click.echo(list(values))
+
+    result = runner.invoke(cli, [])
+    assert not result.exception
+    assert result.output == "[]\n"
+
+
+def test_stream_results_with_executor():
+    with pytest.raises(TypeError, match="stream_results"):
+        click.Group(chain=True, stream_results=True, chain_executor="thread")
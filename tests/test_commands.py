@@ -1,4 +1,5 @@
 import re
+import sys
 
 import pytest
 
@@ -409,3 +410,155 @@ def test_abort_exceptions_with_disabled_standalone_mode(runner, exc):
     assert rv.exit_code == 1
     assert isinstance(rv.exception.__cause__, exc)
     assert rv.exception.__cause__.args == ("catch me!",)
+
+
+@pytest.fixture
+def lazy_modules(tmp_path, monkeypatch):
+    for name in ("lazy_foo", "lazy_bar"):
+        tmp_path.joinpath(f"{name}.py").write_text(
+            "import click\n\n"
+            "@click.command()\n"
+            "def cli():\n"
+            f'    """Help for {name}."""\n'
+            f'    click.echo("{name} invoked")\n'
+        )
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+
+def test_lazy_group_help_does_not_import(runner, lazy_modules):
+    cli = click.LazyGroup(
+        "cli",
+        lazy_subcommands={"foo": "lazy_foo:cli", "bar": "lazy_bar.cli"},
+        help_manifest={"foo": "Manifest help for foo."},
+    )
+    result = runner.invoke(cli, ["--help"])
+    assert not result.exception
+    assert "foo  Manifest help for foo." in result.output
+    assert "bar" in result.output
+    assert "lazy_foo" not in sys.modules
+    assert "lazy_bar" not in sys.modules
+
+
+def test_lazy_group_imports_selected_command(runner, lazy_modules):
+    cli = click.LazyGroup(
+        "cli", lazy_subcommands={"foo": "lazy_foo:cli", "bar": "lazy_bar:cli"}
+    )
+    assert cli.list_commands(click.Context(cli)) == ["bar", "foo"]
+    result = runner.invoke(cli, ["foo"])
+    assert result.output == "lazy_foo invoked\n"
+    assert "lazy_foo" in sys.modules
+    assert "lazy_bar" not in sys.modules
+
+
+def test_lazy_group_manifest_hides_commands(runner, lazy_modules):
+    cli = click.LazyGroup(
+        "cli",
+        lazy_subcommands={"foo": "lazy_foo:cli", "bar": "lazy_bar:cli"},
+        help_manifest={"bar": None},
+    )
+    result = runner.invoke(cli, ["--help"])
+    assert "foo" in result.output
+    assert "bar" not in result.output
+
+
+def test_lazy_group_build_manifest(lazy_modules):
+    cli = click.LazyGroup("cli", lazy_subcommands={"foo": "lazy_foo:cli"})
+    assert cli.build_manifest(click.Context(cli)) == {"foo": "Help for lazy_foo."}
+
+
+def test_lazy_group_rejects_non_command(lazy_modules):
+    cli = click.LazyGroup("cli", lazy_subcommands={"foo": "lazy_foo:click"})
+
+    with pytest.raises(TypeError, match="did not return a command"):
+        cli.get_command(click.Context(cli), "foo")
+
+
+def test_expand_response_files(runner, tmp_path):
+    path = tmp_path / "args.txt"
+    path.write_text("--count 2\n'a b'\nc\n")
+
+    @click.command()
+    @click.option("--count", type=int)
+    @click.argument("values", nargs=-1)
+    def cli(count, values):
+        click.echo(f"{count} {values}")
+
+    result = runner.invoke(cli, [f"@{path}", "d"], expand_response_files=True)
+    assert result.output == "2 ('a b', 'c', 'd')\n"
+    result = runner.invoke(cli, [f"@{path}"])
+    assert result.output == f"None ('@{path}',)\n"
+    result = runner.invoke(cli, ["@missing.txt"], expand_response_files=True)
+    assert result.exit_code == 1
+    assert "Could not open file" in result.output
+
+
+def test_help_cached(monkeypatch):
+    cli = click.Command("cli", params=[click.Option(["--alpha"], help="Alpha.")])
+    calls = []
+    format_help = cli.format_help
+    monkeypatch.setattr(
+        cli, "format_help", lambda *a: calls.append(a) or format_help(*a)
+    )
+    ctx = click.Context(cli, info_name="cli", terminal_width=80)
+    first = cli.get_help(ctx)
+    assert cli.get_help(ctx) == first
+    assert len(calls) == 1
+    wide = click.Context(cli, info_name="cli", terminal_width=120)
+    cli.get_help(wide)
+    assert len(calls) == 2
+    cli.params[0].help = "Changed."
+    assert "Changed." in cli.get_help(ctx)
+    cli.params.append(click.Option(["--beta"], help="Beta."))
+    assert "--beta" in cli.get_help(ctx)
+    assert len(calls) == 4
+
+
+def test_help_not_cached():
+    cli = click.Command(
+        "cli", params=[click.Option(["--alpha"], show_default=True, show_envvar=True)]
+    )
+    ctx = click.Context(cli, info_name="cli", auto_envvar_prefix="A")
+    assert "A_ALPHA" in ctx.get_help()
+    ctx = click.Context(cli, info_name="cli", auto_envvar_prefix="B")
+    assert "B_ALPHA" in ctx.get_help()
+    ctx = click.Context(cli, info_name="cli", default_map={"alpha": "a"})
+    assert "[default: a]" in ctx.get_help()
+    ctx = click.Context(cli, info_name="cli", default_map={"alpha": "b"})
+    assert "[default: b]" in ctx.get_help()
+
+
+def test_help_cache_opt_in(monkeypatch):
+    cli = click.Command("cli", params=[click.Option(["--alpha"], help="Alpha.")])
+    calls = []
+    format_help = cli.format_help
+    monkeypatch.setattr(
+        cli, "format_help", lambda *a: calls.append(a) or format_help(*a)
+    )
+    cache = {}
+    ctx = click.Context(cli, info_name="cli", help_cache=cache)
+    first = ctx.get_help()
+    assert ctx.get_help() == first
+    assert cache == {"cli": first}
+    assert len(calls) == 1
+
+
+def test_dump_help(runner):
+    @click.group()
+    def cli():
+        pass
+
+    @cli.command()
+    def sub():
+        """Sub help."""
+
+    with click.Context(cli, info_name="cli") as ctx:
+        pages = cli.dump_help(ctx)
+
+    assert list(pages) == ["cli", "cli sub"]
+    assert "Sub help." in pages["cli sub"]
+    result = runner.invoke(cli, ["sub", "--help"], help_cache=pages)
+    assert result.output == f"{pages['cli sub']}\n"
+    result = runner.invoke(cli, ["sub", "--help"], help_cache={"cli sub": "Stored."})
+    assert result.output == "Stored.\n"
@@ -1,4 +1,7 @@
+import pytest
+
 from click._compat import should_strip_ansi
+from click._compat import term_len
 
 
 def test_is_jupyter_kernel_output():
@@ -8,3 +11,20 @@ def test_is_jupyter_kernel_output():
     # implementation detail, aka cheapskate test
     JupyterKernelFakeStream.__module__ = "ipykernel.faked"
     assert not should_strip_ansi(stream=JupyterKernelFakeStream())
+
+
+@pytest.mark.parametrize(
+    ("value", "expect"),
+    [
+        ("abc", 3),
+        ("\x1b[31mabc\x1b[0m", 3),
+        ("caf\u00e9", 4),
+        ("cafe\u0301", 4),
+        ("\u65e5\u672c\u8a9e", 6),
+        ("\x1b[1m\ud55c\uad6d\x1b[0m", 4),
+        ("\U0001f600", 2),
+        ("a\u200bb", 2),
+    ],
+)
+def test_term_len(value, expect):
+    assert term_len(value) == expect
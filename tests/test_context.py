@@ -1,3 +1,6 @@
+import asyncio
+import inspect
+from contextlib import asynccontextmanager
 from contextlib import contextmanager
 
 import pytest
@@ -253,6 +256,128 @@ def test_with_resource():
     assert rv == [0]
 
 
+def test_with_async_resource():
+    events = []
+
+    @asynccontextmanager
+    async def manager(name):
+        events.append(f"enter {name}")
+        yield name
+        events.append(f"exit {name}")
+
+    @contextmanager
+    def sync_manager():
+        events.append("enter sync")
+        yield
+        events.append("exit sync")
+
+    @click.command()
+    @click.pass_context
+    async def cli(ctx):
+        assert await ctx.with_async_resource(manager("a")) == "a"
+        ctx.with_resource(sync_manager())
+
+    ctx = click.Context(click.Command("test"))
+
+    with ctx.scope():
+        assert ctx.with_resource(manager("b")) == "b"
+        ctx.invoke(cli)
+
+    assert events == [
+        "enter b",
+        "enter a",
+        "enter sync",
+        "exit sync",
+        "exit a",
+        "exit b",
+    ]
+    assert ctx._loop is None
+
+
+def test_async_callbacks_share_loop(runner):
+    loops = []
+
+    @click.group(chain=True)
+    async def cli():
+        loops.append(asyncio.get_running_loop())
+
+    @cli.command()
+    @click.argument("value")
+    async def a(value):
+        loops.append(asyncio.get_running_loop())
+        await asyncio.sleep(0)
+        return value
+
+    @cli.result_callback()
+    async def process(values):
+        loops.append(asyncio.get_running_loop())
+        click.echo(" ".join(values))
+
+    result = runner.invoke(cli, ["a", "1", "a", "2"])
+    assert not result.exception
+    assert result.output == "1 2\n"
+    assert len(loops) == 4
+    assert len(set(loops)) == 1
+    assert loops[0].is_closed()
+
+
+def test_ainvoke():
+    @click.command()
+    @click.option("--count", default=1)
+    async def other(count):
+        await asyncio.sleep(0)
+        return count * 2
+
+    async def main():
+        ctx = click.Context(click.Command("test"))
+
+        async with ctx:
+            assert await ctx.ainvoke(other) == 2
+            assert await ctx.ainvoke(other, count=3) == 6
+
+            with pytest.raises(RuntimeError, match="ainvoke"):
+                ctx.invoke(other)
+
+    asyncio.run(main())
+
+
+def test_pass_decorators_keep_async():
+    class Foo:
+        value = 2
+
+    pass_foo = click.make_pass_decorator(Foo, ensure=True)
+
+    @click.command()
+    @pass_foo
+    async def with_foo(foo):
+        await asyncio.sleep(0)
+        return foo.value
+
+    @click.command()
+    @click.pass_obj
+    async def with_obj(obj):
+        return obj
+
+    @click.command()
+    @click.pass_meta_key("key")
+    async def with_meta(value):
+        return value
+
+    assert inspect.iscoroutinefunction(with_foo.callback)
+    assert inspect.iscoroutinefunction(with_obj.callback)
+
+    async def main():
+        ctx = click.Context(click.Command("test"), obj=3)
+        ctx.meta["key"] = 4
+
+        async with ctx:
+            assert await ctx.ainvoke(with_foo) == 2
+            assert await ctx.ainvoke(with_obj) == 3
+            assert await ctx.ainvoke(with_meta) == 4
+
+    asyncio.run(main())
+
+
 def test_make_pass_decorator_args(runner):
     """
     Test to check that make_pass_decorator doesn't consume arguments based on
@@ -1,4 +1,12 @@
+import io
+import random
+import textwrap
+
+import pytest
+
 import click
+from click import _textwrap
+from click import formatting
 
 
 def test_basic_functionality(runner):
@@ -366,3 +374,145 @@ def test_help_formatter_write_text():
     actual = formatter.getvalue()
     expected = "  Lorem ipsum dolor sit amet,\n  consectetur adipiscing elit\n"
     assert actual == expected
+
+
+def test_wrap_text_ignores_ansi_width():
+    word = click.style("red", fg="red")
+    lines = click.wrap_text(" ".join([word] * 10), 20).splitlines()
+    assert lines == [" ".join([word] * 5)] * 2
+    assert click.unstyle(click.wrap_text(word * 10, 8)).splitlines() == [
+        "redredre",
+        "dredredr",
+        "edredred",
+        "redred",
+    ]
+
+
+class _ReferenceWrapper(_textwrap.TextWrapper):
+    # The line loop from the standard library, with the same handling
+    # of long words as the single pass implementation.
+    _wrap_chunks = textwrap.TextWrapper._wrap_chunks
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_wrap_text_matches_textwrap(seed):
+    rng = random.Random(seed)
+    words = ["a", "bb", "word", "x" * 30, "hyphen-ated", "--opt", "12-345678", "  "]
+
+    for _ in range(200):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(0, 30)))
+        width = rng.randint(6, 40)
+        initial_indent = rng.choice(["", ">>>> "])
+        subsequent_indent = rng.choice(["", "  "])
+        expect = _ReferenceWrapper(
+            width,
+            initial_indent=initial_indent,
+            subsequent_indent=subsequent_indent,
+            replace_whitespace=False,
+        ).fill(text)
+        assert click.wrap_text(text, width, initial_indent, subsequent_indent) == expect
+
+
+def test_wrap_text_long_word_breaks_on_hyphen():
+    assert click.wrap_text("12-345678", 6) == "12-\n345678"
+
+
+def test_wrap_text_indent_wider_than_width():
+    assert click.wrap_text(" a", 2, initial_indent="    ") == "    a"
+
+
+def test_write_dl_large_table(monkeypatch):
+    calls = []
+    term_len = formatting.term_len
+
+    def counting_term_len(value):
+        calls.append(value)
+        return term_len(value)
+
+    monkeypatch.setattr(formatting, "term_len", counting_term_len)
+    monkeypatch.setattr(_textwrap, "term_len", counting_term_len)
+
+    def render(count):
+        rows = [
+            (f"command-{i:04}", f"Help for command {i:04}. " * 5) for i in range(count)
+        ]
+        formatter = click.HelpFormatter(width=80)
+        calls.clear()
+        formatter.write_dl(rows)
+        return len(calls), formatter.getvalue()
+
+    small, _ = render(500)
+    large, output = render(2000)
+    lines = output.splitlines()
+    assert lines[0].startswith("command-0000  Help for command 0000.")
+    assert sum(line.startswith("command-") for line in lines) == 2000
+    assert all(len(line) <= 78 for line in lines)
+    # Each row is measured the same number of times, regardless of how
+    # many rows there are.
+    assert large == small * 4
+
+
+def test_help_formatter_stream():
+    def write(formatter):
+        formatter.write_usage("cli", "[OPTIONS]")
+        with formatter.section("Options"):
+            formatter.write_dl([("-a", "Alpha."), ("-b", "Beta.")])
+
+    formatter = click.HelpFormatter(width=40)
+    write(formatter)
+    stream = io.StringIO()
+    streaming = click.HelpFormatter(width=40, stream=stream)
+    write(streaming)
+    assert stream.getvalue() == formatter.getvalue()
+    assert streaming.getvalue() == ""
+
+
+def test_help_formatter_stream_writes_rows():
+    class Stream(io.StringIO):
+        def __init__(self):
+            super().__init__()
+            self.writes = []
+
+        def write(self, value):
+            self.writes.append(value)
+            return super().write(value)
+
+    stream = Stream()
+    formatter = click.HelpFormatter(width=40, stream=stream)
+    formatter.write_dl([("-a", "Alpha."), ("-b", "Beta.")])
+    assert stream.writes == ["-a  Alpha.\n", "-b  Beta.\n"]
+
+
+def test_iter_help():
+    @click.command(epilog="Epilog.")
+    @click.option("--alpha", help="Alpha.")
+    def cli(alpha):
+        """Help text."""
+
+    ctx = click.Context(cli, info_name="cli")
+    chunks = list(cli.iter_help(ctx))
+    assert chunks[0] == "Usage: cli [OPTIONS]\n"
+    assert len(chunks) == 4
+    assert "".join(chunks) == f"{cli.get_help(ctx)}\n"
+    ctx = click.Context(cli, info_name="cli", help_cache={"cli": "Stored."})
+    assert list(ctx.iter_help()) == ["Stored.\n"]
+
+
+def test_iter_help_format_help_override():
+    class CustomCommand(click.Command):
+        def format_help(self, ctx, formatter):
+            formatter.write("Custom help.\n")
+
+    cli = CustomCommand("cli")
+    ctx = click.Context(cli, info_name="cli")
+    assert list(cli.iter_help(ctx)) == ["Custom help.\n"]
+
+
+def test_write_dl_wide_characters():
+    name = "\u540d\u524d"
+    formatter = click.HelpFormatter(width=40)
+    formatter.write_dl([(f"--{name}", name * 20), ("--x", "Help.")])
+    lines = formatter.getvalue().splitlines()
+    assert lines[0] == f"--{name}  {name * 7}\u540d"
+    assert lines[1] == f"        \u524d{name * 7}"
+    assert lines[-1] == "--x     Help."
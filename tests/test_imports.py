@@ -66,3 +66,56 @@ def test_light_imports():
         if module == "click" or module.startswith("click."):
             continue
         assert module in ALLOWED_IMPORTS
+
+
+def test_lazy_submodules():
+    code = (
+        "import sys, json, click;"
+        "print(json.dumps([m for m in sys.modules if m.startswith('click')]))"
+    )
+    rv = subprocess.check_output([sys.executable, "-c", code])
+    imported = json.loads(rv)
+
+    for module in (
+        "click.termui",
+        "click._termui_impl",
+        "click.shell_completion",
+        "click.testing",
+    ):
+        assert module not in imported
+
+
+def test_lazy_attribute():
+    code = "import sys, click; click.style; print('click.termui' in sys.modules)"
+    rv = subprocess.check_output([sys.executable, "-c", code])
+    assert rv.strip() == b"True"
+
+
+def test_lazy_attribute_call():
+    code = (
+        "import click;"
+        "print(repr(click.style('x', fg='red')), 'style' in vars(click),"
+        " 'Style' in dir(click))"
+    )
+    rv = subprocess.check_output([sys.executable, "-c", code])
+    assert rv.strip() == b"'\\x1b[31mx\\x1b[0m' True True"
+
+
+def test_no_heavy_imports():
+    code = "import sys, json, click; print(json.dumps(sorted(sys.modules)))"
+    rv = subprocess.check_output([sys.executable, "-c", code])
+    imported = set(json.loads(rv))
+
+    for module in (
+        "click.termui",
+        "click.shell_completion",
+        "gzip",
+        "bz2",
+        "lzma",
+        "zstandard",
+        "difflib",
+        "textwrap",
+        "asyncio",
+        "concurrent.futures",
+    ):
+        assert module not in imported
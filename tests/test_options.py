@@ -103,6 +103,65 @@ def test_suggest_possible_options(runner, value, expect):
     assert expect in result.output
 
 
+@pytest.mark.parametrize(
+    ("args", "expect"),
+    [
+        (["--verb"], "True None"),
+        (["--verb", "--col=red"], "True red"),
+        (["--colour", "red"], "False red"),
+        (["--colo", "red"], "False red"),
+    ],
+)
+def test_abbreviated_options(runner, args, expect):
+    @click.command(context_settings={"allow_abbreviated_options": True})
+    @click.option("--verbose", is_flag=True)
+    @click.option("--color", "--colour")
+    @click.option("--count", type=int)
+    def cli(verbose, color, count):
+        click.echo(f"{verbose} {color}")
+
+    result = runner.invoke(cli, args)
+    assert not result.exception
+    assert result.output == f"{expect}\n"
+
+
+def test_abbreviated_options_ambiguous(runner):
+    @click.command(context_settings={"allow_abbreviated_options": True})
+    @click.option("--color")
+    @click.option("--count")
+    def cli(color, count):
+        pass
+
+    result = runner.invoke(cli, ["--co", "1"])
+    assert result.exit_code == 2
+    assert "Option '--co' is ambiguous, it could be --color, --count." in result.output
+
+
+def test_abbreviated_options_disabled(runner):
+    @click.command()
+    @click.option("--verbose", is_flag=True)
+    def cli(verbose):
+        pass
+
+    result = runner.invoke(cli, ["--verb"])
+    assert result.exit_code == 2
+    assert "No such option: --verb Did you mean --verbose?" in result.output
+
+
+def test_abbreviated_options_inherited(runner):
+    @click.group(context_settings={"allow_abbreviated_options": True})
+    def cli():
+        pass
+
+    @cli.command()
+    @click.option("--name")
+    def sub(name):
+        click.echo(name)
+
+    result = runner.invoke(cli, ["sub", "--na", "x"])
+    assert result.output == "x\n"
+
+
 def test_multiple_required(runner):
     @click.command()
     @click.option("-m", "--message", multiple=True, required=True)
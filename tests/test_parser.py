@@ -1,6 +1,7 @@
 import pytest
 
 import click
+from click.parser import _OptionTrie
 from click.parser import OptionParser
 from click.parser import split_arg_string
 
@@ -30,3 +31,130 @@ def test_parser_collects_prefixes():
     click.Option("+p", is_flag=True).add_to_parser(parser, ctx)
     click.Option("!e", is_flag=True).add_to_parser(parser, ctx)
     assert parser._opt_prefixes == {"-", "--", "+", "!"}
+
+
+def test_parser_plan_reused():
+    cli = click.Command(
+        "cli", params=[click.Option(["-a", "--alpha"]), click.Argument(["b"])]
+    )
+    ctx = click.Context(cli)
+    first = cli.make_parser(ctx)
+    plan = cli._parser_plan
+    second = cli.make_parser(ctx)
+    assert cli._parser_plan is plan
+    assert second is not first
+    assert second._long_opt == first._long_opt
+    assert second._short_opt == first._short_opt
+    assert [a.obj for a in second._args] == [a.obj for a in first._args]
+    opts, args, order = second.parse_args(["-a", "1", "x"])
+    assert opts == {"alpha": "1", "b": "x"}
+
+
+def test_parser_plan_invalidated_by_params():
+    cli = click.Command("cli", params=[click.Option(["--alpha"])])
+    ctx = click.Context(cli)
+    cli.make_parser(ctx)
+    plan = cli._parser_plan
+    cli.params.append(click.Option(["--beta"]))
+    parser = cli.make_parser(ctx)
+    assert cli._parser_plan is not plan
+    assert "--beta" in parser._long_opt
+
+
+def test_parser_plan_keyed_on_normalize_func(runner):
+    @click.command()
+    @click.option("--Name", "name")
+    def sub(name):
+        click.echo(name)
+
+    plain = click.Group("plain", commands=[sub])
+    lower = click.Group(
+        "lower", commands=[sub], context_settings={"token_normalize_func": str.lower}
+    )
+    assert runner.invoke(plain, ["sub", "--Name", "a"]).output == "a\n"
+    assert runner.invoke(lower, ["sub", "--NAME", "b"]).output == "b\n"
+    assert runner.invoke(plain, ["sub", "--Name", "c"]).output == "c\n"
+
+
+def test_parser_plan_uses_get_params():
+    class CustomCommand(click.Command):
+        extra = []
+
+        def get_params(self, ctx):
+            return super().get_params(ctx) + self.extra
+
+    cli = CustomCommand("cli", params=[click.Option(["--alpha"])])
+    ctx = click.Context(cli)
+    cli.make_parser(ctx)
+    cli.extra = [click.Option(["--beta"])]
+    assert "--beta" in cli.make_parser(ctx)._long_opt
+
+
+def test_parser_plan_is_immutable():
+    parser = OptionParser()
+    parser.add_option(click.Option(["--a"]), ["--a"], "a")
+    plan = parser.compile()
+    derived = OptionParser.from_plan(plan)
+    derived.add_option(click.Option(["--b"]), ["--b"], "b")
+    assert "--b" not in plan.long_opt
+
+    with pytest.raises(TypeError):
+        plan.long_opt["--c"] = None
+
+
+def test_parser_plan_reused():
+    cli = click.Command(
+        "cli", params=[click.Option([f"--opt-{i}", f"-o{i}"]) for i in range(100)]
+    )
+    ctx = click.Context(cli)
+    cli.make_parser(ctx)
+    key, plan = cli._parser_plan
+    parser = cli.make_parser(ctx)
+    assert cli._parser_plan[0] is key
+    assert cli._parser_plan[1] is plan
+    assert parser._long_opt == plan.long_opt
+    assert parser._long_opt["--opt-0"] is plan.long_opt["--opt-0"]
+
+
+def test_option_trie_match_prefix():
+    a, b = object(), object()
+    trie = _OptionTrie({"--color": a, "--colour": a, "--count": b})
+    assert trie.match_prefix("--col") == [("--color", a), ("--colour", a)]
+    assert [name for name, _ in trie.match_prefix("--co")] == [
+        "--color",
+        "--colour",
+        "--count",
+    ]
+    assert trie.match_prefix("--x") == []
+    assert trie.match_prefix("--count") == [("--count", b)]
+
+
+def test_option_trie_close_matches():
+    options = {f"--option-{i}": object() for i in range(300)}
+    options.update({"--verbose": object(), "--version": object()})
+    trie = _OptionTrie(options)
+    assert trie.close_matches("--verbos") == ["--verbose", "--version"]
+    assert trie.close_matches("--option-1x")[0] == "--option-1"
+    assert len(trie.close_matches("--option-1x")) == 3
+    assert trie.close_matches("--xyz") == []
+
+
+def test_parser_plan_builds_trie_lazily():
+    parser = OptionParser()
+    parser.add_option(click.Option(["--alpha"]), ["--alpha"], "alpha")
+    plan = parser.compile()
+    OptionParser.from_plan(plan).parse_args(["--alpha", "a"])
+    assert plan._long_opt_trie is None
+    assert plan.long_opt_trie.match_prefix("--al")[0][0] == "--alpha"
+
+
+def test_option_trie_shared_by_plan():
+    ctx = click.Context(click.Command("test"))
+    parser = OptionParser(ctx)
+    click.Option(["--alpha"]).add_to_parser(parser, ctx)
+    plan = parser.compile()
+    other = OptionParser.from_plan(plan, ctx)
+    assert other._get_long_opt_trie() is plan.long_opt_trie
+    click.Option(["--beta"]).add_to_parser(other, ctx)
+    assert other._get_long_opt_trie() is not plan.long_opt_trie
+    assert plan.long_opt_trie.match_prefix("--b") == []
@@ -1,11 +1,15 @@
+import os
+
 import pytest
 
 import click.shell_completion
 from click.core import Argument
 from click.core import Command
 from click.core import Group
+from click.core import LazyGroup
 from click.core import Option
 from click.shell_completion import add_completion_class
+from click.shell_completion import CompletionCache
 from click.shell_completion import CompletionItem
 from click.shell_completion import ShellComplete
 from click.types import Choice
@@ -32,6 +36,17 @@ def test_command():
     assert _get_words(cli, ["-t", "a"], "-") == ["--help"]
 
 
+def test_lazy_group_completes_from_manifest():
+    cli = LazyGroup(
+        "cli",
+        lazy_subcommands={"init": "missing_module:cli", "info": "missing_module:x"},
+        help_manifest={"init": "Create a project.", "info": None},
+    )
+    out = _get_completions(cli, [], "in")
+    assert [c.value for c in out] == ["init"]
+    assert out[0].help == "Create a project."
+
+
 def test_group():
     cli = Group("cli", params=[Option(["-a"])], commands=[Command("x"), Command("y")])
     assert _get_words(cli, [], "") == ["x", "y"]
@@ -414,3 +429,177 @@ def test_add_completion_class_decorator():
     # Using `add_completion_class` as a decorator adds the new shell immediately
     assert "mysh" in click.shell_completion._available_shells
     assert click.shell_completion._available_shells["mysh"] is MyshComplete
+
+
+def _cache_cli():
+    return Group(
+        "cli",
+        commands=[
+            Command(
+                "run",
+                help="Run it.",
+                params=[
+                    Option(["--color"], type=Choice(["red", "green"])),
+                    Option(["--name"], shell_complete=lambda c, p, i: ["dyn"]),
+                    Argument(["src"], type=Path()),
+                ],
+            ),
+            Command("hidden", hidden=True),
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    ("env", "expect"),
+    [
+        ({"COMP_WORDS": "cli ", "COMP_CWORD": "1"}, "plain,run\n"),
+        ({"COMP_WORDS": "cli run --color g", "COMP_CWORD": "3"}, "plain,green\n"),
+        ({"COMP_WORDS": "cli run ", "COMP_CWORD": "2"}, "file,\n"),
+        (
+            {"COMP_WORDS": "cli run /tmp/x --color ", "COMP_CWORD": "4"},
+            "plain,red\nplain,green\n",
+        ),
+        ({"COMP_WORDS": "cli run - --c", "COMP_CWORD": "3"}, "plain,--color\n"),
+    ],
+)
+def test_completion_cache_answers_static(tmp_path, monkeypatch, capsys, env, expect):
+    cache = CompletionCache("cli", "1.0", path=str(tmp_path / "cache.json"))
+    monkeypatch.setenv("_CLI_COMPLETE", "bash_complete")
+    assert not cache.complete()
+    cache.update(_cache_cli())
+    assert cache.load() is not None
+
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+
+    assert cache.complete()
+    assert capsys.readouterr().out == expect
+
+
+def test_completion_cache_falls_back_for_dynamic(tmp_path, monkeypatch):
+    cache = CompletionCache("cli", "1.0", path=str(tmp_path / "cache.json"))
+    cache.store(_cache_cli())
+    monkeypatch.setenv("_CLI_COMPLETE", "bash_complete")
+    monkeypatch.setenv("COMP_WORDS", "cli run --name ")
+    monkeypatch.setenv("COMP_CWORD", "3")
+    assert not cache.complete()
+
+
+def test_completion_cache_option_prefixes(tmp_path, monkeypatch, capsys):
+    cli = Command(
+        "cli",
+        params=[
+            Option(["+w", "++width"], type=Choice(["1", "2"])),
+            Argument(["src"], type=Path()),
+        ],
+    )
+    cache = CompletionCache("cli", "1.0", path=str(tmp_path / "cache.json"))
+    cache.store(cli)
+    monkeypatch.setenv("_CLI_COMPLETE", "bash_complete")
+    monkeypatch.setenv("COMP_WORDS", "cli ./x +w ")
+    monkeypatch.setenv("COMP_CWORD", "3")
+    assert cache.complete()
+    assert capsys.readouterr().out == "plain,1\nplain,2\n"
+
+
+def test_completion_cache_store_removes_temp_file(tmp_path, monkeypatch):
+    import json
+
+    def dump(*args, **kwargs):
+        raise RuntimeError("fail")
+
+    monkeypatch.setattr(json, "dump", dump)
+    cache = CompletionCache("cli", "1.0", path=str(tmp_path / "cache.json"))
+
+    with pytest.raises(RuntimeError):
+        cache.store(_cache_cli())
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_completion_cache_invalidated_by_version(tmp_path):
+    path = str(tmp_path / "cache.json")
+    CompletionCache("cli", "1.0", path=path).store(_cache_cli())
+    assert CompletionCache("cli", "1.0", path=path).load() is not None
+    assert CompletionCache("cli", "2.0", path=path).load() is None
+
+
+def test_completion_cache_invalidated_by_source(tmp_path, monkeypatch):
+    (tmp_path / "cache_cli_module.py").write_text(
+        "import click\n\n@click.command()\ndef cli():\n    pass\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    from cache_cli_module import cli
+
+    cache = CompletionCache("cli", "1.0", path=str(tmp_path / "cache.json"))
+    cache.store(cli)
+    assert cache.load() is not None
+    os.utime(tmp_path / "cache_cli_module.py", ns=(0, 0))
+    assert cache.load() is None
+
+
+@pytest.mark.parametrize(
+    ("shell", "env", "expect"),
+    [
+        ("zsh", {"COMP_WORDS": "cli ", "COMP_CWORD": "1"}, "plain\nrun\nRun it.\n"),
+        ("fish", {"COMP_WORDS": "cli ", "COMP_CWORD": ""}, "plain,run\tRun it.\n"),
+    ],
+)
+def test_completion_cache_other_shells(
+    tmp_path, monkeypatch, capsys, shell, env, expect
+):
+    cache = CompletionCache("cli", "1.0", path=str(tmp_path / "cache.json"))
+    cache.store(_cache_cli())
+    monkeypatch.setenv("_CLI_COMPLETE", f"{shell}_complete")
+
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+
+    assert cache.complete()
+    assert capsys.readouterr().out == expect
+
+
+def test_completion_cache_update_only_when_completing(tmp_path, monkeypatch):
+    cache = CompletionCache("cli", "1.0", path=str(tmp_path / "cache.json"))
+    monkeypatch.delenv("_CLI_COMPLETE", raising=False)
+    cache.update(_cache_cli())
+    assert cache.load() is None
+
+
+@pytest.mark.parametrize(
+    ("shell", "dynamic"),
+    [
+        ("bash", '_cli_completion_dynamic "$1"'),
+        ("zsh", "            _cli_completion_dynamic\n"),
+        ("fish", "--arguments '(_cli_completion_dynamic)'"),
+    ],
+)
+def test_static_source(runner, shell, dynamic):
+    result = runner.invoke(
+        _cache_cli(), env={"_CLI_COMPLETE": f"{shell}_source_static"}
+    )
+    assert "_CLI_COMPLETE=" in result.output
+    assert "run" in result.output
+    assert "green" in result.output
+    # Only the option with custom completion calls back into the program.
+    assert result.output.count(dynamic) == 1
+
+
+@pytest.mark.parametrize("shell", ["bash", "zsh", "fish"])
+def test_static_source_fully_static(shell):
+    cli = Group("cli", commands=[Command("a"), Command("b", hidden=True)])
+    comp = click.shell_completion.get_completion_class(shell)(
+        cli, {}, "cli", "_CLI_COMPLETE"
+    )
+    out = comp.static_source()
+    # The fallback function is defined but never called.
+    assert out.count("_cli_completion_dynamic") == 1
+
+
+def test_static_source_unsupported():
+    class MyshComplete(ShellComplete):
+        name = "mysh"
+        source_template = "dummy source"
+
+    with pytest.raises(NotImplementedError):
+        MyshComplete(Command("cli"), {}, "cli", "_CLI_COMPLETE").static_source()
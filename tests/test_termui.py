@@ -1,9 +1,11 @@
+import os
 import platform
 import time
 
 import pytest
 
 import click._termui_impl
+from click._compat import term_len
 from click._compat import WIN
 
 
@@ -41,6 +43,23 @@ def test_progressbar_strip_regression(runner, monkeypatch):
     )
 
 
+def test_progressbar_wide_label(runner, monkeypatch):
+    label = "\u540d\u524d"
+
+    @click.command()
+    def cli():
+        with click.progressbar(range(10), label=label, width=0) as progress:
+            for _ in progress:
+                pass
+
+    monkeypatch.setattr(click._termui_impl, "isatty", lambda _: True)
+    monkeypatch.setattr("shutil.get_terminal_size", lambda: os.terminal_size((40, 24)))
+    output = runner.invoke(cli, [], standalone_mode=False).output
+    line = output.split("\r\x1b[?25l")[-1].split("\x1b[?25h")[0]
+    assert line.startswith(label)
+    assert term_len(line) == 40
+
+
 def test_progressbar_length_hint(runner, monkeypatch):
     class Hinted:
         def __init__(self, n):
@@ -1,6 +1,9 @@
+import copy
 import os.path
 import pathlib
+import pickle
 import tempfile
+from datetime import datetime
 
 import pytest
 
@@ -50,6 +53,133 @@ def test_range_fail(type, value, expect):
     assert expect in exc_info.value.message
 
 
+@pytest.mark.parametrize(
+    ("case_sensitive", "normalize", "value", "expect"),
+    [
+        (True, None, "Apple", "Apple"),
+        (False, None, "APPLE", "Apple"),
+        (True, str.lower, "APPLE", "Apple"),
+        (False, lambda v: v.replace("_", "-"), "RED_APPLE", "red-apple"),
+    ],
+)
+def test_choice_index(case_sensitive, normalize, value, expect):
+    choice = click.Choice(["Apple", "red-apple"], case_sensitive=case_sensitive)
+    ctx = click.Context(click.Command("test"), token_normalize_func=normalize)
+    assert choice.convert(value, None, ctx) == expect
+    # A second conversion uses the cached index.
+    assert choice.convert(value, None, ctx) == expect
+
+
+def test_choice_index_reset():
+    choice = click.Choice(["a", "b"])
+    assert choice.convert("a", None, None) == "a"
+    choice.choices = ["c"]
+
+    with pytest.raises(click.BadParameter, match="'a' is not 'c'"):
+        choice.convert("a", None, None)
+
+    assert choice.convert("c", None, None) == "c"
+
+
+def test_choice_complete_large():
+    choices = [f"region-{i:04}" for i in range(5000)]
+    choice = click.Choice(list(reversed(choices)), case_sensitive=False)
+    ctx = click.Context(click.Command("test"))
+    param = click.Option(["--region"], type=choice)
+    items = choice.shell_complete(ctx, param, "REGION-001")
+    assert [item.value for item in items] == [
+        f"region-{i:04}" for i in range(19, 9, -1)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("type", "values", "expect"),
+    [
+        (click.INT, ["1", 2, "-3"], (1, 2, -3)),
+        (click.INT, ["1", None], (1, None)),
+        (click.FLOAT, ["1.5", 2], (1.5, 2.0)),
+        (click.IntRange(0, 5), ["0", "5"], (0, 5)),
+        (click.IntRange(0, 5, clamp=True), ["9", "-3", "2"], (5, 0, 2)),
+        (click.FloatRange(0, 1), ["0.5", "1"], (0.5, 1.0)),
+        (click.BOOL, [" Yes", "off", True, "1"], (True, False, True, True)),
+        (click.INT, [], ()),
+    ],
+)
+def test_convert_many(type, values, expect):
+    assert type.convert_many(iter(values), None, None) == expect
+
+
+def test_convert_many_uuid():
+    import uuid
+
+    value = uuid.uuid4()
+    result = click.UUID.convert_many([f" {value} ", value], None, None)
+    assert result == (value, value)
+
+
+@pytest.mark.parametrize(
+    ("type", "values", "expect"),
+    [
+        (click.INT, ["1", "a", "b"], "'a' is not a valid integer."),
+        (click.IntRange(0, 5), ["1", "6", "-1"], "6 is not in the range 0<=x<=5."),
+        (click.FloatRange(0, 1), ["nan", "-5"], "-5.0 is not in the range"),
+        (click.BOOL, ["y", "maybe"], "'maybe' is not a valid boolean."),
+        (click.UUID, ["zz"], "'zz' is not a valid UUID."),
+    ],
+)
+def test_convert_many_fail(type, values, expect):
+    with pytest.raises(click.BadParameter) as exc_info:
+        type.convert_many(values, None, None)
+
+    assert expect in exc_info.value.message
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2020-01-02",
+        "2020-1-2",
+        "2020-01-02T03:04:05",
+        "2020-01-02 03:04:05",
+    ],
+)
+def test_datetime_iso_fast_path(value):
+    expect = None
+
+    for format in ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"):
+        try:
+            expect = datetime.strptime(value, format)
+            break
+        except ValueError:
+            pass
+
+    assert click.DateTime().convert(value, None, None) == expect
+
+
+@pytest.mark.parametrize(
+    "value", ["2020-02-30", "2020-W01-1", "2020-01-02T24:00:00", "20200102"]
+)
+def test_datetime_iso_fast_path_invalid(value):
+    with pytest.raises(click.BadParameter, match="does not match the formats"):
+        click.DateTime().convert(value, None, None)
+
+
+def test_datetime_formats_reset():
+    type = click.DateTime(["%d/%m/%Y"])
+    assert type.convert("02/01/2020", None, None) == datetime(2020, 1, 2)
+    type.formats = ["%m/%d/%Y"]
+    assert type.convert("02/01/2020", None, None) == datetime(2020, 2, 1)
+
+
+def test_datetime_copy_has_own_formats():
+    type = click.DateTime(["%d/%m/%Y"])
+    assert type.convert("02/01/2020", None, None) == datetime(2020, 1, 2)
+    copied = copy.deepcopy(type)
+    copied.formats[0] = "%m/%d/%Y"
+    assert copied.convert("02/01/2020", None, None) == datetime(2020, 2, 1)
+    assert type.convert("02/01/2020", None, None) == datetime(2020, 1, 2)
+
+
 def test_float_range_no_clamp_open():
     with pytest.raises(TypeError):
         click.FloatRange(0, 1, max_open=True, clamp=True)
@@ -232,3 +362,93 @@ def test_file_surrogates(type, tmp_path):
 def test_file_error_surrogates():
     message = FileError(filename="\udcff").format_message()
     assert message == "Could not open file '�': unknown error"
+
+
+def test_path_stat_cache(tmp_path, monkeypatch):
+    path = tmp_path / "a.txt"
+    path.write_text("")
+    missing = tmp_path / "b.txt"
+    calls = []
+    real_stat = os.stat
+
+    def stat(path, *args, **kwargs):
+        calls.append(path)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", stat)
+    monkeypatch.chdir(tmp_path)
+    ctx = click.Context(click.Command("test"))
+    param = click.Argument(["p"], nargs=-1, type=click.Path())
+    values = [str(path), "a.txt", str(missing), "b.txt"]
+    assert param.type_cast_value(ctx, values) == tuple(values)
+    # The relative and absolute names share a check, missing paths don't.
+    assert calls == [str(path), str(missing), "b.txt"]
+    # The cache is discarded once the parameter is processed.
+    assert click.Path().convert(str(path), None, ctx) == str(path)
+    assert len(calls) == 4
+    assert ctx.meta == {}
+
+
+def test_path_max_workers(tmp_path):
+    (tmp_path / "a.txt").write_text("")
+    type = click.Path(exists=True, max_workers=4)
+    values = [str(tmp_path / name) for name in ("a.txt", "b.txt", "c.txt")]
+    assert type.convert_many(values[:1], None, None) == (values[0],)
+
+    with pytest.raises(click.BadParameter) as exc_info:
+        type.convert_many(values, None, None)
+
+    message = exc_info.value.message
+    assert "'a.txt'" not in message
+    assert "b.txt' does not exist." in message
+    assert "c.txt' does not exist." in message
+
+
+def test_mapped_file(runner, tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"hello world")
+    views = []
+
+    @click.command()
+    @click.argument("data", type=click.MappedFile())
+    def cli(data):
+        views.append(data)
+        click.echo(bytes(data[6:]))
+
+    result = runner.invoke(cli, [str(path)])
+    assert result.stdout_bytes == b"world\n"
+    assert views[0].readonly
+
+    with pytest.raises(ValueError):
+        bytes(views[0])
+
+    result = runner.invoke(cli, ["-"], input=b"from stdin")
+    assert result.stdout_bytes == b"stdin\n"
+
+
+def test_mapped_file_empty(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    assert click.MappedFile().convert(str(path), None, None) == b""
+
+
+def test_mapped_file_close_with_exported_view():
+    from click.types import _close_mapping
+
+    class Mapping:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    view = memoryview(b"data")
+    buffer = pickle.PickleBuffer(view)
+    mapping = Mapping()
+    _close_mapping(view, mapping)
+    assert mapping.closed
+    buffer.release()
+
+
+def test_mapped_file_missing(tmp_path):
+    with pytest.raises(click.BadParameter, match="No such file or directory"):
+        click.MappedFile().convert(str(tmp_path / "missing"), None, None)
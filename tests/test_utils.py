@@ -2,7 +2,9 @@ import os
 import pathlib
 import stat
 import sys
+from io import BytesIO
 from io import StringIO
+from unittest import mock
 
 import pytest
 
@@ -94,9 +96,21 @@ def test_echo_no_streams(monkeypatch, runner):
 )
 def test_styling(styles, ref):
     assert click.style("x y", **styles) == ref
+    assert click.Style(**styles)("x y") == ref
     assert click.unstyle(ref) == "x y"
 
 
+def test_style_object():
+    error = click.Style(fg="red", bold=True)
+    assert error.prefix == "\x1b[31m\x1b[1m"
+    assert error(42) == "\x1b[31m\x1b[1m42\x1b[0m"
+    assert error("a") == click.style("a", fg="red", bold=True)
+    assert click.style("a", fg=[1, 2, 3]) == click.style("a", fg=(1, 2, 3))
+
+    with pytest.raises(TypeError, match="Unknown color"):
+        click.Style(fg="nope")
+
+
 @pytest.mark.parametrize(("text", "expect"), [("\x1b[?25lx y\x1b[?25h", "x y")])
 def test_unstyle_other_ansi(text, expect):
     assert click.unstyle(text) == expect
@@ -418,6 +432,173 @@ def test_open_file_atomic_permissions_new_file(runner):
         assert stat.S_IMODE(os.stat("new.txt").st_mode) == permissions
 
 
+@pytest.mark.parametrize("lazy", [True, False])
+def test_open_file_buffer_size(tmp_path, lazy):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"data")
+
+    with click.open_file(str(path), "rb", lazy=lazy, buffer_size=1 << 16) as f:
+        assert f.read() == b"data"
+
+
+def test_get_binary_stream_buffer_size():
+    r, w = os.pipe()
+
+    with open(w, "wb", closefd=False) as sys_stdout:
+        with mock.patch.dict(
+            click.utils.binary_streams, {"stdout": lambda: sys_stdout}
+        ):
+            stream = click.get_binary_stream("stdout", buffer_size=1 << 16)
+
+        assert stream is not sys_stdout
+        stream.write(b"data")
+        stream.close()
+        assert not sys_stdout.closed
+
+    os.close(w)
+
+    with open(r, "rb") as f:
+        assert f.read() == b"data"
+
+
+def test_copy_stream(tmp_path):
+    data = os.urandom(300_000)
+    src = tmp_path / "src.bin"
+    src.write_bytes(data)
+    dst = tmp_path / "dst.bin"
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        assert fsrc.read(10) == data[:10]
+        fdst.write(b"head")
+        assert click.copy_stream(fsrc, fdst) == len(data) - 10
+        assert fsrc.read() == b""
+        assert fdst.tell() == len(data) - 6
+
+    assert dst.read_bytes() == b"head" + data[10:]
+
+
+def test_copy_stream_file_like():
+    src = BytesIO(b"a" * 1000)
+    dst = BytesIO()
+    assert click.copy_stream(src, dst, buffer_size=64) == 1000
+    assert dst.getvalue() == b"a" * 1000
+
+
+@pytest.mark.parametrize("fsync", ["none", "file", "dir"])
+def test_open_file_atomic_fsync(tmp_path, fsync):
+    path = tmp_path / "out.txt"
+    path.write_text("old")
+
+    with click.open_file(str(path), "w", atomic=True, fsync=fsync) as f:
+        f.write("new")
+        assert path.read_text() == "old"
+
+    assert path.read_text() == "new"
+    assert os.listdir(tmp_path) == ["out.txt"]
+
+
+def test_open_file_atomic_invalid_fsync(tmp_path):
+    with pytest.raises(ValueError, match="fsync"):
+        click.open_file(str(tmp_path / "out.txt"), "w", atomic=True, fsync="yes")
+
+
+def test_open_file_atomic_preallocate(tmp_path):
+    path = tmp_path / "out.bin"
+
+    with click.open_file(str(path), "wb", atomic=True, preallocate=1 << 16) as f:
+        f.write(b"data")
+
+    assert path.read_bytes() == b"data"
+
+
+def test_open_file_atomic_error(tmp_path):
+    path = tmp_path / "out.txt"
+    path.write_text("old")
+
+    with pytest.raises(RuntimeError):
+        with click.open_file(str(path), "w", atomic=True) as f:
+            f.write("new")
+            raise RuntimeError()
+
+    assert path.read_text() == "old"
+    assert os.listdir(tmp_path) == ["out.txt"]
+
+
+def test_open_file_atomic_link_fails(tmp_path, monkeypatch):
+    path = tmp_path / "out.txt"
+    path.write_text("old")
+
+    def link(*args, **kwargs):
+        raise PermissionError()
+
+    monkeypatch.setattr(os, "link", link)
+
+    with click.open_file(str(path), "w", atomic=True) as f:
+        f.write("new")
+
+    assert path.read_text() == "new"
+    assert os.listdir(tmp_path) == ["out.txt"]
+
+
+def test_open_file_atomic_replace_fails(tmp_path, monkeypatch):
+    path = tmp_path / "out.txt"
+    path.write_text("old")
+
+    def replace(*args, **kwargs):
+        raise OSError()
+
+    monkeypatch.setattr(os, "replace", replace)
+
+    with pytest.raises(OSError):
+        with click.open_file(str(path), "w", atomic=True) as f:
+            f.write("new")
+            f.close()
+
+    assert f.closed
+    assert path.read_text() == "old"
+    assert os.listdir(tmp_path) == ["out.txt"]
+
+
+@pytest.mark.parametrize(
+    ("name", "compression", "module"),
+    [
+        ("data.gz", "gzip", "gzip"),
+        ("data.bz2", "bz2", "bz2"),
+        ("data.xz", "xz", "lzma"),
+    ],
+)
+@pytest.mark.parametrize("atomic", [True, False])
+def test_open_file_compression(tmp_path, name, compression, module, atomic):
+    module = __import__(module)
+    path = tmp_path / name
+
+    with click.open_file(str(path), "w", atomic=atomic, compression="auto") as f:
+        f.write("hello\n")
+
+    assert module.decompress(path.read_bytes()) == b"hello\n"
+    plain = tmp_path / "data"
+    path.rename(plain)
+
+    with click.open_file(str(plain), "rb", compression=compression) as f:
+        assert f.read() == b"hello\n"
+
+    with click.open_file(str(plain), compression="auto") as f:
+        assert f.read() == "hello\n"
+
+
+def test_open_file_compression_auto_plain(tmp_path):
+    path = tmp_path / "data.gz"
+    path.write_text("not compressed")
+
+    with click.open_file(str(path), compression="auto") as f:
+        assert f.read() == "not compressed"
+
+
+def test_open_file_compression_invalid(tmp_path):
+    with pytest.raises(ValueError, match="Unknown compression"):
+        click.open_file(str(tmp_path / "data"), "w", compression="lz4")
+
+
 def test_iter_keepopenfile(tmpdir):
     expected = list(map(str, range(10)))
     p = tmpdir.mkdir("testdir").join("testfile")
@@ -471,6 +652,50 @@ def test_expand_args(monkeypatch):
     assert click.utils._expand_args(["test.py::test_bad"])[0] == "test.py::test_bad"
 
 
+def test_expand_response_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "a.txt").write_text("x 'y z'\n@b.txt\n")
+    (tmp_path / "b.txt").write_text("1\n2")
+    result = click.utils._expand_response_files(["-v", "@a.txt", "@", "end"])
+    assert list(result) == ["-v", "x", "y z", "1", "2", "@", "end"]
+
+
+def test_expand_response_files_cycle(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "a.txt").write_text("1 @b.txt")
+    (tmp_path / "b.txt").write_text("2 @a.txt")
+
+    with pytest.raises(click.FileError, match="includes itself"):
+        list(click.utils._expand_response_files(["@a.txt"]))
+
+
+def test_expand_response_files_missing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(click.FileError) as exc_info:
+        list(click.utils._expand_response_files(["@missing.txt"]))
+
+    assert exc_info.value.filename == "missing.txt"
+
+
+def test_expand_response_files_nested_relative(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "a.txt").write_text("1 @b.txt")
+    (tmp_path / "sub" / "b.txt").write_text("2")
+    (tmp_path / "b.txt").write_text("wrong")
+    result = click.utils._expand_response_files([f"@{os.path.join('sub', 'a.txt')}"])
+    assert list(result) == ["1", "2"]
+
+
+def test_expand_response_files_unterminated_quote(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "a.txt").write_text("1 'two")
+
+    with pytest.raises(click.FileError, match="No closing quotation"):
+        list(click.utils._expand_response_files(["@a.txt"]))
+
+
 @pytest.mark.parametrize(
     ("value", "max_length", "expect"),
     [